@@ -0,0 +1 @@
+"""Micro-benchmark suite for strategies, parser and formatter."""
@@ -0,0 +1,126 @@
+"""Command line runner for the benchmark suite.
+
+Usage:
+    python -m benchmarks --output results.json
+    python -m benchmarks --update-baseline
+    python -m benchmarks --tolerance 0.1 --sizes 10 100 1000
+    python -m benchmarks --ci
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+
+from benchmarks import suite as _suite
+from benchmarks import workloads as _workloads
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+NO_BASELINE_EXIT = 2
+"""Exit code of a --ci run that finds no baseline to compare against."""
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """Run the suite, store results and compare them against the baseline.
+
+    Returns:
+        Process exit code: 1 if any measurement regressed, 2 if --ci is set
+        and there is no baseline, otherwise 0.
+    """
+    options = _build_parser().parse_args(arguments)
+    measurements = []
+    for measurement in _suite.run_suite(
+        sizes=options.sizes,
+        distributions=options.distributions,
+        targets=options.targets,
+        max_pairs=options.max_pairs,
+        min_time=options.min_time,
+        seed=options.seed,
+    ):
+        measurements.append(measurement)
+        print(
+            f"{measurement.key:<48} {measurement.ops_per_sec:>14.2f} ops/s "
+            f"{measurement.peak_memory_bytes:>14,d} B peak",
+            file=sys.stderr,
+        )
+
+    document = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        **_suite.to_json(measurements),
+    }
+    if options.output:
+        options.output.write_text(json.dumps(document, indent=2) + "\n")
+    if options.update_baseline:
+        options.baseline.write_text(json.dumps(document, indent=2) + "\n")
+        return 0
+    if not options.baseline.exists():
+        if options.ci:
+            print(f"NO BASELINE at {options.baseline}", file=sys.stderr)
+            return NO_BASELINE_EXIT
+        print(
+            f"No baseline at {options.baseline}; skipping comparison.", file=sys.stderr
+        )
+        return 0
+
+    baseline = _suite.from_json(json.loads(options.baseline.read_text()))
+    regressions = _suite.find_regressions(measurements, baseline, options.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression.describe()}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the benchmark command line parser."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(_suite.DEFAULT_SIZES)
+    )
+    parser.add_argument(
+        "--distributions",
+        nargs="+",
+        choices=tuple(_workloads.DISTRIBUTIONS),
+        default=list(_workloads.DISTRIBUTIONS),
+    )
+    parser.add_argument(
+        "--targets",
+        nargs="+",
+        default=None,
+        help="substrings selecting targets, e.g. 'strategy:index' or 'parser'",
+    )
+    parser.add_argument(
+        "--max-pairs",
+        type=int,
+        default=_suite.DEFAULT_MAX_PAIRS,
+        help="skip quadratic targets above this pair count (default: %(default)s)",
+    )
+    parser.add_argument("--min-time", type=float, default=0.2, metavar="SECONDS")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, metavar="JSON")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.15,
+        help="allowed relative regression (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store this run as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--ci",
+        action="store_true",
+        help=f"fail with exit code {NO_BASELINE_EXIT} instead of skipping the "
+        "comparison when the baseline is missing",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    sys.exit(main())
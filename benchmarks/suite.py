@@ -0,0 +1,194 @@
+"""Benchmark targets, measurement and baseline comparison."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import asdict, dataclass
+
+from benchmarks import workloads as _workloads
+from email_task.core import registry as _registry
+from email_task.features.find_pairs import formatter as _formatter
+from email_task.features.find_pairs import parser as _parser
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000, 100_000)
+DEFAULT_MAX_PAIRS = 2_000_000
+"""Quadratic targets skip sizes whose n(n-1)/2 pair count exceeds this."""
+
+
+@dataclass(frozen=True, slots=True)
+class Measurement:
+    """Throughput and peak memory of one target on one workload."""
+
+    target: str
+    distribution: str
+    size: int
+    ops_per_sec: float
+    peak_memory_bytes: int
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used to match runs against the baseline."""
+        return f"{self.target}/{self.distribution}/{self.size}"
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    """A measurement that fell outside the baseline tolerance."""
+
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    def describe(self) -> str:
+        """Render the regression as a single report line."""
+        change = (self.current - self.baseline) / self.baseline if self.baseline else 0
+        return (
+            f"{self.key}: {self.metric} {self.baseline:.6g} -> "
+            f"{self.current:.6g} ({change:+.1%})"
+        )
+
+
+def measure(operation: Callable[[], object], min_time: float) -> tuple[float, int]:
+    """Time an operation and record its peak traced allocation.
+
+    The peak is taken from a separate tracemalloc run so tracing overhead does
+    not distort the timing loop.
+
+    Args:
+        operation: Zero-argument callable under test.
+        min_time: Minimum wall time in seconds to keep repeating the operation.
+
+    Returns:
+        Tuple of operations per second and peak allocated bytes.
+    """
+    tracemalloc.start()
+    try:
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    runs = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < min_time or runs == 0:
+        operation()
+        runs += 1
+    return runs / elapsed, peak
+
+
+def run_suite(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    distributions: Sequence[str] = tuple(_workloads.DISTRIBUTIONS),
+    targets: Sequence[str] | None = None,
+    max_pairs: int = DEFAULT_MAX_PAIRS,
+    min_time: float = 0.2,
+    seed: int = 0,
+) -> Iterator[Measurement]:
+    """Run every selected target over every size and distribution.
+
+    Args:
+        sizes: Input sizes to benchmark.
+        distributions: Names of input distributions to benchmark.
+        targets: Substrings selecting targets, or None for all of them.
+        max_pairs: Pair-count cap for quadratic targets.
+        min_time: Minimum timing duration per measurement in seconds.
+        seed: Seed for the workload generator.
+
+    Yields:
+        One Measurement per target, distribution and size.
+    """
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for distribution in distributions:
+            for size in sizes:
+                numbers = _workloads.generate(distribution, size, seed)
+                for target, operation in _operations(numbers, max_pairs):
+                    if targets is None or any(name in target for name in targets):
+                        ops_per_sec, peak = measure(operation, min_time)
+                        yield Measurement(target, distribution, size, ops_per_sec, peak)
+
+
+def _operations(
+    numbers: tuple[int, ...], max_pairs: int
+) -> Iterator[tuple[str, Callable[[], object]]]:
+    """Yield named benchmark operations applicable to numbers."""
+    tokens = [str(number) for number in numbers]
+    yield "parser", lambda: _parser.parse_integer_tokens(tokens)
+
+    if len(numbers) * (len(numbers) - 1) // 2 > max_pairs:
+        return
+
+    for name in _registry.STRATEGIES.names():
+        strategy = _registry.STRATEGIES.create(name)
+        yield (
+            f"strategy:{name}",
+            lambda strategy=strategy: strategy.collect_sum_pairs(numbers),
+        )
+
+    groups = _registry.STRATEGIES.create(_registry.DEFAULT_STRATEGY).collect_sum_pairs(
+        numbers
+    )
+    formatter = _formatter.ConsoleFormatter()
+    yield "formatter", lambda: formatter.write_pairs_result(groups)
+
+
+def find_regressions(
+    current: Sequence[Measurement],
+    baseline: Mapping[str, Measurement],
+    tolerance: float,
+) -> list[Regression]:
+    """Compare measurements against the baseline.
+
+    A measurement regresses when its throughput drops below, or its peak
+    memory rises above, the baseline value by more than tolerance.
+
+    Args:
+        current: Measurements from this run.
+        baseline: Stored measurements keyed by Measurement.key.
+        tolerance: Allowed relative deviation, e.g. 0.15 for 15%.
+
+    Returns:
+        Regressions found; measurements absent from the baseline are ignored.
+    """
+    regressions: list[Regression] = []
+    for measurement in current:
+        match baseline.get(measurement.key):
+            case None:
+                continue
+            case reference:
+                if measurement.ops_per_sec < reference.ops_per_sec * (1 - tolerance):
+                    regressions.append(
+                        Regression(
+                            measurement.key,
+                            "ops_per_sec",
+                            reference.ops_per_sec,
+                            measurement.ops_per_sec,
+                        )
+                    )
+                if measurement.peak_memory_bytes > reference.peak_memory_bytes * (
+                    1 + tolerance
+                ):
+                    regressions.append(
+                        Regression(
+                            measurement.key,
+                            "peak_memory_bytes",
+                            reference.peak_memory_bytes,
+                            measurement.peak_memory_bytes,
+                        )
+                    )
+    return regressions
+
+
+def to_json(measurements: Sequence[Measurement]) -> dict[str, object]:
+    """Serialize measurements into the stored results format."""
+    return {"measurements": [asdict(measurement) for measurement in measurements]}
+
+
+def from_json(document: Mapping[str, object]) -> dict[str, Measurement]:
+    """Load measurements from the stored results format, keyed by Measurement.key."""
+    measurements = (Measurement(**entry) for entry in document["measurements"])
+    return {measurement.key: measurement for measurement in measurements}
@@ -0,0 +1,54 @@
+"""Seeded input distributions for benchmark runs."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+
+type Generator = Callable[[random.Random, int], tuple[int, ...]]
+
+
+def uniform(rng: random.Random, size: int) -> tuple[int, ...]:
+    """Values spread uniformly over a range much wider than the size."""
+    return tuple(rng.randrange(0, 100 * size + 100) for _ in range(size))
+
+
+def duplicate_heavy(rng: random.Random, size: int) -> tuple[int, ...]:
+    """Values drawn from a pool of roughly sqrt(size) distinct numbers."""
+    pool = [rng.randrange(0, 10 * size + 10) for _ in range(max(2, int(size**0.5)))]
+    return tuple(rng.choice(pool) for _ in range(size))
+
+
+def narrow_range(rng: random.Random, size: int) -> tuple[int, ...]:
+    """Sensor-style values confined to 0..1000."""
+    return tuple(rng.randrange(0, 1001) for _ in range(size))
+
+
+def negative_values(rng: random.Random, size: int) -> tuple[int, ...]:
+    """Values centred on zero, half of them negative."""
+    span = 50 * size + 50
+    return tuple(rng.randrange(-span, span) for _ in range(size))
+
+
+DISTRIBUTIONS: dict[str, Generator] = {
+    "uniform": uniform,
+    "duplicate-heavy": duplicate_heavy,
+    "narrow-range": narrow_range,
+    "negative": negative_values,
+}
+"""Benchmark input distributions by name."""
+
+
+def generate(distribution: str, size: int, seed: int = 0) -> tuple[int, ...]:
+    """Generate a reproducible input array.
+
+    Args:
+        distribution: Name of a registered distribution.
+        size: Number of elements.
+        seed: Random seed, combined with distribution and size.
+
+    Returns:
+        Tuple of generated integers.
+    """
+    rng = random.Random(f"{seed}:{distribution}:{size}")
+    return DISTRIBUTIONS[distribution](rng, size)
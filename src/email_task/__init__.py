@@ -2,13 +2,85 @@
 
 from __future__ import annotations
 
-from email_task.features.find_pairs.handler import FindPairsHandler
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from email_task.features.find_pairs.api import (
+        PairFinder,
+        build_sum_index,
+        build_sum_index_file,
+        count_cross_pairs,
+        find_cross_pairs,
+        find_pairs,
+        find_pairs_page,
+        find_sum_tuples,
+        find_sum_witness,
+        iter_find_pairs,
+        open_sum_index_file,
+    )
+    from email_task.features.find_pairs.async_handler import AsyncFindPairsHandler
+    from email_task.features.find_pairs.handler import FindPairsHandler
+    from email_task.shared.profiling import Profiler
+
+_LAZY_EXPORTS = {
+    "AsyncFindPairsHandler": "email_task.features.find_pairs.async_handler",
+    "FindPairsHandler": "email_task.features.find_pairs.handler",
+    "PairFinder": "email_task.features.find_pairs.api",
+    "Profiler": "email_task.shared.profiling",
+    "build_sum_index": "email_task.features.find_pairs.api",
+    "build_sum_index_file": "email_task.features.find_pairs.api",
+    "count_cross_pairs": "email_task.features.find_pairs.api",
+    "find_cross_pairs": "email_task.features.find_pairs.api",
+    "find_pairs": "email_task.features.find_pairs.api",
+    "find_pairs_page": "email_task.features.find_pairs.api",
+    "find_sum_tuples": "email_task.features.find_pairs.api",
+    "find_sum_witness": "email_task.features.find_pairs.api",
+    "iter_find_pairs": "email_task.features.find_pairs.api",
+    "open_sum_index_file": "email_task.features.find_pairs.api",
+}
+"""Public names imported from their feature module on first access."""
 
 
 def main() -> None:
     """Main application entry point."""
-    handler = FindPairsHandler()
-    handler.execute()
+    from email_task import cli
+
+    cli.run(sys.argv[1:])
+
+
+def bench() -> None:
+    """Load-test harness entry point."""
+    from email_task import cli
+
+    cli.run_bench(sys.argv[1:])
+
+
+def __getattr__(name: str) -> object:
+    """Resolve public exports lazily to keep CLI startup cheap."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
 
 
-__all__ = ["main", "FindPairsHandler"]
+__all__ = [
+    "AsyncFindPairsHandler",
+    "FindPairsHandler",
+    "PairFinder",
+    "Profiler",
+    "bench",
+    "build_sum_index",
+    "build_sum_index_file",
+    "count_cross_pairs",
+    "find_cross_pairs",
+    "find_pairs",
+    "find_pairs_page",
+    "find_sum_tuples",
+    "find_sum_witness",
+    "iter_find_pairs",
+    "main",
+    "open_sum_index_file",
+]
@@ -0,0 +1,6 @@
+"""Module execution entry point."""
+
+from email_task import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1116 @@
+"""Command line dispatch for the email task application.
+
+Feature modules are imported inside the command functions so that ``--help``
+and argument errors never pay for strategies, formatters or process pools.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import sys
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING
+
+from email_task.core import registry as _registry
+
+if TYPE_CHECKING:
+    from email_task.core.types import MetricsSink, PairFindingStrategy
+    from email_task.features.bench.workload import WorkloadSpec
+    from email_task.features.find_pairs.planner import ExecutionPlan
+    from email_task.shared.metrics import RecordingMetricsSink
+
+
+_DEFAULT_MIN_PAIRS = 2
+_DEFAULT_SKETCH_WIDTH = 2048
+_DEFAULT_SKETCH_DEPTH = 4
+_DEFAULT_WORKER_MAX_VALUES = 1 << 24
+
+
+def run(arguments: Sequence[str]) -> None:
+    """Dispatch command line arguments to the matching feature handler.
+
+    Args:
+        arguments: Command line arguments without the program name.
+    """
+    match arguments:
+        case ["batch", *rest]:
+            _run_batch(rest)
+        case ["worker", *rest]:
+            _run_worker(rest)
+        case ["coordinate", *rest]:
+            _run_coordinator(rest)
+        case ["index", *rest]:
+            _run_index(rest)
+        case _:
+            _run_find_pairs(arguments)
+
+
+def run_bench(arguments: Sequence[str]) -> None:
+    """Dispatch email-task-bench arguments to workload generation or load runs.
+
+    Args:
+        arguments: Command line arguments without the program name.
+    """
+    options = _build_bench_parser().parse_args(arguments)
+    match options.command:
+        case "generate":
+            _run_bench_generate(options)
+        case "run":
+            _run_bench_load(options)
+
+
+def _run_find_pairs(arguments: Sequence[str]) -> None:
+    """Run the find pairs feature from its command line arguments."""
+    argument_parser = _build_find_pairs_parser()
+    options = argument_parser.parse_intermixed_args(arguments)
+    if options.explain and options.strategy != "auto":
+        argument_parser.error("--explain requires --strategy auto")
+    if options.max_memory is not None and options.strategy not in {"auto", "bounded"}:
+        argument_parser.error("--max-memory requires --strategy auto or bounded")
+    if options.strategy != "heavy" and _heavy_options_given(options):
+        argument_parser.error(
+            "--min-pairs, --sketch-width, --sketch-depth and --estimate require "
+            "--strategy heavy"
+        )
+    if options.deadline is not None and (
+        options.strategy != "auto"
+        or options.max_memory is not None
+        or options.explain
+        or _has_mode(options)
+    ):
+        argument_parser.error(
+            "--deadline only bounds the default pair listing; drop --strategy, "
+            "--max-memory, --explain and other modes"
+        )
+    if options.top is not None and (
+        options.strategy != "auto"
+        or options.deadline is not None
+        or options.max_memory is not None
+        or options.explain
+        or _has_mode(options)
+    ):
+        argument_parser.error(
+            "--top replaces the default pair listing; drop --strategy, "
+            "--deadline, --max-memory, --explain and other modes"
+        )
+    if options.resume and options.checkpoint is None:
+        argument_parser.error("--resume requires --checkpoint")
+    if options.checkpoint is not None and (
+        options.strategy != "auto"
+        or options.deadline is not None
+        or options.top is not None
+        or options.max_memory is not None
+        or options.explain
+        or _has_mode(options)
+    ):
+        argument_parser.error(
+            "--checkpoint only applies to the default pair listing; drop "
+            "--strategy, --deadline, --top, --max-memory, --explain and other modes"
+        )
+    if options.progress is not None and _has_mode(options):
+        argument_parser.error("--progress only follows the default pair listing")
+    if options.estimate:
+        if options.input is not None or options.exists or options.explain:
+            argument_parser.error(
+                "--estimate cannot be combined with --input, --exists or --explain"
+            )
+        _run_heavy_estimate(options)
+        return
+    if options.profile is not None and (options.exists or options.input is not None):
+        argument_parser.error("--profile cannot be combined with --exists or --input")
+    if options.exists:
+        if options.input is not None or options.explain:
+            argument_parser.error(
+                "--exists cannot be combined with --input or --explain"
+            )
+        _run_exists(options)
+        return
+    if options.count_only and options.cross is None:
+        argument_parser.error("--count-only requires --cross")
+    if options.cross is not None:
+        if options.numbers or options.input is not None or options.tuple_size:
+            argument_parser.error(
+                "--cross reads both arrays from files; drop N, --input and --tuple-size"
+            )
+        _run_cross_pairs(options)
+        return
+    if options.tuple_size is not None:
+        if options.input is not None or options.exists or options.explain:
+            argument_parser.error(
+                "--tuple-size cannot be combined with --input, --exists or --explain"
+            )
+        _run_find_tuples(options)
+        return
+    if options.window is not None and options.input is None:
+        argument_parser.error("--window requires --input")
+    if options.input is not None:
+        if options.numbers:
+            argument_parser.error("--input cannot be combined with N arguments")
+        if options.explain or options.max_memory is not None:
+            argument_parser.error(
+                "--input streams through the incremental index; "
+                "--explain and --max-memory do not apply"
+            )
+        _run_streamed_find_pairs(options)
+        return
+
+    from email_task.features.find_pairs import handler as _handler
+    from email_task.features.find_pairs import parser as _parser
+    from email_task.shared import memory as _memory
+    from email_task.shared import metrics as _metrics
+
+    profiling = options.profile is not None
+    sink = _metrics.RecordingMetricsSink() if options.stats or profiling else None
+    metrics = _with_progress(options, sink)
+    handler = _handler.FindPairsHandler(
+        parser=_parser.CommandLineParser(["email-task", *options.numbers]),
+        strategy=_create_strategy(options, metrics),
+        writer=_registry.WRITERS.create(options.writer),
+        metrics=metrics,
+    )
+    baseline_rss = _memory.current_rss_bytes()
+    with _profiled(options, sink):
+        handler.execute()
+    if options.stats and sink is not None:
+        sink.dump_json(sys.stderr)
+    if options.max_memory is not None:
+        _warn_if_over_budget(options.max_memory, baseline_rss)
+
+
+@contextlib.contextmanager
+def _profiled(
+    options: argparse.Namespace, sink: RecordingMetricsSink | None
+) -> Iterator[None]:
+    """Profile the enclosed run when --profile is given, tagging the reports."""
+    if options.profile is None:
+        yield
+        return
+
+    from email_task.shared import profiling as _profiling
+
+    with _profiling.Profiler(options.profile, options.profile_output) as profiler:
+        profiler.tag(strategy=options.strategy)
+        yield
+        if sink is not None:
+            profiler.tag(input_size=sink.counters.get("input_size", 0))
+    written = ", ".join(str(path) for path in profiler.written)
+    print(f"Profile written to {written}", file=sys.stderr)
+
+
+def _run_cross_pairs(options: argparse.Namespace) -> None:
+    """List or count equal-sum pairs taking one element from each file."""
+    from email_task.features.find_pairs import handler as _handler
+    from email_task.features.find_pairs import parser as _parser
+    from email_task.shared import metrics as _metrics
+
+    left_path, right_path = options.cross
+    sink = _metrics.RecordingMetricsSink() if options.stats else None
+    _handler.CrossPairsHandler(
+        left_parser=_parser.TextFileParser(left_path, minimum=1),
+        right_parser=_parser.TextFileParser(right_path, minimum=1),
+        count_only=options.count_only,
+        metrics=sink,
+    ).execute()
+    if sink is not None:
+        sink.dump_json(sys.stderr)
+
+
+def _run_find_tuples(options: argparse.Namespace) -> None:
+    """List groups of k-tuples sharing a sum."""
+    from email_task.features.find_pairs import handler as _handler
+    from email_task.features.find_pairs import parser as _parser
+    from email_task.shared import metrics as _metrics
+
+    sink = _metrics.RecordingMetricsSink() if options.stats else None
+    _handler.FindTuplesHandler(
+        options.tuple_size,
+        parser=_parser.CommandLineParser(["email-task", *options.numbers]),
+        metrics=sink,
+    ).execute()
+    if sink is not None:
+        sink.dump_json(sys.stderr)
+
+
+def _run_heavy_estimate(options: argparse.Namespace) -> None:
+    """Report likely heavy sums with bounds, skipping exact verification."""
+    from email_task.features.find_pairs import handler as _handler
+    from email_task.features.find_pairs import parser as _parser
+    from email_task.features.find_pairs import sketch as _sketch
+    from email_task.shared import metrics as _metrics
+
+    sink = _metrics.RecordingMetricsSink() if options.stats else None
+    _handler.HeavySumEstimateHandler(
+        parser=_parser.CommandLineParser(["email-task", *options.numbers]),
+        strategy=_sketch.HeavySumStrategy(**_strategy_options(options, sink)),
+        metrics=sink,
+    ).execute()
+    if sink is not None:
+        sink.dump_json(sys.stderr)
+
+
+def _run_exists(options: argparse.Namespace) -> None:
+    """Answer whether any sum is shared, with a one-line witness."""
+    from email_task.features.find_pairs import handler as _handler
+    from email_task.features.find_pairs import parser as _parser
+    from email_task.shared import metrics as _metrics
+
+    sink = _metrics.RecordingMetricsSink() if options.stats else None
+    _handler.ExistsHandler(
+        parser=_parser.CommandLineParser(["email-task", *options.numbers]),
+        metrics=sink,
+    ).execute()
+    if sink is not None:
+        sink.dump_json(sys.stderr)
+
+
+def _run_streamed_find_pairs(options: argparse.Namespace) -> None:
+    """Run the overlapped asyncio pipeline over an input file or stdin."""
+    import asyncio
+
+    from email_task.features.find_pairs import async_handler as _async_handler
+    from email_task.features.find_pairs import async_io as _async_io
+    from email_task.shared import metrics as _metrics
+
+    sink = _metrics.RecordingMetricsSink() if options.stats else None
+    match options.input_format:
+        case "int64":
+            reader = _async_io.AsyncInt64Reader(options.input)
+        case _:
+            reader = _async_io.AsyncTextReader(options.input)
+    writer = _async_io.AsyncConsoleWriter()
+    match options.window:
+        case None:
+            handler = _async_handler.AsyncFindPairsHandler(
+                reader=reader, writer=writer, metrics=sink
+            )
+        case window:
+            handler = _async_handler.AsyncSlidingWindowHandler(
+                reader=reader, writer=writer, window=window, metrics=sink
+            )
+    asyncio.run(handler.execute())
+    if sink is not None:
+        sink.dump_json(sys.stderr)
+
+
+def _create_strategy(
+    options: argparse.Namespace, sink: MetricsSink | None
+) -> PairFindingStrategy:
+    """Create the selected strategy, or the one a listing option such as --top needs."""
+    if options.top is not None:
+        from email_task.features.find_pairs import strategies as _strategies
+
+        return _strategies.TopSumsStrategy(options.top, sink)
+    if options.deadline is not None:
+        from email_task.features.find_pairs import strategies as _strategies
+
+        return _strategies.DeadlineBoundedStrategy(options.deadline / 1000, sink)
+    if options.checkpoint is not None:
+        from email_task.features.find_pairs import checkpoint as _checkpoint
+
+        return _checkpoint.CheckpointingStrategy(
+            options.checkpoint,
+            interval=options.checkpoint_interval,
+            resume=options.resume,
+            metrics=sink,
+        )
+    return _registry.STRATEGIES.create(
+        options.strategy, **_strategy_options(options, sink)
+    )
+
+
+def _with_progress(
+    options: argparse.Namespace, sink: MetricsSink | None
+) -> MetricsSink | None:
+    """Wrap sink in a progress reporter when --progress is given."""
+    if options.progress is None:
+        return sink
+
+    from email_task.shared import progress as _progress
+
+    return _progress.ProgressReporter(options.progress, inner=sink)
+
+
+def _has_mode(options: argparse.Namespace) -> bool:
+    """Return whether an option replacing the default pair listing is given."""
+    return (
+        options.exists
+        or options.estimate
+        or options.cross is not None
+        or options.tuple_size is not None
+        or options.input is not None
+    )
+
+
+def _strategy_options(
+    options: argparse.Namespace, sink: MetricsSink | None
+) -> dict[str, object]:
+    """Collect keyword arguments for the selected strategy."""
+    strategy_options: dict[str, object] = {"metrics": sink}
+    if options.explain:
+        strategy_options["on_plan"] = _print_plan
+    if options.max_memory is not None:
+        strategy_options["memory_budget"] = options.max_memory
+    if options.strategy == "heavy":
+        strategy_options["min_pairs"] = options.min_pairs
+        strategy_options["width"] = options.sketch_width
+        strategy_options["depth"] = options.sketch_depth
+    return strategy_options
+
+
+def _heavy_options_given(options: argparse.Namespace) -> bool:
+    """Return whether any option of the heavy strategy differs from its default."""
+    return (
+        options.estimate
+        or options.min_pairs != _DEFAULT_MIN_PAIRS
+        or options.sketch_width != _DEFAULT_SKETCH_WIDTH
+        or options.sketch_depth != _DEFAULT_SKETCH_DEPTH
+    )
+
+
+def _warn_if_over_budget(memory_budget: int, baseline_rss: int | None) -> None:
+    """Report on stderr when peak RSS grew past the budget during the run.
+
+    The interpreter's own footprint before the run is not charged to the budget.
+    """
+    from email_task.shared import memory as _memory
+
+    peak = _memory.peak_rss_bytes()
+    if peak is None or baseline_rss is None:
+        return
+    if (growth := peak - baseline_rss) > memory_budget:
+        print(
+            f"Warning: peak RSS grew by {growth}B, over --max-memory {memory_budget}B",
+            file=sys.stderr,
+        )
+
+
+def _positive_int(text: str) -> int:
+    """Convert an option value to an integer of at least 1."""
+    if not text.isdigit() or int(text) < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer: {text!r}")
+    return int(text)
+
+
+def _positive_seconds(text: str) -> float:
+    """Convert an option value to a positive number of seconds."""
+    try:
+        seconds = float(text)
+    except ValueError:
+        seconds = 0.0
+    if not seconds > 0:
+        raise argparse.ArgumentTypeError(f"expected positive seconds: {text!r}")
+    return seconds
+
+
+def _memory_size(text: str) -> int:
+    """Convert a --max-memory value such as "512M" to bytes."""
+    from email_task.shared import memory as _memory
+
+    match _memory.parse_size(text):
+        case None:
+            raise argparse.ArgumentTypeError(f"invalid size: {text!r}")
+        case size:
+            return size
+
+
+def _print_plan(plan: ExecutionPlan) -> None:
+    """Print the planner's chosen plan and cost estimate to stderr."""
+    print(plan.describe(), file=sys.stderr)
+
+
+def _run_batch(arguments: Sequence[str]) -> None:
+    """Run the batch feature from its command line arguments."""
+    argument_parser = _build_batch_parser()
+    options = argument_parser.parse_args(arguments)
+
+    from email_task.features.batch import handler as _batch_handler
+    from email_task.features.batch import reader as _batch_reader
+    from email_task.features.find_pairs import planner as _planner
+
+    parallel_engines = set(_planner.ENGINE_ESTIMATORS) - set(
+        _planner.IN_PROCESS_ENGINES
+    )
+    if options.strategy in parallel_engines:
+        argument_parser.error(
+            "batch records already run in worker processes; "
+            f"--strategy {options.strategy} would nest another pool"
+        )
+    _batch_handler.BatchHandler(
+        reader=_batch_reader.BatchFileReader(options.input),
+        strategy=None
+        if options.strategy == _registry.DEFAULT_STRATEGY
+        else _registry.STRATEGIES.create(options.strategy),
+        writer=_registry.WRITERS.create(options.writer),
+        workers=options.workers,
+        max_in_flight=options.max_in_flight,
+    ).execute()
+
+
+def _run_worker(arguments: Sequence[str]) -> None:
+    """Serve shard requests until interrupted."""
+    options = _build_worker_parser().parse_args(arguments)
+
+    import asyncio
+
+    from email_task.features.cluster import worker as _worker
+
+    async def serve() -> None:
+        server = await _worker.ClusterWorker(
+            options.host, options.port, options.max_values
+        ).start()
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"Listening on {host}:{port}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve())
+
+
+def _run_coordinator(arguments: Sequence[str]) -> None:
+    """Split one array across cluster workers and print the merged groups."""
+    argument_parser = _build_coordinator_parser()
+    options = argument_parser.parse_intermixed_args(arguments)
+    if (options.input is None) == (not options.numbers):
+        argument_parser.error("provide either N arguments or --input")
+
+    import asyncio
+
+    from email_task.features.cluster import coordinator as _coordinator
+    from email_task.features.find_pairs import async_io as _async_io
+    from email_task.shared import metrics as _metrics
+
+    sink = _metrics.RecordingMetricsSink() if options.stats else None
+    match options.input:
+        case None:
+            reader = _async_io.AsyncTokenReader(options.numbers)
+        case path:
+            reader = _async_io.AsyncTextReader(path)
+    coordinator = _coordinator.ClusterCoordinator(
+        reader=reader,
+        writer=_async_io.AsyncConsoleWriter(),
+        workers=options.worker,
+        metrics=sink,
+        timeout=options.timeout,
+    )
+    asyncio.run(coordinator.execute())
+    if sink is not None:
+        sink.dump_json(sys.stderr)
+
+
+def _run_index(arguments: Sequence[str]) -> None:
+    """Build a persisted sum index or answer lookups from one."""
+    argument_parser = _build_index_parser()
+    options = argument_parser.parse_args(arguments)
+    match options.command:
+        case "build":
+            if (options.input is None) == (not options.numbers):
+                argument_parser.error("provide either N arguments or --input")
+            _run_index_build(options)
+        case "query":
+            _run_index_query(options)
+
+
+def _run_index_build(options: argparse.Namespace) -> None:
+    """Group the array by sum once and write the memory-mappable index file."""
+    from email_task.features.find_pairs import index_file as _index_file
+    from email_task.features.find_pairs import parser as _parser
+    from email_task.shared import metrics as _metrics
+    from email_task.shared import result as _result
+
+    sink = _metrics.RecordingMetricsSink() if options.stats else None
+    match options.input:
+        case None:
+            reader = _parser.CommandLineParser(["email-task", *options.numbers])
+        case path:
+            reader = _parser.TextFileParser(path)
+    match _result.bind(
+        reader.parse_integer_sequence(),
+        lambda array: _index_file.write_sum_index(options.index, array, sink),
+    ):
+        case _result.Error(message, _):
+            print(f"Error: {message}")
+        case header:
+            print(
+                f"Indexed {header.groups} sums with {header.pairs} pairs "
+                f"into {options.index}"
+            )
+    if sink is not None:
+        sink.dump_json(sys.stderr)
+
+
+def _run_index_query(options: argparse.Namespace) -> None:
+    """Print the groups of one sum or a sum range read from an index file."""
+    from email_task.features.find_pairs import formatter as _formatter
+    from email_task.features.find_pairs import index_file as _index_file
+    from email_task.shared import result as _result
+
+    writer = _formatter.ConsoleFormatter()
+    match _index_file.open_sum_index(options.index):
+        case _result.Error() as error:
+            writer.write_sum_groups(error)
+        case index:
+            with index:
+                if options.sum is not None:
+                    group = index.lookup(options.sum)
+                    writer.write_sum_groups(() if group is None else (group,))
+                else:
+                    writer.write_sum_groups(index.iter_range(*options.range))
+
+
+def _run_bench_generate(options: argparse.Namespace) -> None:
+    """Write one generated workload to a file or stdout."""
+    from email_task.features.bench import workload as _workload
+
+    data = _workload.encode_workload(
+        _workload.generate_workload(_workload_spec(options)), options.format
+    )
+    if options.output == "-":
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+    else:
+        with open(options.output, "wb") as output:
+            output.write(data)
+
+
+def _run_bench_load(options: argparse.Namespace) -> None:
+    """Load-test the email-task command once per input mode and save JSON."""
+    import dataclasses
+    import json
+    import platform
+    import shlex
+
+    from email_task.features.bench import load as _load
+    from email_task.features.bench import workload as _workload
+
+    spec = _workload_spec(options)
+    values = _workload.generate_workload(spec)
+    command = shlex.split(options.target) if options.target else _load.DEFAULT_COMMAND
+    reports = []
+    for mode in options.mode:
+        report = _load.run_load(
+            values,
+            mode=mode,
+            input_format=options.format,
+            concurrency=options.concurrency,
+            requests=options.requests,
+            command=command,
+            extra_arguments=shlex.split(options.extra),
+        )
+        reports.append(dataclasses.asdict(report))
+        print(
+            f"{mode:<6} p50 {report.latency_p50_seconds * 1000:9.1f} ms  "
+            f"p99 {report.latency_p99_seconds * 1000:9.1f} ms  "
+            f"{report.requests_per_second:8.2f} req/s  "
+            f"{report.output_bytes_per_second / 1024:10.1f} KiB/s out  "
+            f"{report.failures} failed",
+            file=sys.stderr,
+        )
+
+    document = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "command": [*command, *shlex.split(options.extra)],
+        "workload": dataclasses.asdict(spec),
+        "reports": reports,
+    }
+    text = json.dumps(document, indent=2) + "\n"
+    if options.output == "-":
+        sys.stdout.write(text)
+    else:
+        with open(options.output, "w", encoding="utf-8") as output:
+            output.write(text)
+
+
+def _workload_spec(options: argparse.Namespace) -> WorkloadSpec:
+    """Build the workload spec from the shared generator options."""
+    from email_task.features.bench import workload as _workload
+
+    return _workload.WorkloadSpec(
+        size=options.size,
+        max_value=options.max_value,
+        duplicate_ratio=options.duplicates,
+        negative_ratio=options.negatives,
+        seed=options.seed,
+    )
+
+
+def _ratio(text: str) -> float:
+    """Convert an option value to a fraction between 0 and 1."""
+    try:
+        value = float(text)
+    except ValueError:
+        value = -1.0
+    if not 0 <= value <= 1:
+        raise argparse.ArgumentTypeError(f"expected a ratio from 0 to 1: {text!r}")
+    return value
+
+
+def _worker_address(text: str) -> tuple[str, int]:
+    """Convert a --worker value such as "127.0.0.1:7000" to (host, port)."""
+    host, _, port = text.rpartition(":")
+    if not host or not port.isdigit():
+        raise argparse.ArgumentTypeError(f"invalid worker address: {text!r}")
+    return host, int(port)
+
+
+def _build_find_pairs_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the default find pairs command."""
+    parser = argparse.ArgumentParser(
+        prog="email-task",
+        description="Find all pairs of array elements that share the same sum.",
+        epilog=(
+            "Use 'email-task batch --help' to process many arrays per run, "
+            "'email-task worker' / 'email-task coordinate' to spread one array "
+            "over TCP workers, and 'email-task index --help' to persist groups "
+            "for repeated lookups."
+        ),
+    )
+    parser.add_argument(
+        "numbers", nargs="*", metavar="N", help="array elements (integers)"
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="dump per-stage timings and counters to stderr as JSON",
+    )
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="print the planner's chosen engine and estimated cost to stderr",
+    )
+    parser.add_argument(
+        "--exists",
+        action="store_true",
+        help=(
+            "only report whether two pairs share a sum, with one witness; stops "
+            "at the first collision"
+        ),
+    )
+    parser.add_argument(
+        "--cross",
+        nargs=2,
+        metavar=("A_FILE", "B_FILE"),
+        default=None,
+        help=(
+            "pair every element of A_FILE with every element of B_FILE (never "
+            "within one file) and group the pairs by sum"
+        ),
+    )
+    parser.add_argument(
+        "--count-only",
+        action="store_true",
+        help="with --cross, print the number of pairs per shared sum instead",
+    )
+    parser.add_argument(
+        "--tuple-size",
+        type=_positive_int,
+        default=None,
+        metavar="K",
+        help=(
+            "list groups of K-element tuples (K=3 triples, K=4 quadruples) that "
+            "share a sum instead of pairs"
+        ),
+    )
+    parser.add_argument(
+        "--input",
+        metavar="FILE",
+        default=None,
+        help=(
+            'read one large array from FILE, or "-" for stdin, overlapping '
+            "reading, indexing and writing"
+        ),
+    )
+    parser.add_argument(
+        "--input-format",
+        choices=("text", "int64"),
+        default="text",
+        help=(
+            "--input encoding: whitespace/comma separated text or raw "
+            "native-endian int64 (default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "--window",
+        type=_positive_int,
+        default=None,
+        metavar="W",
+        help=(
+            "with --input, treat the input as an unbounded stream and report each "
+            "group of pairs at most W indices apart as soon as it forms"
+        ),
+    )
+    parser.add_argument(
+        "--min-pairs",
+        type=_positive_int,
+        default=_DEFAULT_MIN_PAIRS,
+        metavar="K",
+        help=(
+            "with --strategy heavy, only report sums shared by at least K pairs "
+            "(default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "--sketch-width",
+        type=_positive_int,
+        default=_DEFAULT_SKETCH_WIDTH,
+        metavar="W",
+        help=(
+            "count-min sketch counters per row; over-counts by at most e/W of "
+            "all pairs (default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "--sketch-depth",
+        type=_positive_int,
+        default=_DEFAULT_SKETCH_DEPTH,
+        metavar="D",
+        help=(
+            "count-min sketch rows; the bound fails with probability exp(-D) "
+            "(default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "--estimate",
+        action="store_true",
+        help=(
+            "with --strategy heavy, print estimated pair counts with bounds "
+            "instead of verifying the candidates exactly"
+        ),
+    )
+    parser.add_argument(
+        "--deadline",
+        type=_positive_int,
+        default=None,
+        metavar="MS",
+        help=(
+            "stop enumerating after MS milliseconds and print the groups already "
+            "complete, then the last outer index processed"
+        ),
+    )
+    parser.add_argument(
+        "--top",
+        type=_positive_int,
+        default=None,
+        metavar="K",
+        help=(
+            "print only the K sums shared by the most pairs, largest group first; "
+            "pairs are kept for those sums only"
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint",
+        metavar="FILE",
+        default=None,
+        help=(
+            "periodically save the enumeration state to FILE (written atomically, "
+            "removed on completion)"
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=_positive_seconds,
+        default=60.0,
+        metavar="SECONDS",
+        help="minimum time between two checkpoint writes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "with --checkpoint, continue from FILE when it exists; output equals "
+            "an uninterrupted run"
+        ),
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=_memory_size,
+        default=None,
+        metavar="SIZE",
+        help=(
+            "peak memory budget for pair finding, e.g. 512M; over-budget inputs "
+            "switch to count-first bounded execution or fail before any work"
+        ),
+    )
+    parser.add_argument(
+        "--progress",
+        choices=("line", "json"),
+        default=None,
+        help=(
+            "report pairs enumerated, pairs/s, RSS and ETA on stderr as a "
+            "self-updating line or JSON events"
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        choices=("cprofile", "tracemalloc"),
+        default=None,
+        help=(
+            "profile the run and write .pstats/.collapsed/.txt reports tagged "
+            "with the strategy and input size"
+        ),
+    )
+    parser.add_argument(
+        "--profile-output",
+        default="email-task-profile",
+        metavar="PREFIX",
+        help="path prefix of the --profile reports (default: %(default)s)",
+    )
+    _add_component_arguments(parser)
+    return parser
+
+
+def _build_batch_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the batch command."""
+    parser = argparse.ArgumentParser(
+        prog="email-task batch",
+        description="Find equal-sum pairs for one array per input line.",
+    )
+    parser.add_argument(
+        "--input",
+        required=True,
+        metavar="FILE",
+        help='input file with one array per line, or "-" for stdin',
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: usable CPUs)",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=None,
+        metavar="N",
+        help="maximum records submitted but not yet written (default: 2x workers)",
+    )
+    _add_component_arguments(parser)
+    return parser
+
+
+def _build_worker_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the cluster worker command."""
+    parser = argparse.ArgumentParser(
+        prog="email-task worker",
+        description="Serve sum-residue shards to an email-task coordinator.",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="interface to bind (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=0, help="TCP port to bind; 0 picks a free one"
+    )
+    parser.add_argument(
+        "--max-values",
+        type=int,
+        default=_DEFAULT_WORKER_MAX_VALUES,
+        metavar="N",
+        help="largest array accepted per request (default: %(default)s)",
+    )
+    return parser
+
+
+def _build_coordinator_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the cluster coordinator command."""
+    parser = argparse.ArgumentParser(
+        prog="email-task coordinate",
+        description=(
+            "Find equal-sum pairs across workers, each owning the sums congruent "
+            "to its position modulo the worker count."
+        ),
+    )
+    parser.add_argument(
+        "numbers", nargs="*", metavar="N", help="array elements (integers)"
+    )
+    parser.add_argument(
+        "--worker",
+        type=_worker_address,
+        action="append",
+        required=True,
+        metavar="HOST:PORT",
+        help="address of a running 'email-task worker'; repeat once per worker",
+    )
+    parser.add_argument(
+        "--input",
+        metavar="FILE",
+        default=None,
+        help='read the array from text FILE, or "-" for stdin',
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="time allowed per worker round trip (default: no limit)",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="dump per-stage timings and counters to stderr as JSON",
+    )
+    return parser
+
+
+def _build_index_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the persisted sum index commands."""
+    parser = argparse.ArgumentParser(
+        prog="email-task index",
+        description=(
+            "Persist the equal-sum groups of one array in a memory-mapped file "
+            "and look sums up without recomputing pairs."
+        ),
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="compute the groups once and save them")
+    build.add_argument("index", metavar="INDEX", help="index file to write")
+    build.add_argument(
+        "numbers", nargs="*", metavar="N", help="array elements (integers)"
+    )
+    build.add_argument(
+        "--input",
+        metavar="FILE",
+        default=None,
+        help='read the array from text FILE, or "-" for stdin',
+    )
+    build.add_argument(
+        "--stats",
+        action="store_true",
+        help="dump per-stage timings and counters to stderr as JSON",
+    )
+
+    query = commands.add_parser(
+        "query", help="print the groups of a sum or sum range by binary search"
+    )
+    query.add_argument("index", metavar="INDEX", help="index file to read")
+    selection = query.add_mutually_exclusive_group(required=True)
+    selection.add_argument(
+        "--sum", type=int, default=None, metavar="S", help="print the group of S"
+    )
+    selection.add_argument(
+        "--range",
+        type=int,
+        nargs=2,
+        default=None,
+        metavar=("LOW", "HIGH"),
+        help="print the groups with LOW <= sum <= HIGH, in sum order",
+    )
+    return parser
+
+
+def _build_bench_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the email-task-bench tool."""
+    parser = argparse.ArgumentParser(
+        prog="email-task-bench",
+        description=(
+            "Generate seeded input arrays and load-test the email-task command "
+            "end to end."
+        ),
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    generate = commands.add_parser(
+        "generate", help="write one generated array as text or int64"
+    )
+    _add_workload_arguments(generate)
+    generate.add_argument(
+        "--output",
+        default="-",
+        metavar="FILE",
+        help='destination file, or "-" for stdout (default: %(default)s)',
+    )
+
+    load = commands.add_parser(
+        "run", help="run email-task concurrently and report latency and throughput"
+    )
+    _add_workload_arguments(load)
+    load.add_argument(
+        "--mode",
+        nargs="+",
+        choices=("argv", "stdin", "file"),
+        default=["argv", "stdin", "file"],
+        help="input paths to exercise, one report each (default: all)",
+    )
+    load.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=1,
+        help="runs in flight at once (default: %(default)s)",
+    )
+    load.add_argument(
+        "--requests",
+        type=_positive_int,
+        default=10,
+        help="runs per mode (default: %(default)s)",
+    )
+    load.add_argument(
+        "--target",
+        default=None,
+        metavar="COMMAND",
+        help="command under test (default: this interpreter's 'python -m email_task')",
+    )
+    load.add_argument(
+        "--extra",
+        default="",
+        metavar="ARGS",
+        help='options appended to every run, e.g. "--strategy hash"',
+    )
+    load.add_argument(
+        "--output",
+        default="-",
+        metavar="FILE",
+        help='JSON results file, or "-" for stdout (default: %(default)s)',
+    )
+    return parser
+
+
+def _add_workload_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options describing a generated array."""
+    parser.add_argument(
+        "--size", type=_positive_int, default=1000, help="elements (default: 1000)"
+    )
+    parser.add_argument(
+        "--max-value",
+        type=int,
+        default=1_000_000,
+        help="largest value magnitude (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--duplicates",
+        type=_ratio,
+        default=0.0,
+        metavar="RATIO",
+        help="share of elements repeating an earlier one (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--negatives",
+        type=_ratio,
+        default=0.0,
+        metavar="RATIO",
+        help="share of drawn values that are negative (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="random seed (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "int64"),
+        default="text",
+        help="encoding of generated input files and stdin (default: %(default)s)",
+    )
+
+
+def _add_component_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add registry-backed component selection options."""
+    parser.add_argument(
+        "--strategy",
+        choices=_registry.STRATEGIES.names(),
+        default=_registry.DEFAULT_STRATEGY,
+        help="pair finding strategy (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--writer",
+        choices=_registry.WRITERS.names(),
+        default=_registry.DEFAULT_WRITER,
+        help="output writer (default: %(default)s)",
+    )
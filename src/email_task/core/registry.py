@@ -0,0 +1,104 @@
+"""Name-based registries resolving pipeline components on first use.
+
+Components are registered as ``"module:attribute"`` import paths, so listing
+or validating names never imports the implementation modules. Only the
+component that is actually selected gets imported.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from email_task.core.types import InputReader, OutputWriter, PairFindingStrategy
+
+
+class ComponentRegistry[T]:
+    """Registry mapping component names to lazily imported factories."""
+
+    def __init__(self, kind: str, targets: dict[str, str]) -> None:
+        """Initialize with the component kind and name-to-import-path mapping.
+
+        Args:
+            kind: Human-readable component kind used in lookup errors.
+            targets: Mapping of component name to ``"module:attribute"``.
+        """
+        self._kind = kind
+        self._targets = dict(targets)
+        self._loaded: dict[str, Callable[..., T]] = {}
+
+    def register(self, name: str, target: str) -> None:
+        """Register or replace a component import path.
+
+        Args:
+            name: Name used to select the component.
+            target: Import path in ``"module:attribute"`` form.
+        """
+        self._targets[name] = target
+        self._loaded.pop(name, None)
+
+    def names(self) -> tuple[str, ...]:
+        """Return registered component names without importing anything."""
+        return tuple(self._targets)
+
+    def load(self, name: str) -> Callable[..., T]:
+        """Import and return the factory registered under name.
+
+        Args:
+            name: Registered component name.
+
+        Returns:
+            The component class or factory callable.
+
+        Raises:
+            KeyError: If no component is registered under name.
+        """
+        if name not in self._loaded:
+            if name not in self._targets:
+                raise KeyError(f"unknown {self._kind} {name!r}")
+            module_name, _, attribute = self._targets[name].partition(":")
+            self._loaded[name] = getattr(import_module(module_name), attribute)
+        return self._loaded[name]
+
+    def create(self, name: str, /, **kwargs: object) -> T:
+        """Instantiate the component registered under name.
+
+        Args:
+            name: Registered component name.
+            **kwargs: Keyword arguments forwarded to the component factory.
+
+        Returns:
+            A new component instance.
+        """
+        return self.load(name)(**kwargs)
+
+
+DEFAULT_READER = "argv"
+DEFAULT_STRATEGY = "auto"
+DEFAULT_WRITER = "console"
+
+READERS: ComponentRegistry[InputReader] = ComponentRegistry(
+    "reader",
+    {"argv": "email_task.features.find_pairs.parser:CommandLineParser"},
+)
+STRATEGIES: ComponentRegistry[PairFindingStrategy] = ComponentRegistry(
+    "strategy",
+    {
+        "auto": "email_task.features.find_pairs.planner:StrategyPlanner",
+        "index": "email_task.features.find_pairs.strategies:IndexBasedStrategy",
+        "hash": "email_task.features.find_pairs.strategies:HashGroupingStrategy",
+        "dense": "email_task.features.find_pairs.strategies:DenseBucketStrategy",
+        "bounded": "email_task.features.find_pairs.strategies:BoundedMemoryStrategy",
+        "threads": "email_task.features.find_pairs.strategies:ParallelHashStrategy",
+        "processes": (
+            "email_task.features.find_pairs.strategies:create_process_pool_strategy"
+        ),
+        "heavy": "email_task.features.find_pairs.sketch:HeavySumStrategy",
+    },
+)
+WRITERS: ComponentRegistry[OutputWriter] = ComponentRegistry(
+    "writer",
+    {"console": "email_task.features.find_pairs.formatter:ConsoleFormatter"},
+)
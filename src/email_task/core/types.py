@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-from typing import Protocol
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from typing import Protocol, runtime_checkable
 
 from email_task.shared import domain as _domain
 from email_task.shared import result as _result
@@ -35,6 +42,134 @@ class OutputWriter(Protocol):
         ...
 
 
+@runtime_checkable
+class StreamingOutputWriter(Protocol):
+    """Protocol for writers that emit sum groups as they are produced."""
+
+    def write_sum_groups(
+        self, result: _result.Result[Iterable[_domain.SumGroup]]
+    ) -> None:
+        """Write sum groups one by one while the iterable is consumed.
+
+        Args:
+            result: Result containing an iterable of SumGroups or error.
+        """
+        ...
+
+
+class CrossPairsWriter(StreamingOutputWriter, Protocol):
+    """Protocol for writers of cross-array groups and per-sum pair counts."""
+
+    def write_sum_counts(self, result: _result.Result[Mapping[int, int]]) -> None:
+        """Write the number of pairs per sum, in sum order.
+
+        Args:
+            result: Result containing pair counts keyed by sum, or error.
+        """
+        ...
+
+
+class AsyncInputReader(Protocol):
+    """Protocol for reading a large integer array chunk by chunk without blocking."""
+
+    def iter_integer_chunks(self) -> AsyncIterator[_result.Result[Sequence[int]]]:
+        """Read consecutive chunks of the array as they become available.
+
+        Returns:
+            Async iterator of chunk Results; an error ends the input.
+        """
+        ...
+
+
+class AsyncOutputWriter(Protocol):
+    """Protocol for writing sum groups without blocking the event loop."""
+
+    async def write_sum_groups(
+        self, result: _result.Result[AsyncIterable[_domain.SumGroup]]
+    ) -> None:
+        """Write sum groups while later ones are still being produced.
+
+        Args:
+            result: Result containing an async iterable of SumGroups or error.
+        """
+        ...
+
+
+class AsyncEventWriter(Protocol):
+    """Protocol for writing sum group events of an unbounded stream."""
+
+    async def write_sum_group_events(
+        self,
+        batches: AsyncIterable[_result.Result[Sequence[_domain.SumGroupEvent]]],
+    ) -> None:
+        """Write each batch of events as soon as it arrives.
+
+        Args:
+            batches: Async iterable of event batches; an error ends the stream.
+        """
+        ...
+
+
+@runtime_checkable
+class BatchResultWriter(Protocol):
+    """Protocol for writers that label each batch result with its record."""
+
+    def write_batch_result(
+        self, record: int, result: _result.Result[Sequence[_domain.SumGroup]]
+    ) -> None:
+        """Write one record's result under its record number.
+
+        Args:
+            record: 1-based position of the record among the non-blank,
+                non-comment input lines.
+            result: Result containing sequence of SumGroups or error.
+        """
+        ...
+
+
+class WitnessWriter(Protocol):
+    """Protocol for writing the answer of an existence check."""
+
+    def write_witness_result(
+        self, result: _result.Result[_domain.SumWitness | None]
+    ) -> None:
+        """Write whether a shared sum exists, with its witness.
+
+        Args:
+            result: Result containing a SumWitness, None, or an error.
+        """
+        ...
+
+
+class HeavySumWriter(Protocol):
+    """Protocol for writing approximate heavy-sum reports."""
+
+    def write_heavy_sum_estimates(
+        self, result: _result.Result[Sequence[_domain.HeavySumEstimate]]
+    ) -> None:
+        """Write each likely heavy sum with bounds on its pair count.
+
+        Args:
+            result: Result containing estimates in sum order, or error.
+        """
+        ...
+
+
+class TupleGroupWriter(Protocol):
+    """Protocol for writing groups of equal-sum k-tuples."""
+
+    def write_tuple_groups(
+        self, size: int, result: _result.Result[Iterable[_domain.TupleGroup]]
+    ) -> None:
+        """Write tuple groups one by one while the iterable is consumed.
+
+        Args:
+            size: Tuple size, k.
+            result: Result containing an iterable of TupleGroups or error.
+        """
+        ...
+
+
 class PairFindingStrategy(Protocol):
     """Protocol for pair finding strategies."""
 
@@ -51,3 +186,88 @@ class PairFindingStrategy(Protocol):
             pairs with the same sum value.
         """
         ...
+
+
+@runtime_checkable
+class StreamingPairFindingStrategy(Protocol):
+    """Protocol for strategies that can produce sum groups lazily."""
+
+    def iter_sum_groups(
+        self, numbers: Sequence[int]
+    ) -> _result.Result[Iterator[_domain.SumGroup]]:
+        """Find pairs with the same sum, yielding groups in sum order.
+
+        Args:
+            numbers: Sequence of integers to find pairs in.
+
+        Returns:
+            Result containing an iterator of SumGroups ordered by sum value.
+        """
+        ...
+
+
+class SumGroupSource(Protocol):
+    """Protocol for precomputed groups that can be read from any sum onwards."""
+
+    def iter_sum_groups_after(self, after: int | None) -> Iterator[_domain.SumGroup]:
+        """Yield groups whose sum is greater than after, in sum order.
+
+        Implementations seek to the first such group instead of scanning the
+        groups before it, so reading a page costs about the page size.
+
+        Args:
+            after: Exclusive lower bound on the sum; None starts at the lowest.
+
+        Returns:
+            Iterator of SumGroups ordered by sum value.
+        """
+        ...
+
+
+class MetricsSink(Protocol):
+    """Protocol for receiving per-stage timings and counters."""
+
+    def record_stage(self, stage: str, wall_seconds: float, cpu_seconds: float) -> None:
+        """Record the duration of one pipeline stage.
+
+        Args:
+            stage: Name of the stage, e.g. "parse" or "group_by_sum".
+            wall_seconds: Elapsed wall-clock time.
+            cpu_seconds: Elapsed process CPU time.
+        """
+        ...
+
+    def increment(self, counter: str, value: int = 1) -> None:
+        """Add value to a named counter.
+
+        Args:
+            counter: Name of the counter, e.g. "pairs_generated".
+            value: Amount to add.
+        """
+        ...
+
+    def record_value(self, name: str, value: int) -> None:
+        """Record the latest value of a gauge such as peak memory.
+
+        Args:
+            name: Name of the gauge, e.g. "peak_rss_bytes".
+            value: Current value, replacing any earlier one.
+        """
+        ...
+
+
+@runtime_checkable
+class ProgressSink(MetricsSink, Protocol):
+    """Metrics sink that also follows pair enumeration as it happens."""
+
+    def record_progress(self, pairs_done: int, pairs_total: int) -> None:
+        """Record how many of the input's pairs have been enumerated.
+
+        Called at chunk boundaries, typically once per outer index, so
+        implementations should throttle their own output.
+
+        Args:
+            pairs_done: Pairs enumerated so far.
+            pairs_total: All pairs of the input, n(n-1)/2.
+        """
+        ...
@@ -0,0 +1 @@
+"""Batch feature - many arrays per invocation."""
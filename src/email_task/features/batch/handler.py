@@ -0,0 +1,184 @@
+"""Batch feature handler fanning records out across a process pool."""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+
+from email_task.core import registry as _registry
+from email_task.core.types import BatchResultWriter, OutputWriter, PairFindingStrategy
+from email_task.features.batch import reader as _reader
+from email_task.features.find_pairs import planner as _planner
+from email_task.shared import concurrency as _concurrency
+from email_task.shared import domain as _domain
+from email_task.shared import errors as _errors
+from email_task.shared import result as _result
+
+type _Groups = _result.Result[Sequence[_domain.SumGroup]]
+
+
+@dataclass(frozen=True, slots=True)
+class _Submitted:
+    """A record handed to one generation of the worker pool."""
+
+    numbers: Sequence[int]
+    executor: ProcessPoolExecutor
+    future: Future[_Groups]
+
+
+type _Pending = _Submitted | _result.Error
+
+
+class BatchHandler:
+    """Handler processing many arrays per invocation with bounded parallelism.
+
+    A worker crash breaks the whole process pool, failing every record still
+    in it. The pool is then replaced and each of those records is retried
+    once in the fresh pool, so only a record that crashes again reports
+    worker_failed. Any other exception is reported for its record alone.
+
+    Workers are started with forkserver or spawn, never fork, and the default
+    planner only considers in-process engines, so records never start nested
+    pools of their own.
+    """
+
+    def __init__(
+        self,
+        reader: _reader.BatchFileReader,
+        strategy: PairFindingStrategy | None = None,
+        writer: OutputWriter | None = None,
+        workers: int | None = None,
+        max_in_flight: int | None = None,
+    ) -> None:
+        """Initialize with the record reader and optional dependencies.
+
+        Args:
+            reader: Source of per-record integer arrays.
+            strategy: Picklable strategy run inside the worker processes,
+                defaults to a planner limited to in-process engines.
+            writer: Destination receiving one result per record, in input order;
+                a BatchResultWriter also receives the record number.
+            workers: Number of worker processes, defaults to the usable CPUs.
+            max_in_flight: Upper bound on records submitted but not yet written,
+                defaults to twice the number of workers.
+        """
+        self._reader = reader
+        self._strategy = strategy or _planner.StrategyPlanner(
+            engines=_planner.IN_PROCESS_ENGINES
+        )
+        self._writer = writer or _registry.WRITERS.create(_registry.DEFAULT_WRITER)
+        self._workers = workers or os.process_cpu_count() or 1
+        self._max_in_flight = max(1, max_in_flight or 2 * self._workers)
+        self._executor: ProcessPoolExecutor | None = None
+
+    def execute(self) -> None:
+        """Execute the batch workflow, writing each record's result in order."""
+        match self._reader.read_records():
+            case _result.Error() as error:
+                self._writer.write_pairs_result(error)
+            case records:
+                try:
+                    for record, result in enumerate(self._process(records), 1):
+                        self._write(record, result)
+                finally:
+                    if self._executor is not None:
+                        self._executor.shutdown()
+                        self._executor = None
+
+    def _write(self, record: int, result: _Groups) -> None:
+        """Write one result, labelled with its record number when supported."""
+        match self._writer:
+            case BatchResultWriter() as writer:
+                writer.write_batch_result(record, result)
+            case _:
+                self._writer.write_pairs_result(result)
+
+    def _process(
+        self, records: Iterable[_result.Result[Sequence[int]]]
+    ) -> Iterator[_Groups]:
+        """Submit records with a bounded window and yield results in input order.
+
+        Records that failed to parse never reach the pool; their error is
+        yielded in place so one bad record does not abort the batch.
+        """
+        pending: deque[_Pending] = deque()
+
+        for record in records:
+            if len(pending) >= self._max_in_flight:
+                yield self._resolve(pending.popleft())
+            pending.append(self._submit(record))
+
+        while pending:
+            yield self._resolve(pending.popleft())
+
+    def _submit(self, record: _result.Result[Sequence[int]]) -> _Pending:
+        """Submit a parsed record to the pool, passing errors through."""
+        match record:
+            case _result.Error() as error:
+                return error
+            case numbers:
+                executor = self._pool()
+                try:
+                    future = executor.submit(
+                        _collect_sum_pairs, self._strategy, numbers
+                    )
+                except BrokenProcessPool:
+                    self._replace_pool(executor)
+                    executor = self._pool()
+                    future = executor.submit(
+                        _collect_sum_pairs, self._strategy, numbers
+                    )
+                return _Submitted(numbers, executor, future)
+
+    def _resolve(self, pending: _Pending) -> _Groups:
+        """Wait for a pending record, retrying it once if its pool broke."""
+        match pending:
+            case _Submitted(numbers, executor, future):
+                match future.exception():
+                    case None:
+                        return future.result()
+                    case BrokenProcessPool():
+                        self._replace_pool(executor)
+                        return self._retry(numbers)
+                    case _:
+                        return _errors.ApplicationErrorFactory.record_failed_error()
+            case error:
+                return error
+
+    def _retry(self, numbers: Sequence[int]) -> _Groups:
+        """Run one record alone in the current pool after a crash."""
+        executor = self._pool()
+        future = executor.submit(_collect_sum_pairs, self._strategy, numbers)
+        match future.exception():
+            case None:
+                return future.result()
+            case BrokenProcessPool():
+                self._replace_pool(executor)
+                return _errors.ApplicationErrorFactory.worker_failed_error()
+            case _:
+                return _errors.ApplicationErrorFactory.record_failed_error()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """Return the current worker pool, starting one if needed."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers, mp_context=_concurrency.process_context()
+            )
+        return self._executor
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> None:
+        """Discard a broken pool unless it was already replaced."""
+        if broken is self._executor:
+            broken.shutdown(wait=False)
+            self._executor = None
+
+
+def _collect_sum_pairs(
+    strategy: PairFindingStrategy, numbers: Sequence[int]
+) -> _result.Result[Sequence[_domain.SumGroup]]:
+    """Run the strategy in a worker process; module-level so it pickles."""
+    return strategy.collect_sum_pairs(numbers)
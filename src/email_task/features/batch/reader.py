@@ -0,0 +1,64 @@
+"""Record reader for batch input files."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator, Sequence
+from typing import TextIO
+
+from email_task.features.find_pairs import parser as _parser
+from email_task.shared import errors as _errors
+from email_task.shared import result as _result
+
+STDIN_PATH = "-"
+"""Path value selecting standard input instead of a file."""
+
+
+class BatchFileReader:
+    """Reader yielding one integer array per non-empty input line."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize with the input path, or "-" for standard input."""
+        self._path = path
+
+    def read_records(self) -> _result.Result[Iterator[_result.Result[Sequence[int]]]]:
+        """Open the input and lazily parse it record by record.
+
+        Values within a record may be separated by whitespace and/or commas.
+        Blank lines and lines starting with "#" are skipped.
+
+        Returns:
+            Result containing an iterator of per-record parse Results, or an
+            error if the input cannot be opened.
+        """
+        return _result.map(
+            self._open(),
+            self._iter_records,
+        )
+
+    def _open(self) -> _result.Result[TextIO]:
+        """Open the configured input stream."""
+        match self._path:
+            case "-":
+                return sys.stdin
+            case path:
+                return _result.as_result(
+                    lambda: open(path, encoding="utf-8"),
+                    _errors.ApplicationErrorFactory.input_file_error(),
+                    OSError,
+                )
+
+    def _iter_records(self, stream: TextIO) -> Iterator[_result.Result[Sequence[int]]]:
+        """Parse each record line of the stream, closing files when done."""
+        try:
+            for line in stream:
+                match line.replace(",", " ").split():
+                    case []:
+                        continue
+                    case [first, *_] if first.startswith("#"):
+                        continue
+                    case tokens:
+                        yield _parser.parse_integer_tokens(tokens)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
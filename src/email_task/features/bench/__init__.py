@@ -0,0 +1 @@
+"""Bench feature - synthetic workloads and end-to-end CLI load tests."""
@@ -0,0 +1,248 @@
+"""Concurrent end-to-end runs of the email-task command and their statistics.
+
+Each request starts the real entry point in a fresh process, feeds it the
+workload through argv, stdin or a file, and drains its stdout. Latency covers
+process start-up to exit. Peak RSS is read per child from ``os.wait4`` where
+the platform provides it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Literal
+
+from email_task.features.bench import workload as _workload
+from email_task.shared import memory as _memory
+
+type InputMode = Literal["argv", "stdin", "file"]
+"""How the workload reaches the command under test."""
+
+INPUT_MODES: tuple[InputMode, ...] = ("argv", "stdin", "file")
+"""Accepted InputMode values, in ``--help`` order."""
+
+DEFAULT_COMMAND = (sys.executable, "-m", "email_task")
+"""Command under test: the email-task entry point of this interpreter."""
+
+_READ_CHUNK = 1 << 16
+
+_ERROR_PREFIX = b"Error:"
+"""Start of the output the CLI prints, exiting 0, when a request fails."""
+
+
+@dataclass(frozen=True, slots=True)
+class RunSample:
+    """Measurements of one command run."""
+
+    latency_seconds: float
+    output_bytes: int
+    peak_rss_bytes: int | None
+    exit_code: int
+    reported_error: bool = False
+    """Whether the output starts with the CLI's ``Error:`` message."""
+
+    @property
+    def failed(self) -> bool:
+        """Return whether the run exited non-zero or reported an error."""
+        return self.exit_code != 0 or self.reported_error
+
+
+@dataclass(frozen=True, slots=True)
+class LoadReport:
+    """Aggregate of all runs of one load test."""
+
+    mode: InputMode
+    input_format: _workload.InputFormat
+    concurrency: int
+    requests: int
+    failures: int
+    """Runs that exited with a non-zero status or printed an error."""
+    wall_seconds: float
+    latency_p50_seconds: float
+    latency_p90_seconds: float
+    latency_p99_seconds: float
+    latency_max_seconds: float
+    requests_per_second: float
+    elements_per_second: float
+    output_bytes_per_second: float
+    peak_rss_bytes: int | None
+    """Largest peak RSS of any run, None where it cannot be measured."""
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of sorted samples.
+
+    Args:
+        ordered: Samples in ascending order; must not be empty.
+        fraction: Percentile as a fraction, e.g. 0.99.
+
+    Returns:
+        The smallest sample with at least fraction of the samples at or below it.
+    """
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_load(
+    values: Sequence[int],
+    mode: InputMode = "argv",
+    input_format: _workload.InputFormat = "text",
+    concurrency: int = 1,
+    requests: int = 1,
+    command: Sequence[str] = DEFAULT_COMMAND,
+    extra_arguments: Sequence[str] = (),
+) -> LoadReport:
+    """Run the command requests times, at most concurrency at once.
+
+    Args:
+        values: Input array given to every run.
+        mode: Pass values as arguments, pipe them to ``--input -`` or write
+            them once to a file read with ``--input FILE``.
+        input_format: Encoding for the stdin and file modes.
+        concurrency: Runs in flight at the same time.
+        requests: Total number of runs.
+        command: Command under test, without arguments.
+        extra_arguments: Options appended to every run, e.g. ``--strategy``.
+
+    Returns:
+        Latency percentiles, throughput and peak memory of the runs.
+    """
+    with tempfile.TemporaryDirectory(prefix="email-task-bench-") as directory:
+        arguments, stdin_data = _prepare_input(
+            values, mode, input_format, Path(directory)
+        )
+        full_command = [*command, *arguments, *extra_arguments]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            samples = list(
+                executor.map(
+                    lambda _: run_once(full_command, stdin_data), range(requests)
+                )
+            )
+        wall_seconds = time.perf_counter() - start
+    return _summarize(
+        samples, mode, input_format, concurrency, len(values), wall_seconds
+    )
+
+
+def run_once(command: Sequence[str], stdin_data: bytes | None = None) -> RunSample:
+    """Run command once, feeding stdin_data and counting its stdout bytes.
+
+    Args:
+        command: Program and arguments.
+        stdin_data: Bytes written to stdin, or None to attach no stdin.
+
+    Returns:
+        Latency, output size, peak RSS, exit code and whether the output
+        reported an error.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL if stdin_data is None else subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    feeder = None
+    if stdin_data is not None and process.stdin is not None:
+        # Write from a thread so a full stdout pipe can never deadlock the run.
+        feeder = threading.Thread(target=_feed, args=(process.stdin, stdin_data))
+        feeder.start()
+    output_bytes = 0
+    head = b""
+    if process.stdout is not None:
+        while chunk := process.stdout.read(_READ_CHUNK):
+            if len(head) < len(_ERROR_PREFIX):
+                head += chunk[: len(_ERROR_PREFIX) - len(head)]
+            output_bytes += len(chunk)
+        process.stdout.close()
+    if feeder is not None:
+        feeder.join()
+
+    peak_rss = None
+    if hasattr(os, "wait4"):
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        peak_rss = _memory.maxrss_bytes(usage.ru_maxrss)
+    else:  # pragma: no cover - Windows
+        process.wait()
+    return RunSample(
+        time.perf_counter() - start,
+        output_bytes,
+        peak_rss,
+        process.returncode,
+        head == _ERROR_PREFIX,
+    )
+
+
+def _prepare_input(
+    values: Sequence[int],
+    mode: InputMode,
+    input_format: _workload.InputFormat,
+    directory: Path,
+) -> tuple[list[str], bytes | None]:
+    """Return the arguments and stdin bytes delivering values in mode."""
+    format_arguments = ["--input-format", input_format]
+    match mode:
+        case "argv":
+            return [str(value) for value in values], None
+        case "stdin":
+            return (
+                ["--input", "-", *format_arguments],
+                _workload.encode_workload(values, input_format),
+            )
+        case "file":
+            path = directory / f"input.{input_format}"
+            path.write_bytes(_workload.encode_workload(values, input_format))
+            return ["--input", str(path), *format_arguments], None
+
+
+def _feed(stream: IO[bytes], data: bytes) -> None:
+    """Write data to a child's stdin and close it; a child may exit early."""
+    with contextlib.suppress(BrokenPipeError):
+        stream.write(data)
+    with contextlib.suppress(BrokenPipeError):
+        stream.close()
+
+
+def _summarize(
+    samples: Sequence[RunSample],
+    mode: InputMode,
+    input_format: _workload.InputFormat,
+    concurrency: int,
+    input_size: int,
+    wall_seconds: float,
+) -> LoadReport:
+    """Aggregate the samples of one load test."""
+    latencies = sorted(sample.latency_seconds for sample in samples)
+    peaks = [
+        sample.peak_rss_bytes for sample in samples if sample.peak_rss_bytes is not None
+    ]
+    elapsed = wall_seconds or math.inf
+    return LoadReport(
+        mode=mode,
+        input_format=input_format,
+        concurrency=concurrency,
+        requests=len(samples),
+        failures=sum(sample.failed for sample in samples),
+        wall_seconds=wall_seconds,
+        latency_p50_seconds=percentile(latencies, 0.50),
+        latency_p90_seconds=percentile(latencies, 0.90),
+        latency_p99_seconds=percentile(latencies, 0.99),
+        latency_max_seconds=latencies[-1],
+        requests_per_second=len(samples) / elapsed,
+        elements_per_second=len(samples) * input_size / elapsed,
+        output_bytes_per_second=sum(sample.output_bytes for sample in samples)
+        / elapsed,
+        peak_rss_bytes=max(peaks) if len(peaks) == len(samples) else None,
+    )
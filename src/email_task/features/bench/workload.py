@@ -0,0 +1,69 @@
+"""Seeded synthetic input arrays in the encodings email-task reads."""
+
+from __future__ import annotations
+
+import random
+from array import array as typed_array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+type InputFormat = Literal["text", "int64"]
+"""Encoding of a generated array, matching ``email-task --input-format``."""
+
+
+@dataclass(frozen=True, slots=True)
+class WorkloadSpec:
+    """Shape of a generated input array."""
+
+    size: int
+    max_value: int = 1_000_000
+    """Largest magnitude of a generated value."""
+    duplicate_ratio: float = 0.0
+    """Share of elements copied from an earlier element, 0 to 1."""
+    negative_ratio: float = 0.0
+    """Share of freshly drawn values made negative, 0 to 1."""
+    seed: int = 0
+
+
+def generate_workload(spec: WorkloadSpec) -> typed_array[int]:
+    """Generate the array described by spec.
+
+    The same spec always yields the same array, whatever the platform.
+
+    Args:
+        spec: Size, value range, duplicate ratio, sign mix and seed.
+
+    Returns:
+        Generated values as an int64 array.
+    """
+    rng = random.Random(
+        f"{spec.seed}:{spec.size}:{spec.max_value}:"
+        f"{spec.duplicate_ratio}:{spec.negative_ratio}"
+    )
+    values = typed_array("q")
+    for position in range(spec.size):
+        if position and rng.random() < spec.duplicate_ratio:
+            values.append(values[rng.randrange(position)])
+            continue
+        magnitude = rng.randint(0, spec.max_value)
+        values.append(-magnitude if rng.random() < spec.negative_ratio else magnitude)
+    return values
+
+
+def encode_workload(values: Sequence[int], input_format: InputFormat) -> bytes:
+    """Encode values for ``email-task --input``.
+
+    Args:
+        values: Generated array.
+        input_format: "text" for one whitespace-separated line, "int64" for
+            raw native-endian int64 values.
+
+    Returns:
+        Encoded bytes.
+    """
+    match input_format:
+        case "int64":
+            return typed_array("q", values).tobytes()
+        case "text":
+            return (" ".join(map(str, values)) + "\n").encode("ascii")
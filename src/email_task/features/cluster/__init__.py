@@ -0,0 +1 @@
+"""Cluster feature - sum-residue sharding across TCP workers."""
@@ -0,0 +1,155 @@
+"""Coordinator broadcasting one array to TCP workers and merging their shards."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from array import array
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from email_task.features.cluster import protocol as _protocol
+from email_task.features.find_pairs import async_handler as _async_handler
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import errors as _errors
+from email_task.shared import metrics as _metrics
+from email_task.shared import result as _result
+from email_task.shared import shared_array as _shared_array
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+    from email_task.core.types import AsyncInputReader, AsyncOutputWriter, MetricsSink
+    from email_task.shared import domain as _domain
+
+type WorkerAddress = tuple[str, int]
+"""Host and TCP port of a running ClusterWorker."""
+
+
+class ClusterCoordinator:
+    """Handler splitting pair finding across workers by sum residue.
+
+    Every worker receives the whole array and returns only the groups whose
+    sum is congruent to its shard number modulo the worker count. The shards
+    hold disjoint sums already in sum order, so a k-way merge reproduces the
+    single-process output. All shards are received before the first line is
+    written, so a failed worker turns into one error instead of partial output.
+    """
+
+    def __init__(
+        self,
+        reader: AsyncInputReader,
+        writer: AsyncOutputWriter,
+        workers: Sequence[WorkerAddress],
+        metrics: MetricsSink | None = None,
+        timeout: float | None = None,
+        max_response_bytes: int = _protocol.DEFAULT_MAX_RESPONSE_BYTES,
+    ) -> None:
+        """Initialize the coordinator.
+
+        Args:
+            reader: Async reader producing the input array.
+            writer: Async writer consuming the merged groups.
+            workers: Addresses of the workers, one shard each.
+            metrics: Optional metrics sink; the distribute and write stages are
+                timed and the worker count and received bytes are recorded.
+            timeout: Seconds allowed per worker round trip; None waits forever.
+            max_response_bytes: Largest shard a worker may send back; a larger
+                one fails the run without being read.
+        """
+        self._reader = reader
+        self._writer = writer
+        self._workers = tuple(workers)
+        self._metrics = metrics
+        self._timeout = timeout
+        self._max_response_bytes = max_response_bytes
+
+    async def execute(self) -> None:
+        """Execute the read -> distribute -> merge -> write workflow."""
+        _metrics.gauge(self._metrics, "cluster_workers", len(self._workers))
+        values = await self._read_input()
+        shards = await _metrics.timed_async_call(
+            self._metrics, "distribute", self._distribute, values
+        )
+        groups = _result.map(shards, self._merge_shards)
+        await _metrics.timed_async_call(
+            self._metrics, "write", self._writer.write_sum_groups, groups
+        )
+
+    async def _read_input(self) -> _result.Result[array[int]]:
+        """Collect the whole array; it must fit the int64 wire format."""
+        values = array("q")
+        async for chunk in self._reader.iter_integer_chunks():
+            match chunk:
+                case _result.Error() as error:
+                    return error
+                case _ if chunk and not _shared_array.SharedInt64Array.fits(chunk):
+                    return _errors.ApplicationErrorFactory.value_range_error()
+                case _:
+                    values.extend(chunk)
+
+        _metrics.count(self._metrics, "input_size", len(values))
+        if len(values) < 2:
+            return _errors.ApplicationErrorFactory.min_arg_error()
+        return values
+
+    async def _distribute(
+        self, values: _result.Result[array[int]]
+    ) -> _result.Result[tuple[array[int], list[array[int]]]]:
+        """Send the array to every worker at once and gather their shards."""
+        match values:
+            case _result.Error() as error:
+                return error
+            case _:
+                payload = _protocol.encode_int64(values)
+                replies = await asyncio.gather(
+                    *(
+                        self._request_shard(address, shard, payload)
+                        for shard, address in enumerate(self._workers)
+                    )
+                )
+                shards: list[array[int]] = []
+                for reply in replies:
+                    match reply:
+                        case _result.Error() as error:
+                            return error
+                        case records:
+                            shards.append(records)
+                return values, shards
+
+    async def _request_shard(
+        self, address: WorkerAddress, shard: int, payload: bytes
+    ) -> _result.Result[array[int]]:
+        """Run one worker round trip, mapping any failure to an Error."""
+        try:
+            status, reply = await asyncio.wait_for(
+                self._round_trip(address, shard, payload), self._timeout
+            )
+        except (OSError, asyncio.IncompleteReadError, TimeoutError):
+            return _errors.ApplicationErrorFactory.cluster_worker_error()
+        if status != _protocol.STATUS_OK or len(reply) % _protocol.INT64_BYTES:
+            return _errors.ApplicationErrorFactory.cluster_worker_error()
+        _metrics.count(self._metrics, "shard_result_bytes", len(reply))
+        return _protocol.decode_int64(reply)
+
+    async def _round_trip(
+        self, address: WorkerAddress, shard: int, payload: bytes
+    ) -> tuple[int, bytes]:
+        """Send one shard request and read the worker's response."""
+        reader, writer = await asyncio.open_connection(*address)
+        try:
+            await _protocol.send_request(writer, shard, len(self._workers), payload)
+            return await _protocol.read_response(reader, self._max_response_bytes)
+        finally:
+            writer.close()
+
+    def _merge_shards(
+        self, received: tuple[array[int], list[array[int]]]
+    ) -> AsyncIterator[_domain.SumGroup]:
+        """Merge the shards by sum while groups are built off the loop."""
+        values, shards = received
+        merged: Iterator[_domain.SumGroup] = heapq.merge(
+            *(_strategies.unpack_sum_groups(values, records) for records in shards),
+            key=lambda sum_group: sum_group.sum_value,
+        )
+        return _async_handler.iter_in_worker_thread(merged)
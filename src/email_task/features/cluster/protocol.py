@@ -0,0 +1,164 @@
+"""Wire format shared by the cluster coordinator and its workers.
+
+A request is a fixed header followed by the input array; a response is a
+status header followed by packed sum-group records. Every integer on the
+wire is a little-endian int64, whatever the host byte order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+MAGIC = b"ETC1"
+"""Request prefix identifying the protocol and its version."""
+
+REQUEST_HEADER = struct.Struct("!4sIIQ")
+"""Magic, shard, shard count and number of int64 values that follow."""
+
+RESPONSE_HEADER = struct.Struct("!BQ")
+"""Status and byte length of the payload that follows."""
+
+STATUS_OK = 0
+"""Payload holds the shard's packed sum-group records."""
+
+STATUS_ERROR = 1
+"""Payload holds a UTF-8 error description."""
+
+INT64_BYTES = 8
+
+DEFAULT_MAX_VALUES = 1 << 24
+"""Largest array a worker accepts by default, 128 MiB of int64 values."""
+
+DEFAULT_MAX_RESPONSE_BYTES = 1 << 32
+"""Largest response payload a coordinator reads by default."""
+
+MAX_SHARD_COUNT = 1 << 16
+"""Largest shard count a worker accepts; each shard costs one residue bucket."""
+
+
+@dataclass(frozen=True, slots=True)
+class ShardRequest:
+    """One worker's assignment: the whole array and the residue it owns."""
+
+    shard: int
+    shard_count: int
+    values: array[int]
+
+
+def encode_int64(values: Sequence[int]) -> bytes:
+    """Encode integers as little-endian int64.
+
+    Args:
+        values: Integers within the int64 range.
+
+    Returns:
+        Raw little-endian bytes.
+
+    Raises:
+        OverflowError: If a value does not fit in an int64.
+    """
+    packed = array("q", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def decode_int64(data: bytes) -> array[int]:
+    """Decode little-endian int64 bytes into a native array.
+
+    Args:
+        data: Raw bytes whose length is a multiple of eight.
+
+    Returns:
+        Decoded int64 array.
+    """
+    values = array("q")
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+async def send_request(
+    writer: asyncio.StreamWriter, shard: int, shard_count: int, payload: bytes
+) -> None:
+    """Send a shard request whose array is already encoded.
+
+    Args:
+        writer: Connection to the worker.
+        shard: Residue of the sums the worker must return.
+        shard_count: Number of shards the sums are split into.
+        payload: Array encoded with encode_int64, shared by every worker.
+    """
+    writer.write(
+        REQUEST_HEADER.pack(MAGIC, shard, shard_count, len(payload) // INT64_BYTES)
+    )
+    writer.write(payload)
+    await writer.drain()
+
+
+async def read_request(
+    reader: asyncio.StreamReader, max_values: int = DEFAULT_MAX_VALUES
+) -> ShardRequest | None:
+    """Read one shard request.
+
+    Args:
+        reader: Connection from the coordinator.
+        max_values: Largest array accepted; the header is checked before any
+            of the payload is read.
+
+    Returns:
+        The request, or None if the header is malformed or announces more
+        than max_values values or MAX_SHARD_COUNT shards.
+
+    Raises:
+        asyncio.IncompleteReadError: If the peer closes mid-request.
+    """
+    header = await reader.readexactly(REQUEST_HEADER.size)
+    magic, shard, shard_count, length = REQUEST_HEADER.unpack(header)
+    if (
+        magic != MAGIC
+        or not 0 <= shard < shard_count <= MAX_SHARD_COUNT
+        or length > max_values
+    ):
+        return None
+    values = decode_int64(await reader.readexactly(length * INT64_BYTES))
+    return ShardRequest(shard, shard_count, values)
+
+
+async def send_response(
+    writer: asyncio.StreamWriter, status: int, payload: bytes
+) -> None:
+    """Send a status header and its payload."""
+    writer.write(RESPONSE_HEADER.pack(status, len(payload)))
+    writer.write(payload)
+    await writer.drain()
+
+
+async def read_response(
+    reader: asyncio.StreamReader, max_bytes: int = DEFAULT_MAX_RESPONSE_BYTES
+) -> tuple[int, bytes]:
+    """Read a status header and its payload.
+
+    Args:
+        reader: Connection to the worker.
+        max_bytes: Largest payload accepted; a longer one is never read.
+
+    Returns:
+        The status and payload, or STATUS_ERROR with a description when the
+        header announces more than max_bytes.
+
+    Raises:
+        asyncio.IncompleteReadError: If the peer closes mid-response.
+    """
+    status, length = RESPONSE_HEADER.unpack(
+        await reader.readexactly(RESPONSE_HEADER.size)
+    )
+    if length > max_bytes:
+        return STATUS_ERROR, b"response exceeds the size limit"
+    return status, await reader.readexactly(length)
@@ -0,0 +1,77 @@
+"""TCP worker computing the sum groups of one residue class."""
+
+from __future__ import annotations
+
+import asyncio
+
+from email_task.features.cluster import protocol as _protocol
+from email_task.features.find_pairs import strategies as _strategies
+
+
+class ClusterWorker:
+    """Server answering shard requests from a coordinator, one per connection."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_values: int = _protocol.DEFAULT_MAX_VALUES,
+    ) -> None:
+        """Initialize the listening address and request limit.
+
+        Args:
+            host: Interface to bind.
+            port: TCP port to bind; 0 picks a free one.
+            max_values: Largest array accepted per request; larger requests
+                are answered with an error before their payload is read.
+        """
+        self._host = host
+        self._port = port
+        self._max_values = max_values
+
+    async def start(self) -> asyncio.Server:
+        """Start listening; the caller decides how long to serve.
+
+        Returns:
+            The running server, whose sockets report the bound port.
+        """
+        return await asyncio.start_server(self._serve, self._host, self._port)
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer one request; the scan runs off the loop so others are served."""
+        try:
+            match await _protocol.read_request(reader, self._max_values):
+                case None:
+                    await _protocol.send_response(
+                        writer,
+                        _protocol.STATUS_ERROR,
+                        b"malformed or oversized request",
+                    )
+                case request:
+                    await self._send_shard(writer, request)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _send_shard(
+        self, writer: asyncio.StreamWriter, request: _protocol.ShardRequest
+    ) -> None:
+        """Compute the requested shard in a worker thread and send it back."""
+        try:
+            packed = await asyncio.to_thread(
+                _strategies.collect_residue_shard,
+                request.values,
+                request.shard,
+                request.shard_count,
+            )
+        except OverflowError:
+            await _protocol.send_response(
+                writer, _protocol.STATUS_ERROR, b"pair sum exceeds int64"
+            )
+            return
+        await _protocol.send_response(
+            writer, _protocol.STATUS_OK, _protocol.encode_int64(packed)
+        )
@@ -0,0 +1,415 @@
+"""Library API running the find pairs pipeline without argv or console I/O."""
+
+from __future__ import annotations
+
+from collections.abc import Buffer, Iterator, Sequence
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from email_task.core import registry as _registry
+from email_task.core.types import (
+    PairFindingStrategy,
+    StreamingPairFindingStrategy,
+    SumGroupSource,
+)
+from email_task.shared import domain as _domain
+from email_task.shared import errors as _errors
+from email_task.shared import result as _result
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from email_task.features.find_pairs.index_file import SumIndexFile, SumIndexHeader
+    from email_task.features.find_pairs.pagination import SumGroupIndex, SumGroupPage
+
+_INTEGER_FORMATS = frozenset("bBhHiIlLqQnN")
+"""Native struct formats accepted from buffer-protocol inputs."""
+
+
+def _create_strategy(
+    strategy: PairFindingStrategy | None,
+    max_memory: int | None,
+    deadline: float | None,
+) -> _result.Result[PairFindingStrategy]:
+    """Resolve the strategy from at most one of the configuring options.
+
+    Each option selects a different engine, so none of them can honour
+    another; giving more than one is a validation error, not a silent choice.
+    """
+    given = (strategy, max_memory, deadline)
+    if sum(option is not None for option in given) > 1:
+        return _errors.ApplicationErrorFactory.conflicting_options_error()
+    if strategy is not None:
+        return strategy
+    if deadline is not None:
+        from email_task.features.find_pairs import strategies as _strategies
+
+        return _strategies.DeadlineBoundedStrategy(deadline)
+    if max_memory is None:
+        return _registry.STRATEGIES.create(_registry.DEFAULT_STRATEGY)
+    return _registry.STRATEGIES.create(
+        _registry.DEFAULT_STRATEGY, memory_budget=max_memory
+    )
+
+
+class PairFinder:
+    """Reusable pair finder holding one configured strategy across calls."""
+
+    def __init__(
+        self,
+        strategy: PairFindingStrategy | None = None,
+        *,
+        max_memory: int | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """Initialize with an optional strategy instance to reuse.
+
+        At most one of strategy, max_memory and deadline may be given;
+        otherwise every call returns a validation error.
+
+        Args:
+            strategy: Strategy instance, defaults to the registry default.
+            max_memory: Peak memory budget in bytes for the default planner;
+                over-budget inputs fall back to bounded-memory execution or
+                fail with a resource error before any work starts.
+            deadline: Seconds allowed per call; late calls return a
+                DeadlineExceededError with the complete groups.
+        """
+        self._strategy = _create_strategy(strategy, max_memory, deadline)
+
+    def find_pairs(
+        self,
+        numbers: Sequence[int] | Buffer,
+        *,
+        limit: int | None = None,
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
+        """Find equal-sum groups in numbers.
+
+        Args:
+            numbers: Integer sequence or buffer-protocol object; it is read in
+                place, never copied into a tuple.
+            limit: Maximum number of groups to return, lowest sums first.
+
+        Returns:
+            Result containing SumGroups ordered by sum value or an error.
+        """
+        return _result.map(
+            self.iter_find_pairs(numbers, limit=limit),
+            tuple,
+        )
+
+    def iter_find_pairs(
+        self,
+        numbers: Sequence[int] | Buffer,
+        *,
+        limit: int | None = None,
+    ) -> _result.Result[Iterator[_domain.SumGroup]]:
+        """Find equal-sum groups in numbers and iterate over them.
+
+        Args:
+            numbers: Integer sequence or buffer-protocol object.
+            limit: Maximum number of groups to yield, lowest sums first.
+
+        Returns:
+            Result containing an iterator of SumGroups ordered by sum value.
+        """
+        return _result.bind(
+            _validate_limit(limit),
+            lambda stop: _result.map(
+                _result.bind(as_integer_sequence(numbers), self._iter_sum_groups),
+                lambda groups: islice(groups, stop),
+            ),
+        )
+
+    def _iter_sum_groups(
+        self, numbers: Sequence[int]
+    ) -> _result.Result[Iterator[_domain.SumGroup]]:
+        """Run the strategy, streaming groups when it supports streaming."""
+        match self._strategy:
+            case _result.Error() as error:
+                return error
+            case StreamingPairFindingStrategy() as strategy:
+                return strategy.iter_sum_groups(numbers)
+            case strategy:
+                return _result.map(strategy.collect_sum_pairs(numbers), iter)
+
+
+_DEFAULT_FINDER = PairFinder()
+
+
+def find_pairs(
+    numbers: Sequence[int] | Buffer,
+    *,
+    strategy: PairFindingStrategy | None = None,
+    limit: int | None = None,
+    max_memory: int | None = None,
+    deadline: float | None = None,
+) -> _result.Result[Sequence[_domain.SumGroup]]:
+    """Find equal-sum groups in numbers.
+
+    Args:
+        numbers: Integer sequence or buffer-protocol object.
+        strategy: Strategy instance to use, defaults to a shared instance.
+        limit: Maximum number of groups to return, lowest sums first.
+        max_memory: Peak memory budget in bytes for the default planner.
+        deadline: Seconds allowed; if enumeration is cut short the result is
+            a DeadlineExceededError carrying the complete groups and the last
+            outer index processed.
+
+    Returns:
+        Result containing SumGroups ordered by sum value or an error; giving
+        more than one of strategy, max_memory and deadline is a validation
+        error.
+    """
+    return _finder_for(strategy, max_memory, deadline).find_pairs(numbers, limit=limit)
+
+
+def iter_find_pairs(
+    numbers: Sequence[int] | Buffer,
+    *,
+    strategy: PairFindingStrategy | None = None,
+    limit: int | None = None,
+    max_memory: int | None = None,
+    deadline: float | None = None,
+) -> _result.Result[Iterator[_domain.SumGroup]]:
+    """Find equal-sum groups in numbers and iterate over them.
+
+    Args:
+        numbers: Integer sequence or buffer-protocol object.
+        strategy: Strategy instance to use, defaults to a shared instance.
+        limit: Maximum number of groups to yield, lowest sums first.
+        max_memory: Peak memory budget in bytes for the default planner.
+        deadline: Seconds allowed; a late run returns a DeadlineExceededError
+            instead of an iterator.
+
+    Returns:
+        Result containing an iterator of SumGroups ordered by sum value; giving
+        more than one of strategy, max_memory and deadline is a validation
+        error.
+    """
+    return _finder_for(strategy, max_memory, deadline).iter_find_pairs(
+        numbers, limit=limit
+    )
+
+
+def find_sum_witness(
+    numbers: Sequence[int] | Buffer,
+) -> _result.Result[_domain.SumWitness | None]:
+    """Check whether any non-negative sum is shared by two pairs.
+
+    Stops at the first collision and, for non-negative inputs, scans only the
+    prefix that the pigeonhole principle guarantees to contain one.
+
+    Args:
+        numbers: Integer sequence or buffer-protocol object.
+
+    Returns:
+        Result containing a SumWitness, None if every sum is unique, or an error.
+    """
+    from email_task.features.find_pairs import strategies as _strategies
+
+    return _result.bind(
+        as_integer_sequence(numbers),
+        _strategies.PigeonholeExistenceCheck().find_witness,
+    )
+
+
+def find_sum_tuples(
+    numbers: Sequence[int] | Buffer, size: int
+) -> _result.Result[Sequence[_domain.TupleGroup]]:
+    """Find groups of size-element tuples that share a sum.
+
+    Args:
+        numbers: Integer sequence or buffer-protocol object.
+        size: Number of elements per tuple, k; 2 lists the usual pairs.
+
+    Returns:
+        Result containing TupleGroups ordered by sum value or an error.
+    """
+    from email_task.features.find_pairs import strategies as _strategies
+
+    return _result.bind(
+        as_integer_sequence(numbers),
+        _strategies.TupleFindingStrategy(size).collect_sum_tuples,
+    )
+
+
+def find_cross_pairs(
+    left: Sequence[int] | Buffer, right: Sequence[int] | Buffer
+) -> _result.Result[Sequence[_domain.SumGroup]]:
+    """Find groups of (a, b) pairs with a from left and b from right sharing a sum.
+
+    Pair indices refer to the concatenation ``left + right``.
+
+    Args:
+        left: Array A, integer sequence or buffer-protocol object.
+        right: Array B, integer sequence or buffer-protocol object.
+
+    Returns:
+        Result containing SumGroups ordered by sum value or an error.
+    """
+    from email_task.features.find_pairs import cross as _cross
+
+    strategy = _cross.CrossJoinStrategy()
+    return _result.bind(
+        as_integer_sequence(left),
+        lambda a: _result.bind(
+            as_integer_sequence(right),
+            lambda b: _result.map(strategy.iter_cross_pairs(a, b), tuple),
+        ),
+    )
+
+
+def count_cross_pairs(
+    left: Sequence[int] | Buffer, right: Sequence[int] | Buffer
+) -> _result.Result[dict[int, int]]:
+    """Count the (a, b) pairs per sum without listing them.
+
+    Args:
+        left: Array A, integer sequence or buffer-protocol object.
+        right: Array B, integer sequence or buffer-protocol object.
+
+    Returns:
+        Result containing pair counts of the sums shared by two or more pairs.
+    """
+    from email_task.features.find_pairs import cross as _cross
+
+    strategy = _cross.CrossJoinStrategy()
+    return _result.bind(
+        as_integer_sequence(left),
+        lambda a: _result.bind(
+            as_integer_sequence(right), lambda b: strategy.count_cross_pairs(a, b)
+        ),
+    )
+
+
+def build_sum_index(
+    numbers: Sequence[int] | Buffer,
+) -> _result.Result[SumGroupIndex]:
+    """Compute the groups of numbers once for cursor-based paging.
+
+    The groups are packed as int64 records with a sorted sum directory, so
+    each find_pairs_page call costs about its page size, not a full rerun.
+
+    Args:
+        numbers: Integer sequence or buffer-protocol object; kept by reference.
+
+    Returns:
+        Result containing the index or a validation error.
+    """
+    from email_task.features.find_pairs import pagination as _pagination
+
+    return _result.map(as_integer_sequence(numbers), _pagination.SumGroupIndex)
+
+
+def build_sum_index_file(
+    numbers: Sequence[int] | Buffer, path: str | Path
+) -> _result.Result[SumIndexHeader]:
+    """Compute the groups of numbers once and persist them as an index file.
+
+    Args:
+        numbers: Integer sequence or buffer-protocol object.
+        path: File to create or replace atomically.
+
+    Returns:
+        Result containing the array length, group and pair counts written, or
+        a validation or index write error.
+    """
+    from email_task.features.find_pairs import index_file as _index_file
+
+    return _result.bind(
+        as_integer_sequence(numbers),
+        lambda array: _index_file.write_sum_index(path, array),
+    )
+
+
+def open_sum_index_file(path: str | Path) -> _result.Result[SumIndexFile]:
+    """Memory-map an index file written by build_sum_index_file.
+
+    The returned index answers lookup, iter_range and find_pairs_page without
+    recomputing pairs or reading the whole file; close it when done.
+
+    Args:
+        path: Index file.
+
+    Returns:
+        Result containing the open index or an index file error.
+    """
+    from email_task.features.find_pairs import index_file as _index_file
+
+    return _index_file.open_sum_index(path)
+
+
+def find_pairs_page(
+    source: SumGroupSource, *, limit: int, cursor: str | None = None
+) -> _result.Result[SumGroupPage]:
+    """Return up to limit groups of source after the position of cursor.
+
+    Args:
+        source: Precomputed groups, e.g. from build_sum_index.
+        limit: Maximum number of groups on the page.
+        cursor: next_cursor of the previous page; None for the first page.
+
+    Returns:
+        Result containing the page, whose next_cursor is None after the last
+        group, or a limit or cursor validation error.
+    """
+    from email_task.features.find_pairs import pagination as _pagination
+
+    return _pagination.paginate(source, limit, cursor)
+
+
+def as_integer_sequence(
+    numbers: Sequence[int] | Buffer,
+) -> _result.Result[Sequence[int]]:
+    """View numbers as an integer sequence without copying.
+
+    Sequences are used as-is; other buffer-protocol objects are exposed through
+    a one-dimensional memoryview of their native integer format.
+
+    Args:
+        numbers: Integer sequence or buffer-protocol object.
+
+    Returns:
+        Result containing an indexable integer sequence or a validation error.
+    """
+    match numbers:
+        case str():
+            return _errors.ApplicationErrorFactory.invalid_input_error()
+        case Sequence() if not isinstance(numbers, memoryview):
+            return numbers
+        case _:
+            return _result.as_result(
+                lambda: _integer_view(memoryview(numbers)),
+                _errors.ApplicationErrorFactory.invalid_input_error(),
+                (TypeError, ValueError),
+            )
+
+
+def _integer_view(view: memoryview) -> memoryview:
+    """Flatten a memoryview of native integers into one dimension."""
+    if view.format not in _INTEGER_FORMATS:
+        raise TypeError(f"unsupported buffer format {view.format!r}")
+    return view if view.ndim == 1 else view.cast("B").cast(view.format)
+
+
+def _validate_limit(limit: int | None) -> _result.Result[int | None]:
+    """Check the optional result limit."""
+    match limit:
+        case None:
+            return None
+        case int() as stop if stop >= 0:
+            return stop
+        case _:
+            return _errors.ApplicationErrorFactory.invalid_limit_error()
+
+
+def _finder_for(
+    strategy: PairFindingStrategy | None,
+    max_memory: int | None = None,
+    deadline: float | None = None,
+) -> PairFinder:
+    """Return the shared default finder or one configured for the call."""
+    if strategy is None and max_memory is None and deadline is None:
+        return _DEFAULT_FINDER
+    return PairFinder(strategy, max_memory=max_memory, deadline=deadline)
@@ -0,0 +1,209 @@
+"""Asyncio find pairs handler overlapping read, index and write stages."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import errors as _errors
+from email_task.shared import memory as _memory
+from email_task.shared import metrics as _metrics
+from email_task.shared import result as _result
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from email_task.core.types import (
+        AsyncEventWriter,
+        AsyncInputReader,
+        AsyncOutputWriter,
+        MetricsSink,
+    )
+    from email_task.shared import domain as _domain
+
+GROUP_BATCH_SIZE = 64
+"""Groups built per worker-thread hand-off while writing."""
+
+
+class AsyncFindPairsHandler:
+    """Handler streaming one large array through bounded-queue pipeline stages.
+
+    Chunks are indexed in a worker thread while the reader fetches the next
+    ones, and groups are built in a worker thread while the writer prints the
+    previous batch, so the event loop itself never runs the pair scan.
+    """
+
+    def __init__(
+        self,
+        reader: AsyncInputReader,
+        writer: AsyncOutputWriter,
+        metrics: MetricsSink | None = None,
+        queue_size: int = 4,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            reader: Async reader producing consecutive chunks of the array.
+            writer: Async writer consuming groups as they are built.
+            metrics: Optional metrics sink; the index and write stages are timed
+                and the input size and peak RSS are recorded.
+            queue_size: Chunks, and batches of groups, buffered between stages.
+        """
+        self._reader = reader
+        self._writer = writer
+        self._metrics = metrics
+        self._queue_size = queue_size
+
+    async def execute(self) -> None:
+        """Execute the overlapped read -> index -> write workflow."""
+        index = await self._index_input()
+        groups = _result.map(index, self._stream_groups)
+        await _metrics.timed_async_call(
+            self._metrics, "write", self._writer.write_sum_groups, groups
+        )
+        _metrics.gauge(self._metrics, "peak_rss_bytes", _memory.peak_rss_bytes())
+
+    async def _index_input(self) -> _result.Result[_strategies.IncrementalSumIndex]:
+        """Index chunks in a worker thread while the reader fetches later ones."""
+        queue: asyncio.Queue[_result.Result[Sequence[int]] | None] = asyncio.Queue(
+            self._queue_size
+        )
+        index = _strategies.IncrementalSumIndex(self._metrics)
+        async with asyncio.TaskGroup() as tasks:
+            reading = tasks.create_task(self._read_chunks(queue))
+            while (chunk := await queue.get()) is not None:
+                match chunk:
+                    case _result.Error() as error:
+                        reading.cancel()
+                        return error
+                    case values:
+                        await asyncio.to_thread(
+                            _metrics.timed_call,
+                            self._metrics,
+                            "index",
+                            index.extend,
+                            values,
+                        )
+
+        _metrics.count(self._metrics, "input_size", len(index))
+        if len(index) < 2:
+            return _errors.ApplicationErrorFactory.min_arg_error()
+        return index
+
+    async def _read_chunks(
+        self, queue: asyncio.Queue[_result.Result[Sequence[int]] | None]
+    ) -> None:
+        """Feed reader chunks into the bounded queue, then an end marker."""
+        async for chunk in self._reader.iter_integer_chunks():
+            await queue.put(chunk)
+        await queue.put(None)
+
+    def _stream_groups(
+        self, index: _strategies.IncrementalSumIndex
+    ) -> AsyncIterator[_domain.SumGroup]:
+        """Yield the index's groups while later ones are built off the loop."""
+        return iter_in_worker_thread(index.iter_sum_groups(), self._queue_size)
+
+
+class AsyncSlidingWindowHandler:
+    """Handler reporting equal-sum groups of nearby elements in a live stream.
+
+    Only pairs at most window indices apart are considered, so the stream may
+    be unbounded: each chunk is pushed through a SlidingWindowIndex in a worker
+    thread and its events are written before the next chunk is awaited.
+    """
+
+    def __init__(
+        self,
+        reader: AsyncInputReader,
+        writer: AsyncEventWriter,
+        window: int,
+        metrics: MetricsSink | None = None,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            reader: Async reader producing chunks of the stream as they arrive.
+            writer: Async writer printing each batch of events.
+            window: Largest index distance |i - j| of a pair; at least 1.
+            metrics: Optional metrics sink; the index stage is timed and pairs
+                and events are counted.
+        """
+        self._reader = reader
+        self._writer = writer
+        self._metrics = metrics
+        self._index = _strategies.SlidingWindowIndex(window, metrics)
+
+    async def execute(self) -> None:
+        """Execute the read -> index -> write loop until the stream ends."""
+        await self._writer.write_sum_group_events(self._iter_events())
+        _metrics.count(self._metrics, "input_size", len(self._index))
+
+    async def _iter_events(
+        self,
+    ) -> AsyncIterator[_result.Result[Sequence[_domain.SumGroupEvent]]]:
+        """Yield the events of each chunk, or the reader's error."""
+        async for chunk in self._reader.iter_integer_chunks():
+            match chunk:
+                case _result.Error() as error:
+                    yield error
+                    return
+                case values:
+                    yield await asyncio.to_thread(
+                        _metrics.timed_call,
+                        self._metrics,
+                        "index",
+                        self._push_chunk,
+                        values,
+                    )
+
+    def _push_chunk(self, values: Sequence[int]) -> list[_domain.SumGroupEvent]:
+        """Push a chunk element by element, collecting the events in order."""
+        events: list[_domain.SumGroupEvent] = []
+        for value in values:
+            events.extend(self._index.push(value))
+        return events
+
+
+async def iter_in_worker_thread(
+    sum_groups: Iterator[_domain.SumGroup], queue_size: int = 4
+) -> AsyncIterator[_domain.SumGroup]:
+    """Drive a blocking group iterator in a worker thread, batch by batch.
+
+    Up to queue_size batches are built ahead while the consumer awaits the
+    current one, so producing and writing groups overlap.
+
+    Args:
+        sum_groups: Iterator doing the CPU work of building groups.
+        queue_size: Number of batches buffered ahead of the consumer.
+
+    Returns:
+        Async iterator over the same groups in the same order.
+    """
+    queue: asyncio.Queue[list[_domain.SumGroup] | None] = asyncio.Queue(queue_size)
+    building = asyncio.create_task(_build_batches(sum_groups, queue))
+    try:
+        while (batch := await queue.get()) is not None:
+            for sum_group in batch:
+                yield sum_group
+        await building
+    finally:
+        building.cancel()
+
+
+async def _build_batches(
+    sum_groups: Iterator[_domain.SumGroup],
+    queue: asyncio.Queue[list[_domain.SumGroup] | None],
+) -> None:
+    """Build groups batch by batch off the event loop, then an end marker."""
+    while batch := await asyncio.to_thread(_next_batch, sum_groups):
+        await queue.put(batch)
+    await queue.put(None)
+
+
+def _next_batch(sum_groups: Iterator[_domain.SumGroup]) -> list[_domain.SumGroup]:
+    """Take the next batch of groups from the iterator."""
+    return list(islice(sum_groups, GROUP_BATCH_SIZE))
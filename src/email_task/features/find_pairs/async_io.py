@@ -0,0 +1,258 @@
+"""Asyncio readers and writer for streaming one large array through the pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from array import array
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from io import BufferedReader
+from typing import TextIO
+
+from email_task.features.find_pairs import formatter as _formatter
+from email_task.features.find_pairs import parser as _parser
+from email_task.shared import domain as _domain
+from email_task.shared import errors as _errors
+from email_task.shared import result as _result
+
+STDIN_PATH = "-"
+"""Path value selecting standard input instead of a file."""
+
+DEFAULT_CHUNK_BYTES = 1 << 16
+"""Bytes requested from the source per read."""
+
+_SEPARATORS = b" \t\r\n\v\f,"
+_INT64_BYTES = 8
+
+type ByteSource = str | asyncio.StreamReader
+"""A file path, "-" for standard input, or an asyncio stream."""
+
+
+class AsyncTextReader:
+    """Reader yielding integers separated by whitespace and/or commas."""
+
+    def __init__(
+        self, source: ByteSource, chunk_bytes: int = DEFAULT_CHUNK_BYTES
+    ) -> None:
+        """Initialize with the input source and read size.
+
+        Args:
+            source: File path, "-" for standard input, or an asyncio stream.
+            chunk_bytes: Bytes requested per read; one chunk is parsed per read.
+        """
+        self._source = source
+        self._chunk_bytes = chunk_bytes
+
+    async def iter_integer_chunks(
+        self,
+    ) -> AsyncIterator[_result.Result[Sequence[int]]]:
+        """Read and parse the input block by block.
+
+        A number split across two reads is carried over to the next block.
+
+        Returns:
+            Async iterator of parsed chunks, ending after the first error.
+        """
+        carry = b""
+        async for block in _iter_blocks(self._source, self._chunk_bytes):
+            match block:
+                case _result.Error():
+                    yield block
+                    return
+                case bytes():
+                    text = carry + block
+                    tokens = text.replace(b",", b" ").split()
+                    carry = (
+                        tokens.pop() if tokens and text[-1] not in _SEPARATORS else b""
+                    )
+                    chunk = _parse_tokens(tokens)
+                    yield chunk
+                    if isinstance(chunk, _result.Error):
+                        return
+        if carry:
+            yield _parse_tokens([carry])
+
+
+class AsyncInt64Reader:
+    """Reader yielding native-endian signed 64-bit integers from raw bytes."""
+
+    def __init__(
+        self, source: ByteSource, chunk_bytes: int = DEFAULT_CHUNK_BYTES
+    ) -> None:
+        """Initialize with the input source and read size.
+
+        Args:
+            source: File path, "-" for standard input, or an asyncio stream.
+            chunk_bytes: Bytes requested per read.
+        """
+        self._source = source
+        self._chunk_bytes = chunk_bytes
+
+    async def iter_integer_chunks(
+        self,
+    ) -> AsyncIterator[_result.Result[Sequence[int]]]:
+        """Read the input block by block as arrays of int64 values.
+
+        Returns:
+            Async iterator of chunks; a trailing partial value is an error.
+        """
+        carry = b""
+        async for block in _iter_blocks(self._source, self._chunk_bytes):
+            match block:
+                case _result.Error():
+                    yield block
+                    return
+                case bytes():
+                    data = carry + block
+                    whole = len(data) - len(data) % _INT64_BYTES
+                    carry = data[whole:]
+                    chunk = array("q")
+                    chunk.frombytes(data[:whole])
+                    yield chunk
+        if carry:
+            yield _errors.ApplicationErrorFactory.invalid_input_error()
+
+
+class AsyncTokenReader:
+    """Reader yielding command line style integer tokens as a single chunk."""
+
+    def __init__(self, tokens: Sequence[str]) -> None:
+        """Initialize with the textual tokens.
+
+        Args:
+            tokens: One integer per token, e.g. positional CLI arguments.
+        """
+        self._tokens = tokens
+
+    async def iter_integer_chunks(
+        self,
+    ) -> AsyncIterator[_result.Result[Sequence[int]]]:
+        """Parse all tokens at once.
+
+        Returns:
+            Async iterator of the one parsed chunk or its error.
+        """
+        yield _parser.parse_integer_tokens(self._tokens, minimum=0)
+
+
+class AsyncConsoleWriter:
+    """Writer printing sum groups in console format as they arrive.
+
+    Lines are batched so that blocking stream writes run off the event loop
+    only once per batch.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO | asyncio.StreamWriter | None = None,
+        batch_lines: int = 256,
+    ) -> None:
+        """Initialize with the output stream.
+
+        Args:
+            stream: Text stream or asyncio stream, defaults to sys.stdout.
+            batch_lines: Number of lines written per stream write.
+        """
+        self._stream = stream
+        self._batch_lines = batch_lines
+
+    async def write_sum_groups(
+        self, result: _result.Result[AsyncIterable[_domain.SumGroup]]
+    ) -> None:
+        """Write each group as soon as it is produced.
+
+        Args:
+            result: Result containing an async iterable of SumGroups or error.
+        """
+        match result:
+            case _result.Error(message, _):
+                await self._write_lines([f"Error: {message}"])
+            case sum_groups:
+                lines: list[str] = []
+                written = False
+                async for sum_group in sum_groups:
+                    lines.append(_formatter.format_sum_group(sum_group))
+                    if len(lines) >= self._batch_lines:
+                        await self._write_lines(lines)
+                        lines, written = [], True
+                if not (lines or written):
+                    lines.append(_formatter.NO_PAIRS_MESSAGE)
+                await self._write_lines(lines)
+
+    async def write_sum_group_events(
+        self,
+        batches: AsyncIterable[_result.Result[Sequence[_domain.SumGroupEvent]]],
+    ) -> None:
+        """Write events batch by batch, so a live stream is reported promptly.
+
+        Args:
+            batches: Async iterable of event batches; an error ends the stream.
+        """
+        written = False
+        async for batch in batches:
+            match batch:
+                case _result.Error(message, _):
+                    await self._write_lines([f"Error: {message}"])
+                    return
+                case events:
+                    await self._write_lines(
+                        [_formatter.format_sum_group_event(event) for event in events]
+                    )
+                    written = written or bool(events)
+        if not written:
+            await self._write_lines([_formatter.NO_PAIRS_MESSAGE])
+
+    async def _write_lines(self, lines: list[str]) -> None:
+        """Write lines to the stream without blocking the event loop."""
+        if not lines:
+            return
+        text = "\n".join(lines) + "\n"
+        match self._stream:
+            case asyncio.StreamWriter() as stream:
+                stream.write(text.encode())
+                await stream.drain()
+            case stream:
+                await asyncio.to_thread((stream or sys.stdout).write, text)
+
+
+async def _iter_blocks(
+    source: ByteSource, chunk_bytes: int
+) -> AsyncIterator[_result.Result[bytes]]:
+    """Read source in blocks; file reads run in a worker thread."""
+    match source:
+        case asyncio.StreamReader():
+            while block := await source.read(chunk_bytes):
+                yield block
+        case path:
+            match await asyncio.to_thread(_open, path):
+                case _result.Error() as error:
+                    yield error
+                case stream:
+                    try:
+                        while block := await asyncio.to_thread(
+                            stream.read1, chunk_bytes
+                        ):
+                            yield block
+                    finally:
+                        if stream is not sys.stdin.buffer:
+                            stream.close()
+
+
+def _open(path: str) -> _result.Result[BufferedReader]:
+    """Open path for binary reading, "-" meaning standard input."""
+    match path:
+        case "-":
+            return sys.stdin.buffer
+        case _:
+            return _result.as_result(
+                lambda: open(path, "rb"),
+                _errors.ApplicationErrorFactory.input_file_error(),
+                OSError,
+            )
+
+
+def _parse_tokens(tokens: list[bytes]) -> _result.Result[Sequence[int]]:
+    """Parse ASCII tokens of one block into integers."""
+    return _parser.parse_integer_tokens(
+        [token.decode("ascii", errors="replace") for token in tokens], minimum=0
+    )
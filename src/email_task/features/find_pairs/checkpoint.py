@@ -0,0 +1,271 @@
+"""Periodic checkpoints of a pair enumeration, and resuming from them.
+
+A checkpoint file holds a fixed header followed by the partial sum table as
+little-endian int64 records ``sum, count, i0, j0, i1, j1, ...``. The header
+records the input length, the next outer index to enumerate, the number of
+int64 values that follow and a BLAKE2b digest of the input, so a checkpoint is
+never applied to a different array. Files are written next to their final
+path and renamed over it, so a crash mid-write leaves the previous checkpoint
+intact.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import sys
+import time
+from array import array as typed_array
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import errors as _errors
+from email_task.shared import metrics as _metrics
+from email_task.shared import result as _result
+from email_task.shared import shared_array as _shared_array
+
+if TYPE_CHECKING:
+    from email_task.core.types import MetricsSink
+    from email_task.shared import domain as _domain
+
+MAGIC = b"ETCKPT01"
+"""File prefix identifying the checkpoint format and its version."""
+
+HEADER = struct.Struct("<8sQQQ32s")
+"""Magic, input length, next outer index, int64 values that follow, digest."""
+
+
+@dataclass(frozen=True, slots=True)
+class Checkpoint:
+    """Enumeration state: every pair with an outer index below next_index."""
+
+    next_index: int
+    table: dict[int, list[int]]
+    """Flat ``[i0, j0, i1, j1, ...]`` index pairs per sum, in (i, j) order."""
+
+
+def fingerprint(array: Sequence[int]) -> bytes:
+    """Return the digest tying a checkpoint to its input.
+
+    Args:
+        array: Input whose values fit in an int64.
+    """
+    return hashlib.blake2b(_to_little_endian(array).tobytes(), digest_size=32).digest()
+
+
+def write_checkpoint(
+    path: Path, digest: bytes, size: int, checkpoint: Checkpoint
+) -> None:
+    """Atomically replace path with the given state.
+
+    Records are streamed one sum at a time, so writing needs no second copy
+    of the table.
+
+    Args:
+        path: Checkpoint file to replace.
+        digest: Fingerprint of the input.
+        size: Length of the input.
+        checkpoint: State to persist.
+
+    Raises:
+        OSError: If the file cannot be written or renamed.
+    """
+    table = checkpoint.table
+    value_count = sum(2 + len(flat_pairs) for flat_pairs in table.values())
+    partial_path = _partial_path(path)
+    with partial_path.open("wb") as stream:
+        stream.write(
+            HEADER.pack(MAGIC, size, checkpoint.next_index, value_count, digest)
+        )
+        for pair_sum, flat_pairs in table.items():
+            _to_little_endian((pair_sum, len(flat_pairs) // 2)).tofile(stream)
+            _to_little_endian(flat_pairs).tofile(stream)
+        stream.flush()
+        os.fsync(stream.fileno())
+    os.replace(partial_path, path)
+
+
+def read_checkpoint(
+    path: Path, digest: bytes, size: int
+) -> _result.Result[Checkpoint | None]:
+    """Load the state saved for this input.
+
+    Args:
+        path: Checkpoint file.
+        digest: Fingerprint of the input being resumed.
+        size: Length of the input being resumed.
+
+    Returns:
+        Result containing the saved state, None when no checkpoint exists, or
+        a checkpoint error for unreadable, corrupt or foreign files.
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError:
+        return _errors.ApplicationErrorFactory.checkpoint_error()
+    if len(data) < HEADER.size:
+        return _errors.ApplicationErrorFactory.checkpoint_error()
+    magic, saved_size, next_index, value_count, saved_digest = HEADER.unpack_from(data)
+    body = data[HEADER.size :]
+    if (
+        magic != MAGIC
+        or saved_size != size
+        or saved_digest != digest
+        or next_index > size
+        or len(body) != value_count * 8
+    ):
+        return _errors.ApplicationErrorFactory.checkpoint_error()
+
+    records = typed_array("q")
+    records.frombytes(body)
+    if sys.byteorder == "big":
+        records.byteswap()
+    table: dict[int, list[int]] = {}
+    offset = 0
+    while offset < len(records):
+        pair_sum, pair_count = records[offset], records[offset + 1]
+        table[pair_sum] = records[offset + 2 : offset + 2 + 2 * pair_count].tolist()
+        offset += 2 + 2 * pair_count
+    return Checkpoint(next_index, table)
+
+
+class CheckpointingStrategy:
+    """Hash grouping that saves its state periodically and can resume from it.
+
+    After each outer index the clock is read; once interval seconds have passed
+    since the last save, the next outer index and the whole partial table are
+    written. A resumed run continues at the saved index with the saved table,
+    so its groups, and their pair order, equal those of an uninterrupted run.
+    The file is removed when the enumeration completes.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        interval: float = 60.0,
+        resume: bool = False,
+        metrics: MetricsSink | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            path: Checkpoint file; its directory must exist.
+            interval: Minimum seconds between two checkpoint writes.
+            resume: Continue from path when it exists instead of starting over.
+            metrics: Optional metrics sink for stage timings and counters.
+            clock: Monotonic clock in seconds, replaceable for testing.
+        """
+        self._path = Path(path)
+        self._interval = interval
+        self._resume = resume
+        self._metrics = metrics
+        self._clock = clock
+
+    def collect_sum_pairs(
+        self, array: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
+        """Find all pairs with the same sum, checkpointing along the way.
+
+        Args:
+            array: Sequence of integers to find pairs in.
+
+        Returns:
+            Result containing SumGroups ordered by sum value, or a value range
+            or checkpoint error.
+        """
+        if array and not _shared_array.SharedInt64Array.fits(array):
+            return _errors.ApplicationErrorFactory.value_range_error()
+        digest = fingerprint(array)
+        saved: _result.Result[Checkpoint | None] = None
+        if self._resume:
+            saved = read_checkpoint(self._path, digest, len(array))
+        match saved:
+            case _result.Error() as error:
+                return error
+            case Checkpoint() as checkpoint:
+                _metrics.gauge(self._metrics, "resumed_at_index", checkpoint.next_index)
+            case None:
+                checkpoint = Checkpoint(0, {})
+        return _result.map(
+            _metrics.timed_call(
+                self._metrics,
+                "group_by_sum",
+                self._continue,
+                (array, digest, checkpoint),
+            ),
+            lambda table: _metrics.timed_call(
+                self._metrics, "filter_valid_groups", self._finish, (array, table)
+            ),
+        )
+
+    def _continue(
+        self, arguments: tuple[Sequence[int], bytes, Checkpoint]
+    ) -> _result.Result[dict[int, list[int]]]:
+        """Enumerate the remaining rows, saving the table every interval."""
+        array, digest, checkpoint = arguments
+        table = checkpoint.table
+        size = len(array)
+        total = size * (size - 1) // 2
+        remaining_rows = size - checkpoint.next_index
+        resumed_pairs = done = total - remaining_rows * (remaining_rows - 1) // 2
+        save_at = self._clock() + self._interval
+        for i in range(checkpoint.next_index, size):
+            _strategies.add_row_pairs(table, array, i, range(i + 1, size))
+            done += size - 1 - i
+            _metrics.progress(self._metrics, done, total)
+            if i + 1 < size and self._clock() >= save_at:
+                match _result.as_result(
+                    partial(self._save, digest, size, Checkpoint(i + 1, table)),
+                    _errors.ApplicationErrorFactory.checkpoint_write_error(),
+                    OSError,
+                ):
+                    case _result.Error() as error:
+                        return error
+                save_at = self._clock() + self._interval
+        _metrics.count(self._metrics, "pairs_generated", done - resumed_pairs)
+        _metrics.count(self._metrics, "distinct_sums", len(table))
+        return table
+
+    def _save(self, digest: bytes, size: int, checkpoint: Checkpoint) -> None:
+        """Write one checkpoint and count it."""
+        _metrics.timed_call(
+            self._metrics,
+            "checkpoint",
+            lambda state: write_checkpoint(self._path, digest, size, state),
+            checkpoint,
+        )
+        _metrics.count(self._metrics, "checkpoints_written")
+
+    def _finish(
+        self, arguments: tuple[Sequence[int], dict[int, list[int]]]
+    ) -> tuple[_domain.SumGroup, ...]:
+        """Build the groups and drop the checkpoint files of the finished run."""
+        array, table = arguments
+        groups = tuple(
+            _strategies.unpack_sum_groups(array, _strategies.pack_sum_groups(table))
+        )
+        self._path.unlink(missing_ok=True)
+        _partial_path(self._path).unlink(missing_ok=True)
+        _metrics.count(self._metrics, "groups_emitted", len(groups))
+        return groups
+
+
+def _partial_path(path: Path) -> Path:
+    """Return the file a checkpoint is written to before the rename."""
+    return path.with_name(path.name + ".tmp")
+
+
+def _to_little_endian(values: Sequence[int]) -> typed_array[int]:
+    """Copy values into a little-endian int64 array."""
+    packed = typed_array("q", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed
@@ -0,0 +1,97 @@
+"""Equal-sum groups of pairs taking one element from each of two arrays."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING
+
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import metrics as _metrics
+from email_task.shared import result as _result
+
+if TYPE_CHECKING:
+    from email_task.core.types import MetricsSink
+    from email_task.shared import domain as _domain
+
+
+class CrossJoinStrategy:
+    """Hash join of A x B on the pair sum, never pairing an array with itself.
+
+    Pairs are reported with indices into the concatenation ``A + B``, so an
+    element of A at i and one of B at j form the pair ``(i, len(A) + j)``. That
+    keeps the Pair/SumGroup shape and its (i, j) ordering unchanged.
+    """
+
+    def __init__(self, metrics: MetricsSink | None = None) -> None:
+        """Initialize with an optional metrics sink for stage timings."""
+        self._metrics = metrics
+
+    def iter_cross_pairs(
+        self, left: Sequence[int], right: Sequence[int]
+    ) -> _result.Result[Iterator[_domain.SumGroup]]:
+        """Find the groups of (a, b) pairs with equal sums, in sum order.
+
+        Index pairs are kept as flat int lists per sum and packed into int64
+        records before any Pair is built, so storage stays compact while all
+        |A| * |B| pairs are joined.
+
+        Args:
+            left: Array A, contributing the left element of each pair.
+            right: Array B, contributing the right element of each pair.
+
+        Returns:
+            Result containing an iterator of SumGroups ordered by sum value.
+        """
+        records = _metrics.timed_call(
+            self._metrics, "group_by_sum", self._join, (left, right)
+        )
+        return _strategies.unpack_sum_groups([*left, *right], records)
+
+    def count_cross_pairs(
+        self, left: Sequence[int], right: Sequence[int]
+    ) -> _result.Result[dict[int, int]]:
+        """Count the (a, b) pairs per sum without listing them.
+
+        Elements are reduced to value counts first, so the work is
+        O(|A| + |B| + distinct(A) * distinct(B)) rather than O(|A| * |B|).
+
+        Args:
+            left: Array A.
+            right: Array B.
+
+        Returns:
+            Result containing pair counts for the non-negative sums shared by
+            at least two pairs, in sum order.
+        """
+        return _metrics.timed_call(
+            self._metrics, "count_by_sum", self._count, (left, right)
+        )
+
+    def _join(self, arrays: tuple[Sequence[int], Sequence[int]]) -> Sequence[int]:
+        """Map every cross sum to its flat index pairs and pack the groups."""
+        left, right = arrays
+        array, offset = [*left, *right], len(left)
+        table: dict[int, list[int]] = {}
+        partners = range(offset, len(array))
+        for i in range(offset):
+            _strategies.add_row_pairs(table, array, i, partners)
+
+        _metrics.count(self._metrics, "pairs_generated", len(left) * len(right))
+        _metrics.count(self._metrics, "distinct_sums", len(table))
+        return _strategies.pack_sum_groups(table)
+
+    def _count(self, arrays: tuple[Sequence[int], Sequence[int]]) -> dict[int, int]:
+        """Convolve the value histograms of both arrays."""
+        left_counts, right_counts = Counter(arrays[0]), Counter(arrays[1])
+        counts: Counter[int] = Counter()
+        for a, left_count in left_counts.items():
+            for b, right_count in right_counts.items():
+                counts[a + b] += left_count * right_count
+
+        _metrics.count(self._metrics, "distinct_sums", len(counts))
+        return {
+            pair_sum: counts[pair_sum]
+            for pair_sum in sorted(counts)
+            if pair_sum >= 0 and counts[pair_sum] >= 2
+        }
@@ -2,11 +2,67 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
 
 from email_task.shared import domain as _domain
+from email_task.shared import errors as _errors
 from email_task.shared import result as _result
 
+NO_PAIRS_MESSAGE = "No pairs with the same sum found."
+"""Line written when the input has no two pairs sharing a sum."""
+
+
+def format_sum_group(sum_group: _domain.SumGroup) -> str:
+    """Format a single sum group as one output line.
+
+    Args:
+        sum_group: SumGroup containing pairs with same sum value.
+
+    Returns:
+        Formatted string representation of the sum group.
+    """
+    pairs_str = " ".join(f"({pair.left}, {pair.right})" for pair in sum_group.pairs)
+    return f"Pairs : {pairs_str} have sum : {sum_group.sum_value}"
+
+
+_TUPLE_NAMES = {2: "Pairs", 3: "Triples", 4: "Quadruples"}
+"""Line prefix per tuple size; other sizes are written as "k-tuples"."""
+
+
+def tuple_kind(size: int) -> str:
+    """Return the plural name of tuples of the given size, e.g. "Triples"."""
+    return _TUPLE_NAMES.get(size, f"{size}-tuples")
+
+
+def format_tuple_group(tuple_group: _domain.TupleGroup) -> str:
+    """Format a group of equal-sum tuples as one output line.
+
+    Pairs are written exactly like format_sum_group.
+
+    Args:
+        tuple_group: TupleGroup containing tuples with same sum value.
+
+    Returns:
+        Line like ``Triples : (1, 2, 6) (1, 3, 5) have sum : 9``.
+    """
+    kind = tuple_kind(len(tuple_group.tuples[0].values))
+    tuples_str = " ".join(
+        f"({', '.join(map(str, item.values))})" for item in tuple_group.tuples
+    )
+    return f"{kind} : {tuples_str} have sum : {tuple_group.sum_value}"
+
+
+def format_sum_group_event(event: _domain.SumGroupEvent) -> str:
+    """Format a sliding-window event as its group line tagged with the index.
+
+    Args:
+        event: Group that formed or grew when the element at position arrived.
+
+    Returns:
+        Line like ``Index 7 : Pairs : (6, 10) (4, 12) have sum : 16``.
+    """
+    return f"Index {event.position} : {format_sum_group(event.group)}"
+
 
 class ConsoleFormatter:
     """Formatter for console output in the required format."""
@@ -16,10 +72,110 @@ class ConsoleFormatter:
     ) -> None:
         """Write the pairs result to console output.
 
+        A deadline error is written as its complete groups followed by the
+        error line naming the last outer index processed.
+
         Args:
             result: Result containing sequence of SumGroups or error.
         """
-        self._print_result(_result.map(result, self._create_output_message))
+        match result:
+            case _errors.DeadlineExceededError(message, groups=groups, last_index=last):
+                for sum_group in groups:
+                    print(self._format_sum_group(sum_group))
+                print(f"Error: {message} Last index processed: {last}.")
+            case _:
+                self._print_result(_result.map(result, self._create_output_message))
+
+    def write_batch_result(
+        self, record: int, result: _result.Result[Sequence[_domain.SumGroup]]
+    ) -> None:
+        """Write one batch record's result after a ``Record N:`` line.
+
+        Args:
+            record: 1-based record number.
+            result: Result containing sequence of SumGroups or error.
+        """
+        print(f"Record {record}:")
+        self.write_pairs_result(result)
+
+    def write_sum_groups(
+        self, result: _result.Result[Iterable[_domain.SumGroup]]
+    ) -> None:
+        """Write sum groups line by line as they are produced.
+
+        Output is identical to write_pairs_result, but no group is kept after
+        its line has been printed.
+
+        Args:
+            result: Result containing an iterable of SumGroups or error.
+        """
+        match result:
+            case _result.Error(message, _):
+                print(f"Error: {message}")
+            case sum_groups:
+                written = False
+                for sum_group in sum_groups:
+                    print(self._format_sum_group(sum_group))
+                    written = True
+                if not written:
+                    print(NO_PAIRS_MESSAGE)
+
+    def write_sum_counts(self, result: _result.Result[Mapping[int, int]]) -> None:
+        """Write one line per sum with the number of pairs sharing it.
+
+        Args:
+            result: Result containing pair counts keyed by sum, or error.
+        """
+        match result:
+            case _result.Error(message, _):
+                print(f"Error: {message}")
+            case counts if not counts:
+                print(NO_PAIRS_MESSAGE)
+            case counts:
+                for pair_sum, pair_count in counts.items():
+                    print(f"Count : {pair_count} pairs have sum : {pair_sum}")
+
+    def write_heavy_sum_estimates(
+        self, result: _result.Result[Sequence[_domain.HeavySumEstimate]]
+    ) -> None:
+        """Write one line per likely heavy sum with its pair count bounds.
+
+        Args:
+            result: Result containing estimates in sum order, or error.
+        """
+        match result:
+            case _result.Error(message, _):
+                print(f"Error: {message}")
+            case estimates if not estimates:
+                print(NO_PAIRS_MESSAGE)
+            case estimates:
+                for estimate in estimates:
+                    print(
+                        f"Sum : {estimate.sum_value} : ~{estimate.estimate} pairs "
+                        f"(between {estimate.lower_bound} and {estimate.upper_bound})"
+                    )
+
+    def write_tuple_groups(
+        self, size: int, result: _result.Result[Iterable[_domain.TupleGroup]]
+    ) -> None:
+        """Write groups of equal-sum k-tuples line by line as they are produced.
+
+        For size 2 the output is identical to write_sum_groups.
+
+        Args:
+            size: Tuple size, naming the tuples when no group is found.
+            result: Result containing an iterable of TupleGroups or error.
+        """
+        match result:
+            case _result.Error(message, _):
+                print(f"Error: {message}")
+            case tuple_groups:
+                written = False
+                for tuple_group in tuple_groups:
+                    print(format_tuple_group(tuple_group))
+                    written = True
+                if not written:
+                    print(f"No {tuple_kind(size).lower()} with the same sum found.")
 
     def _create_output_message(self, sum_groups: Sequence[_domain.SumGroup]) -> str:
         """Create output message from sum groups.
@@ -32,7 +188,7 @@ class ConsoleFormatter:
         """
         match sum_groups:
             case []:
-                return "No pairs with the same sum found."
+                return NO_PAIRS_MESSAGE
             case sequence:
                 return "\n".join(
                     self._format_sum_group(sum_group) for sum_group in sequence
@@ -47,8 +203,7 @@ class ConsoleFormatter:
         Returns:
             Formatted string representation of the sum group.
         """
-        pairs_str = " ".join(f"({pair.left}, {pair.right})" for pair in sum_group.pairs)
-        return f"Pairs : {pairs_str} have sum : {sum_group.sum_value}"
+        return format_sum_group(sum_group)
 
     def _print_result(self, result: _result.Result[str]) -> None:
         """Print the formatted result or error message.
@@ -61,3 +216,26 @@ class ConsoleFormatter:
                 print(f"Error: {message}")
             case output:
                 print(output)
+
+
+class CompactWitnessFormatter:
+    """Formatter printing a one-line answer for --exists mode."""
+
+    def write_witness_result(
+        self, result: _result.Result[_domain.SumWitness | None]
+    ) -> None:
+        """Write "Yes" with the witness pairs, or "No".
+
+        Args:
+            result: Result containing a SumWitness, None, or an error.
+        """
+        match result:
+            case _result.Error(message, _):
+                print(f"Error: {message}")
+            case None:
+                print("No")
+            case _domain.SumWitness(sum_value, first, second):
+                print(
+                    f"Yes : ({first.left}, {first.right}) "
+                    f"({second.left}, {second.right}) have sum : {sum_value}"
+                )
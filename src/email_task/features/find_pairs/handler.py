@@ -2,12 +2,31 @@
 
 from __future__ import annotations
 
-from email_task.core.types import InputReader, OutputWriter, PairFindingStrategy
-from email_task.features.find_pairs import formatter as _formatter
-from email_task.features.find_pairs import parser as _parser
-from email_task.features.find_pairs import strategies as _strategies
+from functools import partial
+from typing import TYPE_CHECKING
+
+from email_task.core import registry as _registry
+from email_task.core.types import StreamingOutputWriter, StreamingPairFindingStrategy
+from email_task.shared import memory as _memory
+from email_task.shared import metrics as _metrics
 from email_task.shared import result as _result
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from email_task.core.types import (
+        CrossPairsWriter,
+        HeavySumWriter,
+        InputReader,
+        MetricsSink,
+        OutputWriter,
+        PairFindingStrategy,
+        TupleGroupWriter,
+        WitnessWriter,
+    )
+    from email_task.features.find_pairs import sketch as _sketch
+    from email_task.shared import domain as _domain
+
 
 class FindPairsHandler:
     """Handler for the complete find pairs feature."""
@@ -17,18 +36,244 @@ class FindPairsHandler:
         parser: InputReader | None = None,
         strategy: PairFindingStrategy | None = None,
         writer: OutputWriter | None = None,
+        metrics: MetricsSink | None = None,
     ) -> None:
-        """Initialize with optional dependencies for testing."""
-        self._parser = parser or _parser.CommandLineParser()
-        self._strategy = strategy or _strategies.IndexBasedStrategy()
-        self._writer = writer or _formatter.ConsoleFormatter()
+        """Initialize with optional dependencies for testing.
+
+        Missing dependencies are resolved through the component registries, so
+        only the default implementations that are actually needed get imported.
+        When a metrics sink is given, the parse, find_pairs and write stages are
+        timed, the input size is counted and the peak RSS is recorded. When both
+        strategy and writer support streaming, groups are written as they are
+        found instead of being collected first.
+        """
+        self._parser = parser or _registry.READERS.create(_registry.DEFAULT_READER)
+        self._strategy = strategy or _registry.STRATEGIES.create(
+            _registry.DEFAULT_STRATEGY
+        )
+        self._writer = writer or _registry.WRITERS.create(_registry.DEFAULT_WRITER)
+        self._metrics = metrics
 
     def execute(self) -> None:
         """Execute the complete find pairs workflow."""
-        # Monadic pipeline: parse -> find_pairs -> output
-        self._writer.write_pairs_result(
-            _result.bind(
-                self._parser.parse_integer_sequence(),
-                self._strategy.collect_sum_pairs,
+        # Monadic pipeline: parse -> find_pairs -> output, each stage timed
+        numbers = _metrics.timed_call(self._metrics, "parse", self._parse, self._parser)
+        match self._strategy, self._writer:
+            case StreamingPairFindingStrategy(), StreamingOutputWriter():
+                groups = _result.bind(numbers, self._iter_sum_groups)
+                _metrics.timed_call(
+                    self._metrics, "write", self._writer.write_sum_groups, groups
+                )
+            case _:
+                sum_groups = _result.bind(numbers, self._find_pairs)
+                _metrics.timed_call(
+                    self._metrics, "write", self._writer.write_pairs_result, sum_groups
+                )
+        _metrics.gauge(self._metrics, "peak_rss_bytes", _memory.peak_rss_bytes())
+
+    def _parse(self, parser: InputReader) -> _result.Result[Sequence[int]]:
+        """Parse the input and count its size."""
+        return _result.map(parser.parse_integer_sequence(), self._count_input)
+
+    def _count_input(self, numbers: Sequence[int]) -> Sequence[int]:
+        """Report the number of parsed elements to the metrics sink."""
+        _metrics.count(self._metrics, "input_size", len(numbers))
+        return numbers
+
+    def _find_pairs(
+        self, numbers: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
+        """Run the strategy on the parsed numbers."""
+        return _metrics.timed_call(
+            self._metrics, "find_pairs", self._strategy.collect_sum_pairs, numbers
+        )
+
+    def _iter_sum_groups(
+        self, numbers: Sequence[int]
+    ) -> _result.Result[Iterator[_domain.SumGroup]]:
+        """Start the streaming strategy; grouping continues in the write stage."""
+        return _metrics.timed_call(
+            self._metrics, "find_pairs", self._strategy.iter_sum_groups, numbers
+        )
+
+
+class ExistsHandler:
+    """Handler answering whether any sum is shared by two pairs."""
+
+    def __init__(
+        self,
+        parser: InputReader | None = None,
+        writer: WitnessWriter | None = None,
+        metrics: MetricsSink | None = None,
+    ) -> None:
+        """Initialize with optional dependencies for testing.
+
+        Args:
+            parser: Input reader, defaults to the registry default reader.
+            writer: Witness writer, defaults to the compact console formatter.
+            metrics: Optional metrics sink; the parse and find_witness stages
+                are timed.
+        """
+        from email_task.features.find_pairs import formatter as _formatter
+        from email_task.features.find_pairs import strategies as _strategies
+
+        self._parser = parser or _registry.READERS.create(_registry.DEFAULT_READER)
+        self._checker = _strategies.PigeonholeExistenceCheck(metrics)
+        self._writer = writer or _formatter.CompactWitnessFormatter()
+        self._metrics = metrics
+
+    def execute(self) -> None:
+        """Execute the parse -> find_witness -> output workflow."""
+        numbers = _metrics.timed_call(
+            self._metrics, "parse", _parse_input, self._parser
+        )
+        witness = _result.bind(numbers, self._find_witness)
+        self._writer.write_witness_result(witness)
+
+    def _find_witness(
+        self, numbers: Sequence[int]
+    ) -> _result.Result[_domain.SumWitness | None]:
+        """Run the existence check on the parsed numbers."""
+        return _metrics.timed_call(
+            self._metrics, "find_witness", self._checker.find_witness, numbers
+        )
+
+
+class FindTuplesHandler:
+    """Handler listing groups of k-tuples that share a sum."""
+
+    def __init__(
+        self,
+        size: int,
+        parser: InputReader | None = None,
+        writer: TupleGroupWriter | None = None,
+        metrics: MetricsSink | None = None,
+    ) -> None:
+        """Initialize with optional dependencies for testing.
+
+        Args:
+            size: Number of elements per tuple, k.
+            parser: Input reader, defaults to the registry default reader.
+            writer: Tuple group writer, defaults to the console formatter.
+            metrics: Optional metrics sink; the parse and write stages are timed
+                and tuples and groups are counted.
+        """
+        from email_task.features.find_pairs import formatter as _formatter
+        from email_task.features.find_pairs import strategies as _strategies
+
+        self._size = size
+        self._parser = parser or _registry.READERS.create(_registry.DEFAULT_READER)
+        self._strategy = _strategies.TupleFindingStrategy(size, metrics)
+        self._writer = writer or _formatter.ConsoleFormatter()
+        self._metrics = metrics
+
+    def execute(self) -> None:
+        """Execute the parse -> find_tuples -> output workflow, streaming groups."""
+        numbers = _metrics.timed_call(
+            self._metrics, "parse", _parse_input, self._parser
+        )
+        tuple_groups = _result.bind(numbers, self._strategy.iter_sum_tuples)
+        _metrics.timed_call(
+            self._metrics,
+            "write",
+            partial(self._writer.write_tuple_groups, self._size),
+            tuple_groups,
+        )
+
+
+class CrossPairsHandler:
+    """Handler listing or counting equal-sum pairs across two arrays."""
+
+    def __init__(
+        self,
+        left_parser: InputReader,
+        right_parser: InputReader,
+        count_only: bool = False,
+        writer: CrossPairsWriter | None = None,
+        metrics: MetricsSink | None = None,
+    ) -> None:
+        """Initialize with the readers of both arrays.
+
+        Args:
+            left_parser: Reader of array A.
+            right_parser: Reader of array B.
+            count_only: Report pair counts per sum instead of the pairs.
+            writer: Output writer, defaults to the console formatter.
+            metrics: Optional metrics sink; the parse, join and write stages
+                are timed.
+        """
+        from email_task.features.find_pairs import cross as _cross
+        from email_task.features.find_pairs import formatter as _formatter
+
+        self._left_parser = left_parser
+        self._right_parser = right_parser
+        self._count_only = count_only
+        self._strategy = _cross.CrossJoinStrategy(metrics)
+        self._writer = writer or _formatter.ConsoleFormatter()
+        self._metrics = metrics
+
+    def execute(self) -> None:
+        """Execute the parse -> join -> output workflow."""
+        arrays = _result.bind(
+            _metrics.timed_call(
+                self._metrics, "parse", _parse_input, self._left_parser
+            ),
+            lambda left: _result.map(
+                _parse_input(self._right_parser), lambda right: (left, right)
+            ),
+        )
+        if self._count_only:
+            counts = _result.bind(
+                arrays, lambda pair: self._strategy.count_cross_pairs(*pair)
             )
+            self._writer.write_sum_counts(counts)
+            return
+        groups = _result.bind(
+            arrays, lambda pair: self._strategy.iter_cross_pairs(*pair)
         )
+        _metrics.timed_call(
+            self._metrics, "write", self._writer.write_sum_groups, groups
+        )
+
+
+class HeavySumEstimateHandler:
+    """Handler reporting likely heavy sums from one sketching pass."""
+
+    def __init__(
+        self,
+        parser: InputReader | None = None,
+        strategy: _sketch.HeavySumStrategy | None = None,
+        writer: HeavySumWriter | None = None,
+        metrics: MetricsSink | None = None,
+    ) -> None:
+        """Initialize with optional dependencies for testing.
+
+        Args:
+            parser: Input reader, defaults to the registry default reader.
+            strategy: Configured heavy-sum strategy, defaults to min_pairs=2.
+            writer: Estimate writer, defaults to the console formatter.
+            metrics: Optional metrics sink; the parse, sketch and write stages
+                are timed.
+        """
+        from email_task.features.find_pairs import formatter as _formatter
+        from email_task.features.find_pairs import sketch as _sketch
+
+        self._parser = parser or _registry.READERS.create(_registry.DEFAULT_READER)
+        self._strategy = strategy or _sketch.HeavySumStrategy(metrics)
+        self._writer = writer or _formatter.ConsoleFormatter()
+        self._metrics = metrics
+
+    def execute(self) -> None:
+        """Execute the parse -> sketch -> output workflow without verification."""
+        numbers = _metrics.timed_call(
+            self._metrics, "parse", _parse_input, self._parser
+        )
+        estimates = _result.bind(numbers, self._strategy.estimate_heavy_sums)
+        _metrics.timed_call(
+            self._metrics, "write", self._writer.write_heavy_sum_estimates, estimates
+        )
+
+
+def _parse_input(parser: InputReader) -> _result.Result[Sequence[int]]:
+    """Read the integer array from parser."""
+    return parser.parse_integer_sequence()
@@ -0,0 +1,273 @@
+"""Persisted, memory-mapped sum index files.
+
+An index file stores the groups of one array so that later processes can look
+sums up without enumerating pairs again. After a fixed header come five
+little-endian columns::
+
+    values  N      int64   the indexed array
+    sums    G      int64   group sums, ascending
+    starts  G + 1  int64   offset of each group's first pair; starts[G] == P
+    left    P      uint32  first index of every pair, grouped by sum
+    right   P      uint32  second index of every pair, grouped by sum
+
+The file is mapped read-only, the sum directory is binary-searched and only
+the pair columns of the returned groups are touched, so a lookup costs
+O(log G + output) and the operating system pages in just what it reads.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array as typed_array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Self
+
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import errors as _errors
+from email_task.shared import metrics as _metrics
+from email_task.shared import result as _result
+from email_task.shared import shared_array as _shared_array
+
+if TYPE_CHECKING:
+    from email_task.core.types import MetricsSink
+    from email_task.shared import domain as _domain
+
+MAGIC = b"ETSIDX01"
+"""File prefix identifying the index format and its version."""
+
+HEADER = struct.Struct("<8sQQQ")
+"""Magic, array length, group count and pair count."""
+
+_MAX_INDEX = 1 << 32
+"""Array positions must fit the uint32 pair columns."""
+
+
+@dataclass(frozen=True, slots=True)
+class SumIndexHeader:
+    """Dimensions of an index file."""
+
+    size: int
+    """Length of the indexed array."""
+    groups: int
+    pairs: int
+    """Pairs over all groups."""
+
+    def file_size(self) -> int:
+        """Return the exact byte length of a file with these dimensions."""
+        return HEADER.size + 8 * (self.size + 2 * self.groups + 1) + 8 * self.pairs
+
+
+class SumIndexFile:
+    """Read-only view of an index file answering lookups by binary search.
+
+    Groups are built on demand from the mapped columns; nothing but the
+    header is read when the file is opened. Close the file, or use it as a
+    context manager, to release the mapping.
+    """
+
+    def __init__(self, mapping: mmap.mmap, header: SumIndexHeader) -> None:
+        """Wrap a mapping whose length was checked against its header.
+
+        Args:
+            mapping: Read-only mapping of the whole file.
+            header: Dimensions read from the file.
+        """
+        self.header = header
+        self._mapping = mapping
+        offset = HEADER.size
+        self._values, offset = _column(mapping, offset, "q", header.size)
+        self._sums, offset = _column(mapping, offset, "q", header.groups)
+        self._starts, offset = _column(mapping, offset, "q", header.groups + 1)
+        self._left, offset = _column(mapping, offset, "I", header.pairs)
+        self._right, _ = _column(mapping, offset, "I", header.pairs)
+
+    def __len__(self) -> int:
+        """Return the number of groups."""
+        return self.header.groups
+
+    def __enter__(self) -> Self:
+        """Return the open index."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Release the mapping."""
+        self.close()
+
+    def close(self) -> None:
+        """Release the mapping; groups already returned stay valid."""
+        columns = (self._values, self._sums, self._starts, self._left, self._right)
+        for column in columns:
+            if isinstance(column, memoryview):
+                column.release()
+        self._mapping.close()
+
+    def lookup(self, sum_value: int) -> _domain.SumGroup | None:
+        """Return the group of one sum.
+
+        Args:
+            sum_value: Sum to look up.
+
+        Returns:
+            The SumGroup, or None when fewer than two pairs have that sum.
+        """
+        position = bisect_left(self._sums, sum_value)
+        if position == len(self._sums) or self._sums[position] != sum_value:
+            return None
+        return self._group(position)
+
+    def iter_range(self, low: int, high: int) -> Iterator[_domain.SumGroup]:
+        """Yield the groups whose sum lies in [low, high], in sum order.
+
+        Args:
+            low: Smallest sum included.
+            high: Largest sum included.
+
+        Returns:
+            Lazy iterator of SumGroups.
+        """
+        start = bisect_left(self._sums, low)
+        stop = bisect_right(self._sums, high)
+        return map(self._group, range(start, max(start, stop)))
+
+    def iter_sum_groups_after(self, after: int | None) -> Iterator[_domain.SumGroup]:
+        """Yield groups whose sum is greater than after, in sum order.
+
+        Args:
+            after: Exclusive lower bound on the sum; None starts at the lowest.
+
+        Returns:
+            Lazy iterator of SumGroups.
+        """
+        start = 0 if after is None else bisect_right(self._sums, after)
+        return map(self._group, range(start, len(self._sums)))
+
+    def _group(self, position: int) -> _domain.SumGroup:
+        """Build the group at a directory position from its pair columns."""
+        start, stop = self._starts[position], self._starts[position + 1]
+        flat_pairs = [0] * (2 * (stop - start))
+        flat_pairs[0::2] = self._left[start:stop]
+        flat_pairs[1::2] = self._right[start:stop]
+        records = [self._sums[position], stop - start, *flat_pairs]
+        return next(_strategies.unpack_sum_groups(self._values, records))
+
+
+def write_sum_index(
+    path: str | Path, array: Sequence[int], metrics: MetricsSink | None = None
+) -> _result.Result[SumIndexHeader]:
+    """Group the pairs of array by sum and atomically write them as an index.
+
+    Args:
+        path: Index file to create or replace; its directory must exist.
+        array: Integers to index.
+        metrics: Optional metrics sink; grouping is timed as "index" and
+            writing as "write_index".
+
+    Returns:
+        Result containing the dimensions written, or a value range or index
+        write error.
+    """
+    if array and not _shared_array.SharedInt64Array.fits(array):
+        return _errors.ApplicationErrorFactory.value_range_error()
+    if len(array) > _MAX_INDEX:
+        return _errors.ApplicationErrorFactory.value_range_error()
+    records = _metrics.timed_call(
+        metrics, "index", _strategies.pack_all_sum_groups, array
+    )
+    header = _result.as_result(
+        lambda: _metrics.timed_call(
+            metrics, "write_index", partial(_write_records, Path(path), array), records
+        ),
+        _errors.ApplicationErrorFactory.index_write_error(),
+        OSError,
+    )
+    return _result.map(header, partial(_count, metrics))
+
+
+def open_sum_index(path: str | Path) -> _result.Result[SumIndexFile]:
+    """Map an index file for lookups.
+
+    Args:
+        path: File written by write_sum_index.
+
+    Returns:
+        Result containing the open index, or an index file error for
+        missing, truncated or foreign files.
+    """
+    try:
+        with open(path, "rb") as stream:
+            prefix = stream.read(HEADER.size)
+            if len(prefix) < HEADER.size:
+                return _errors.ApplicationErrorFactory.index_file_error()
+            mapping = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return _errors.ApplicationErrorFactory.index_file_error()
+    magic, size, groups, pairs = HEADER.unpack(prefix)
+    header = SumIndexHeader(size, groups, pairs)
+    if magic != MAGIC or len(mapping) != header.file_size():
+        mapping.close()
+        return _errors.ApplicationErrorFactory.index_file_error()
+    return SumIndexFile(mapping, header)
+
+
+def _write_records(
+    path: Path, array: Sequence[int], records: typed_array[int]
+) -> SumIndexHeader:
+    """Split packed records into columns and write them next to path, then rename.
+
+    Raises:
+        OSError: If the file cannot be written or renamed.
+    """
+    sums, starts = typed_array("q"), typed_array("q", [0])
+    left, right = typed_array("I"), typed_array("I")
+    offset = 0
+    while offset < len(records):
+        sums.append(records[offset])
+        flat_pairs = records[offset + 2 : offset + 2 + 2 * records[offset + 1]]
+        left.fromlist(flat_pairs[0::2].tolist())
+        right.fromlist(flat_pairs[1::2].tolist())
+        starts.append(len(left))
+        offset += 2 + len(flat_pairs)
+    header = SumIndexHeader(len(array), len(sums), len(left))
+
+    partial_path = path.with_name(path.name + ".tmp")
+    with partial_path.open("wb") as stream:
+        stream.write(HEADER.pack(MAGIC, header.size, header.groups, header.pairs))
+        for column in (typed_array("q", array), sums, starts, left, right):
+            if sys.byteorder == "big":
+                column.byteswap()
+            column.tofile(stream)
+        stream.flush()
+        os.fsync(stream.fileno())
+    os.replace(partial_path, path)
+    return header
+
+
+def _count(metrics: MetricsSink | None, header: SumIndexHeader) -> SumIndexHeader:
+    """Record the dimensions of a written index."""
+    _metrics.count(metrics, "groups_emitted", header.groups)
+    _metrics.count(metrics, "pairs_indexed", header.pairs)
+    return header
+
+
+def _column(
+    mapping: mmap.mmap, offset: int, code: str, length: int
+) -> tuple[Sequence[int], int]:
+    """Return one column of the file and the offset following it.
+
+    Little-endian hosts view the mapping in place; big-endian hosts get a
+    byte-swapped copy.
+    """
+    itemsize = typed_array(code).itemsize
+    end = offset + length * itemsize
+    if sys.byteorder == "little":
+        return memoryview(mapping)[offset:end].cast(code), end
+    column = typed_array(code, mapping[offset:end])
+    column.byteswap()
+    return column, end
@@ -0,0 +1,153 @@
+"""Cursor-based pages over sum-ordered groups."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from array import array as typed_array
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import domain as _domain
+from email_task.shared import errors as _errors
+from email_task.shared import metrics as _metrics
+from email_task.shared import result as _result
+
+if TYPE_CHECKING:
+    from email_task.core.types import MetricsSink, SumGroupSource
+
+_CURSOR_PREFIX = "sum:"
+"""Tag distinguishing cursor tokens from arbitrary base64 text."""
+
+
+@dataclass(frozen=True, slots=True)
+class SumGroupPage:
+    """Up to one page of groups in sum order and the cursor of the next page."""
+
+    groups: tuple[_domain.SumGroup, ...]
+    next_cursor: str | None
+    """Opaque token for the following page; None once the groups run out."""
+
+
+class SumGroupIndex:
+    """Groups of one array computed once, packed, and addressable by sum.
+
+    The groups are stored as the int64 records of pack_sum_groups with a
+    sorted sum directory beside them, so a page binary-searches its first sum
+    and only builds Pair objects for the groups it returns.
+    """
+
+    def __init__(
+        self, array: Sequence[int], metrics: MetricsSink | None = None
+    ) -> None:
+        """Enumerate every pair of array once and pack the resulting groups.
+
+        Args:
+            array: Integers to index; kept by reference to build pairs later.
+            metrics: Optional metrics sink; the build is timed as "index".
+        """
+        self._array = array
+        self._records = _metrics.timed_call(
+            metrics, "index", _strategies.pack_all_sum_groups, array
+        )
+        self._sums = typed_array("q")
+        self._offsets = typed_array("q")
+        offset = 0
+        while offset < len(self._records):
+            self._sums.append(self._records[offset])
+            self._offsets.append(offset)
+            offset += 2 + 2 * self._records[offset + 1]
+        _metrics.count(metrics, "groups_emitted", len(self._sums))
+
+    def __len__(self) -> int:
+        """Return the number of groups."""
+        return len(self._sums)
+
+    def iter_sum_groups_after(self, after: int | None) -> Iterator[_domain.SumGroup]:
+        """Yield groups whose sum is greater than after, in sum order.
+
+        Args:
+            after: Exclusive lower bound on the sum; None starts at the lowest.
+
+        Returns:
+            Lazy iterator of SumGroups.
+        """
+        start = 0 if after is None else bisect_right(self._sums, after)
+        if start == len(self._sums):
+            return iter(())
+        records = memoryview(self._records)[self._offsets[start] :]
+        return _strategies.unpack_sum_groups(self._array, records)
+
+
+def paginate(
+    source: SumGroupSource, limit: int, cursor: str | None = None
+) -> _result.Result[SumGroupPage]:
+    """Read one page of groups from source.
+
+    Args:
+        source: Precomputed groups addressable by sum.
+        limit: Maximum number of groups on the page.
+        cursor: next_cursor of the previous page; None for the first page.
+
+    Returns:
+        Result containing the page or a limit or cursor validation error.
+    """
+    if limit < 0:
+        return _errors.ApplicationErrorFactory.invalid_limit_error()
+    return _result.map(
+        decode_cursor(cursor),
+        lambda after: _read_page(source, limit, after, cursor),
+    )
+
+
+def encode_cursor(after: int) -> str:
+    """Create the cursor of the page starting after the given sum.
+
+    Args:
+        after: Last sum already seen.
+
+    Returns:
+        Opaque URL-safe token.
+    """
+    token = f"{_CURSOR_PREFIX}{after}".encode("ascii")
+    return base64.urlsafe_b64encode(token).decode("ascii")
+
+
+def decode_cursor(cursor: str | None) -> _result.Result[int | None]:
+    """Recover the sum a page starts after.
+
+    Args:
+        cursor: Token from encode_cursor, or None for the first page.
+
+    Returns:
+        Result containing the exclusive lower bound, None for the first page.
+    """
+    if cursor is None:
+        return None
+    try:
+        token = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("ascii")
+    except (UnicodeError, binascii.Error):
+        return _errors.ApplicationErrorFactory.invalid_cursor_error()
+    if not token.startswith(_CURSOR_PREFIX):
+        return _errors.ApplicationErrorFactory.invalid_cursor_error()
+    return _result.as_result(
+        lambda: int(token.removeprefix(_CURSOR_PREFIX)),
+        _errors.ApplicationErrorFactory.invalid_cursor_error(),
+        ValueError,
+    )
+
+
+def _read_page(
+    source: SumGroupSource, limit: int, after: int | None, cursor: str | None
+) -> SumGroupPage:
+    """Take limit groups, peeking at one more to know if a next page exists."""
+    groups = tuple(islice(source.iter_sum_groups_after(after), limit + 1))
+    if len(groups) <= limit:
+        return SumGroupPage(groups, None)
+    if not limit:
+        return SumGroupPage((), cursor or encode_cursor(groups[0].sum_value - 1))
+    return SumGroupPage(groups[:limit], encode_cursor(groups[limit - 1].sum_value))
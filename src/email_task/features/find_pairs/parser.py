@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import sys
-from typing import Sequence
+from collections.abc import Sequence
+from pathlib import Path
 
 from email_task.shared import errors as _errors
 from email_task.shared import result as _result
@@ -12,6 +13,10 @@ from email_task.shared import result as _result
 class CommandLineParser:
     """Parser for command line arguments."""
 
+    def __init__(self, argv: Sequence[str] | None = None) -> None:
+        """Initialize with optional argv, defaulting to sys.argv at parse time."""
+        self._argv = argv
+
     def parse_integer_sequence(self) -> _result.Result[Sequence[int]]:
         """Parse command line arguments into integer sequence.
 
@@ -21,19 +26,75 @@ class CommandLineParser:
         Raises:
             Any exception other than ValueError and TypeError will propagate.
         """
-        match sys.argv:
+        match sys.argv if self._argv is None else self._argv:
             case [_, *args]:
-                return _result.bind(
-                    _result.as_result(
-                        lambda: tuple(int(arg) for arg in args),
-                        _errors.ApplicationErrorFactory.invalid_argument_error(),
-                        (ValueError, TypeError),
-                    ),
-                    lambda values: values
-                    if len(values) >= 2
-                    else _errors.ApplicationErrorFactory.min_arg_error(),
-                )
+                return parse_integer_tokens(args)
             case [_]:
                 return _errors.ApplicationErrorFactory.no_arguments_error()
             case _:
                 return _errors.ApplicationErrorFactory.min_arg_error()
+
+
+class TextFileParser:
+    """Parser for one array stored in a text file, or stdin for "-"."""
+
+    def __init__(self, path: str, minimum: int = 2) -> None:
+        """Initialize with the file path and the required number of elements.
+
+        Args:
+            path: File whose values are separated by whitespace and/or commas.
+            minimum: Required number of elements.
+        """
+        self._path = path
+        self._minimum = minimum
+
+    def parse_integer_sequence(self) -> _result.Result[Sequence[int]]:
+        """Read the whole file and parse its integers.
+
+        Returns:
+            Result containing the integers or an input, parse or size error.
+        """
+        return _result.bind(
+            self._read_text(),
+            lambda text: parse_integer_tokens(
+                text.replace(",", " ").split(), minimum=self._minimum
+            ),
+        )
+
+    def _read_text(self) -> _result.Result[str]:
+        """Read the configured file or standard input."""
+        match self._path:
+            case "-":
+                return sys.stdin.read()
+            case path:
+                return _result.as_result(
+                    lambda: Path(path).read_text(encoding="utf-8"),
+                    _errors.ApplicationErrorFactory.input_file_error(),
+                    (OSError, UnicodeDecodeError),
+                )
+
+
+def parse_integer_tokens(
+    tokens: Sequence[str], *, minimum: int = 2
+) -> _result.Result[Sequence[int]]:
+    """Parse textual tokens into an integer sequence of at least two elements.
+
+    Args:
+        tokens: Sequence of strings, one integer per token.
+        minimum: Required number of elements; 0 for chunks of a larger input.
+
+    Returns:
+        Result containing tuple of integers or validation/parse error.
+    """
+    return _result.bind(
+        _result.as_result(
+            lambda: tuple(int(token) for token in tokens),
+            _errors.ApplicationErrorFactory.invalid_argument_error(),
+            (ValueError, TypeError),
+        ),
+        lambda values: (
+            values
+            if len(values) >= minimum
+            else _errors.ApplicationErrorFactory.min_arg_error()
+        ),
+    )
@@ -0,0 +1,439 @@
+"""Cost-based planner choosing a pair finding engine per input."""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import partial
+
+from email_task.core import registry as _registry
+from email_task.core.types import (
+    MetricsSink,
+    PairFindingStrategy,
+    StreamingPairFindingStrategy,
+)
+from email_task.shared import concurrency as _concurrency
+from email_task.shared import domain as _domain
+from email_task.shared import errors as _errors
+from email_task.shared import memory as _memory
+from email_task.shared import metrics as _metrics
+from email_task.shared import result as _result
+
+DENSE_MAX_BUCKETS = 1 << 26
+"""Largest sum range the dense engine will preallocate buckets for."""
+
+_PACKED_PAIR_BYTES = 16
+"""Size of one packed (i, j) int64 index pair sent back by a worker process."""
+
+_PACKED_GROUP_BYTES = 16
+"""Size of the packed (sum, count) int64 header of one group record."""
+
+_IPC_BYTE_COST = 0.05
+"""Cost of pickling, piping and copying one byte between processes."""
+
+
+def _shared_array_bound() -> int:
+    """Return the value bound of the shared int64 transport, imported lazily."""
+    from email_task.shared import shared_array as _shared_array
+
+    return _shared_array.SAFE_VALUE_BOUND
+
+
+@dataclass(frozen=True, slots=True)
+class InputProfile:
+    """Cheap O(n) statistics of an input array."""
+
+    size: int
+    distinct_count: int
+    min_value: int
+    max_value: int
+    max_multiplicity: int = 1
+    """Occurrences of the most repeated value."""
+
+    @property
+    def pair_count(self) -> int:
+        """Number of index pairs, n(n-1)/2."""
+        return self.size * (self.size - 1) // 2
+
+    @property
+    def sum_range(self) -> int:
+        """Number of possible pair sums, 2*max - 2*min + 1."""
+        return 2 * (self.max_value - self.min_value) + 1 if self.size else 0
+
+    @property
+    def has_negative(self) -> bool:
+        """Whether any value is negative."""
+        return self.min_value < 0
+
+    @property
+    def estimated_distinct_sums(self) -> int:
+        """Upper bound on distinct pair sums."""
+        return min(self.pair_count, self.sum_range)
+
+    @property
+    def max_group_pairs(self) -> int:
+        """Upper bound on the pairs sharing one sum.
+
+        For a fixed sum each element pairs with at most max_multiplicity
+        partners, so no group exceeds n * max_multiplicity / 2 pairs.
+        """
+        return min(self.pair_count, self.size * self.max_multiplicity // 2)
+
+    @property
+    def estimated_grouped_pairs(self) -> int:
+        """Pairs expected to land in reported groups, at most pair_count.
+
+        Pair sums are modelled as spread uniformly over sum_range, so a pair
+        is grouped when any other pair hits its sum, with probability
+        1 - exp(-(pairs - 1) / sum_range). A repeated value raises the
+        estimate to the pairs it alone guarantees: every other element pairs
+        with each of its copies at one shared sum.
+        """
+        pairs = self.pair_count
+        if pairs < 2:
+            return 0
+        spread = -pairs * math.expm1(-(pairs - 1) / self.sum_range)
+        repeated = 0
+        if self.max_multiplicity > 1:
+            repeated = self.max_multiplicity * (self.size - self.max_multiplicity)
+        return min(pairs, max(math.ceil(spread), repeated))
+
+
+@dataclass(frozen=True, slots=True)
+class EngineEstimate:
+    """Estimated cost and peak memory of running one engine."""
+
+    engine: str
+    cost: float
+    memory_bytes: int
+    options: Mapping[str, object] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionPlan:
+    """Chosen engine together with the profile and rejected alternatives."""
+
+    profile: InputProfile
+    chosen: EngineEstimate
+    candidates: tuple[EngineEstimate, ...]
+    memory_budget: int | None
+
+    @property
+    def engine(self) -> str:
+        """Registry name of the chosen engine."""
+        return self.chosen.engine
+
+    def describe(self) -> str:
+        """Render the plan for --explain output."""
+        profile = self.profile
+        budget = "unbounded" if self.memory_budget is None else f"{self.memory_budget}B"
+        lines = [
+            (
+                f"Plan : engine={self.engine} cost={self.chosen.cost:.3g} "
+                f"memory={self.chosen.memory_bytes}B budget={budget}"
+            ),
+            (
+                f"Input : n={profile.size} distinct={profile.distinct_count} "
+                f"min={profile.min_value} max={profile.max_value} "
+                f"negative={profile.has_negative} pairs={profile.pair_count}"
+            ),
+        ]
+        lines.extend(
+            f"Candidate : engine={estimate.engine} cost={estimate.cost:.3g} "
+            f"memory={estimate.memory_bytes}B"
+            for estimate in self.candidates
+        )
+        return "\n".join(lines)
+
+
+def profile_input(numbers: Sequence[int]) -> InputProfile:
+    """Scan numbers once for size, distinct count, multiplicity, range and sign.
+
+    Args:
+        numbers: Sequence of integers to profile.
+
+    Returns:
+        InputProfile of the sequence; an empty sequence has a zero range.
+    """
+    if not numbers:
+        return InputProfile(size=0, distinct_count=0, min_value=0, max_value=0)
+    occurrences = Counter(numbers)
+    return InputProfile(
+        size=len(numbers),
+        distinct_count=len(occurrences),
+        min_value=min(numbers),
+        max_value=max(numbers),
+        max_multiplicity=max(occurrences.values()),
+    )
+
+
+def _estimate_index(profile: InputProfile, memory_budget: int | None) -> EngineEstimate:
+    """IndexBasedStrategy: a Pair per index pair plus a full sort of them."""
+    pairs = profile.pair_count
+    return EngineEstimate(
+        engine="index",
+        cost=pairs * (4.0 + 0.2 * math.log2(pairs + 1)),
+        memory_bytes=pairs * _memory.PAIR_OBJECT_BYTES,
+    )
+
+
+def _estimate_hash(profile: InputProfile, memory_budget: int | None) -> EngineEstimate:
+    """HashGroupingStrategy: one dict append per pair, sort of distinct sums."""
+    pairs = profile.pair_count
+    sums = profile.estimated_distinct_sums
+    return EngineEstimate(
+        engine="hash",
+        cost=pairs * 1.0 + sums * 0.2 * math.log2(sums + 1),
+        memory_bytes=pairs * _memory.INDEX_PAIR_BYTES
+        + sums * _memory.SUM_ENTRY_BYTES
+        + profile.estimated_grouped_pairs * _memory.PAIR_OBJECT_BYTES,
+    )
+
+
+def _estimate_dense(
+    profile: InputProfile, memory_budget: int | None
+) -> EngineEstimate | None:
+    """DenseBucketStrategy: list indexing per pair, one walk over the range.
+
+    Only applicable when the bucket array stays small relative to the pairs,
+    otherwise walking mostly empty buckets costs more than hashing.
+    """
+    buckets = profile.sum_range
+    if buckets > DENSE_MAX_BUCKETS or buckets > 4 * profile.pair_count + 1024:
+        return None
+    pairs = profile.pair_count
+    sums = profile.estimated_distinct_sums
+    return EngineEstimate(
+        engine="dense",
+        cost=pairs * 0.8 + buckets * 0.05,
+        memory_bytes=buckets * _memory.BUCKET_SLOT_BYTES
+        + pairs * _memory.INDEX_PAIR_BYTES
+        + sums * (_memory.SUM_ENTRY_BYTES - _memory.BUCKET_SLOT_BYTES)
+        + profile.estimated_grouped_pairs * _memory.PAIR_OBJECT_BYTES,
+    )
+
+
+def _estimate_threads(
+    profile: InputProfile, memory_budget: int | None
+) -> EngineEstimate | None:
+    """ParallelHashStrategy: hash grouping split across free-threaded workers.
+
+    Only offered when the GIL is disabled; with it, threads add overhead only.
+    """
+    workers = _concurrency.usable_cpus()
+    if workers == 1 or _concurrency.gil_enabled():
+        return None
+    serial = _estimate_hash(profile, memory_budget)
+    return EngineEstimate(
+        engine="threads",
+        cost=serial.cost * 1.3 / workers + workers * 5_000,
+        memory_bytes=serial.memory_bytes + profile.estimated_distinct_sums * 8,
+    )
+
+
+def _estimate_processes(
+    profile: InputProfile, memory_budget: int | None
+) -> EngineEstimate | None:
+    """ParallelHashStrategy in worker processes over a shared int64 input.
+
+    Pays a fixed start-up cost per worker, and every grouped pair crosses
+    the process boundary once as a packed record, so it only wins on large
+    inputs with several CPUs.
+    """
+    workers = _concurrency.usable_cpus()
+    if workers == 1 or profile.size < 2:
+        return None
+    bound = _shared_array_bound()
+    if not (-bound <= profile.min_value and profile.max_value < bound):
+        return None
+    serial = _estimate_hash(profile, memory_budget)
+    grouped = profile.estimated_grouped_pairs
+    transfer_bytes = (
+        grouped * _PACKED_PAIR_BYTES
+        + min(profile.estimated_distinct_sums, grouped // 2) * _PACKED_GROUP_BYTES
+    )
+    return EngineEstimate(
+        engine="processes",
+        cost=serial.cost * 1.5 / workers
+        + workers * 50_000
+        + transfer_bytes * _IPC_BYTE_COST,
+        memory_bytes=serial.memory_bytes + transfer_bytes,
+    )
+
+
+def _estimate_bounded(
+    profile: InputProfile, memory_budget: int | None
+) -> EngineEstimate | None:
+    """BoundedMemoryStrategy: extra full passes traded for a hard memory cap.
+
+    Only offered under a budget, and only when upper bounds on the candidate
+    sums and on the largest group fit the engine's layout, so an input the
+    engine would give up on part-way is rejected before any work starts. The
+    cost counts one pass per ``sum % P`` class and one per window; the memory
+    is the peak of the counting and window phases.
+    """
+    if memory_budget is None:
+        return None
+    layout = _memory.BoundedLayout.for_budget(memory_budget)
+    pairs = profile.pair_count
+    sums = profile.estimated_distinct_sums
+    candidates = min(sums, pairs // 2)
+    if (
+        layout.table_entries < 1
+        or candidates > layout.candidates
+        or not layout.fits_group(max(2, profile.max_group_pairs))
+    ):
+        return None
+    partitions = layout.partitions(sums)
+    group_bytes = (
+        candidates * _memory.SUM_ENTRY_BYTES
+        + profile.estimated_grouped_pairs * _memory.GROUPED_PAIR_BYTES
+    )
+    windows = max(1, math.ceil(group_bytes / layout.window_bytes))
+    table_bytes = min(-(-sums // partitions), layout.table_entries) * (
+        _memory.SUM_COUNT_BYTES
+    )
+    return EngineEstimate(
+        engine="bounded",
+        cost=pairs * 1.2 * (partitions + windows),
+        memory_bytes=candidates * _memory.CANDIDATE_BYTES
+        + max(table_bytes, min(group_bytes, layout.window_bytes)),
+        options={"memory_budget": memory_budget},
+    )
+
+
+type EngineEstimator = Callable[[InputProfile, int | None], EngineEstimate | None]
+
+ENGINE_ESTIMATORS: dict[str, EngineEstimator] = {
+    "index": _estimate_index,
+    "hash": _estimate_hash,
+    "dense": _estimate_dense,
+    "threads": _estimate_threads,
+    "processes": _estimate_processes,
+    "bounded": _estimate_bounded,
+}
+"""Estimators by strategy registry name, given the profile and memory budget.
+
+Returning None marks the engine as inapplicable to the input.
+"""
+
+IN_PROCESS_ENGINES = ("index", "hash", "dense", "bounded")
+"""Engines running on the calling thread alone, for planners already in a worker."""
+
+
+class StrategyPlanner:
+    """Strategy that profiles the input and delegates to the cheapest engine."""
+
+    def __init__(
+        self,
+        metrics: MetricsSink | None = None,
+        memory_budget: int | None = None,
+        on_plan: Callable[[ExecutionPlan], None] | None = None,
+        engines: Sequence[str] | None = None,
+    ) -> None:
+        """Initialize the planner.
+
+        Args:
+            metrics: Optional metrics sink passed on to the chosen engine.
+            memory_budget: Peak memory in bytes engines should stay within.
+            on_plan: Optional callback receiving every plan, e.g. for --explain.
+            engines: Names of the engines to consider, defaults to every one in
+                ENGINE_ESTIMATORS; IN_PROCESS_ENGINES keeps a planner running
+                inside a worker process from starting threads or processes.
+        """
+        self._metrics = metrics
+        self._memory_budget = memory_budget
+        self._on_plan = on_plan
+        self._engines = tuple(ENGINE_ESTIMATORS) if engines is None else engines
+
+    def plan(self, numbers: Sequence[int]) -> _result.Result[ExecutionPlan]:
+        """Choose the cheapest applicable engine for numbers.
+
+        Engines estimated to exceed the memory budget are never chosen.
+
+        Args:
+            numbers: Sequence of integers that will be processed.
+
+        Returns:
+            Result containing the ExecutionPlan, or a memory budget error when
+            no engine, including the bounded-memory one, fits the budget.
+        """
+        profile = profile_input(numbers)
+        candidates = tuple(
+            estimate
+            for engine in self._engines
+            if (estimate := ENGINE_ESTIMATORS[engine](profile, self._memory_budget))
+            is not None
+        )
+        fitting = [
+            estimate
+            for estimate in candidates
+            if self._memory_budget is None
+            or estimate.memory_bytes <= self._memory_budget
+        ]
+        if not fitting:
+            return _errors.ApplicationErrorFactory.memory_budget_exceeded_error()
+        chosen = min(fitting, key=lambda estimate: estimate.cost)
+        return ExecutionPlan(profile, chosen, candidates, self._memory_budget)
+
+    def collect_sum_pairs(
+        self, numbers: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
+        """Plan the run and find equal-sum groups with the chosen engine.
+
+        Args:
+            numbers: Sequence of integers to find pairs in.
+
+        Returns:
+            Result containing Sequence of SumGroups or validation/processing error.
+        """
+        return _result.bind(
+            self._create_engine(numbers),
+            lambda engine: engine.collect_sum_pairs(numbers),
+        )
+
+    def iter_sum_groups(
+        self, numbers: Sequence[int]
+    ) -> _result.Result[Iterator[_domain.SumGroup]]:
+        """Plan the run and stream equal-sum groups from the chosen engine.
+
+        Engines without native streaming are run to completion first.
+
+        Args:
+            numbers: Sequence of integers to find pairs in.
+
+        Returns:
+            Result containing an iterator of SumGroups ordered by sum value.
+        """
+        return _result.bind(self._create_engine(numbers), partial(_iter, numbers))
+
+    def _create_engine(
+        self, numbers: Sequence[int]
+    ) -> _result.Result[PairFindingStrategy]:
+        """Plan for numbers, report the plan and instantiate the chosen engine."""
+        return _result.map(self.plan(numbers), self._instantiate)
+
+    def _instantiate(self, plan: ExecutionPlan) -> PairFindingStrategy:
+        """Report the plan and create its engine with the plan's options."""
+        if self._on_plan is not None:
+            self._on_plan(plan)
+        _metrics.gauge(
+            self._metrics, "estimated_memory_bytes", plan.chosen.memory_bytes
+        )
+        _metrics.gauge(self._metrics, "memory_budget_bytes", self._memory_budget)
+        return _registry.STRATEGIES.create(
+            plan.engine, metrics=self._metrics, **plan.chosen.options
+        )
+
+
+def _iter(
+    numbers: Sequence[int], engine: PairFindingStrategy
+) -> _result.Result[Iterator[_domain.SumGroup]]:
+    """Iterate an engine's groups, streaming when the engine supports it."""
+    match engine:
+        case StreamingPairFindingStrategy():
+            return engine.iter_sum_groups(numbers)
+        case _:
+            return _result.map(engine.collect_sum_pairs(numbers), iter)
@@ -0,0 +1,238 @@
+"""Approximate heavy-sum detection in bounded memory.
+
+Pair sums are streamed through a count-min sketch, which over-estimates every
+sum's pair count by at most ``e / width * N`` with probability at least
+``1 - exp(-depth)``. Alongside it, a Misra-Gries table tracks the sums that may
+be frequent; it under-estimates by at most ``N / (capacity + 1)``. Here N is the
+number of pairs. Memory is ``width * depth + capacity`` counters, however many
+distinct sums the input has.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING
+
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import domain as _domain
+from email_task.shared import metrics as _metrics
+from email_task.shared import result as _result
+
+if TYPE_CHECKING:
+    from email_task.core.types import MetricsSink
+
+_MERSENNE_PRIME = (1 << 61) - 1
+"""Modulus of the sketch's universal hash family."""
+
+
+class CountMinSketch:
+    """Count-min sketch over integer keys."""
+
+    def __init__(self, width: int, depth: int, seed: int = 0) -> None:
+        """Initialize the counter rows.
+
+        Args:
+            width: Counters per row; error is at most e / width of the total.
+            depth: Number of rows; the bound fails with probability exp(-depth).
+            seed: Seed of the row hash functions.
+        """
+        rng = random.Random(seed)
+        self._width = width
+        self._hashes = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(_MERSENNE_PRIME))
+            for _ in range(depth)
+        ]
+        self._rows = [[0] * width for _ in range(depth)]
+        self.total = 0
+
+    @property
+    def error_bound(self) -> int:
+        """Largest over-estimate that holds with probability 1 - exp(-depth)."""
+        return math.ceil(math.e / self._width * self.total)
+
+    def add(self, key: int) -> None:
+        """Count one occurrence of key."""
+        width = self._width
+        for (multiplier, offset), row in zip(self._hashes, self._rows, strict=True):
+            row[(multiplier * key + offset) % _MERSENNE_PRIME % width] += 1
+        self.total += 1
+
+    def estimate(self, key: int) -> int:
+        """Return an upper estimate of the occurrences of key."""
+        width = self._width
+        return min(
+            row[(multiplier * key + offset) % _MERSENNE_PRIME % width]
+            for (multiplier, offset), row in zip(self._hashes, self._rows, strict=True)
+        )
+
+
+class MisraGries:
+    """Misra-Gries summary keeping at most capacity candidate heavy hitters."""
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty summary.
+
+        Args:
+            capacity: Number of counters; any key seen more than
+                total / (capacity + 1) times is guaranteed to be kept.
+        """
+        self._capacity = capacity
+        self.counters: dict[int, int] = {}
+        self.total = 0
+
+    @property
+    def error_bound(self) -> int:
+        """Largest under-estimate of any kept key's count."""
+        return self.total // (self._capacity + 1)
+
+    def add(self, key: int) -> None:
+        """Count one occurrence of key."""
+        counters = self.counters
+        self.total += 1
+        if key in counters:
+            counters[key] += 1
+        elif len(counters) < self._capacity:
+            counters[key] = 1
+        else:
+            for kept in list(counters):
+                if counters[kept] == 1:
+                    del counters[kept]
+                else:
+                    counters[kept] -= 1
+
+
+class HeavySumStrategy:
+    """Strategy reporting only the sums with at least min_pairs pairs.
+
+    A first pass fills the sketch and the heavy-hitter table. As a pair
+    finding strategy it then verifies the candidates exactly in a second pass,
+    keeping index pairs only for them, so every returned group is exact;
+    a heavy sum can only be missed when min_pairs is at most the Misra-Gries
+    error bound. estimate_heavy_sums skips the second pass. Progress is
+    reported per row and starts over with the second pass.
+    """
+
+    def __init__(
+        self,
+        metrics: MetricsSink | None = None,
+        min_pairs: int = 2,
+        width: int = 2048,
+        depth: int = 4,
+        capacity: int = 1024,
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            metrics: Optional metrics sink for stage timings and counters.
+            min_pairs: Smallest pair count reported for a sum.
+            width: Count-min sketch counters per row.
+            depth: Count-min sketch rows.
+            capacity: Misra-Gries counters.
+        """
+        self._metrics = metrics
+        self._min_pairs = max(2, min_pairs)
+        self._width = width
+        self._depth = depth
+        self._capacity = capacity
+
+    def collect_sum_pairs(
+        self, array: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
+        """Find the exact groups of the sums with at least min_pairs pairs.
+
+        Args:
+            array: Sequence of integers to find pairs in.
+
+        Returns:
+            Result containing those SumGroups ordered by sum value.
+        """
+        candidates = {estimate.sum_value for estimate in self._estimate(array)}
+        return _metrics.timed_call(
+            self._metrics,
+            "verify",
+            self._verify,
+            (array, candidates),
+        )
+
+    def estimate_heavy_sums(
+        self, array: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.HeavySumEstimate]]:
+        """Estimate the sums with at least min_pairs pairs in one pass.
+
+        Args:
+            array: Sequence of integers to find pairs in.
+
+        Returns:
+            Result containing estimates ordered by sum value.
+        """
+        return tuple(self._estimate(array))
+
+    def _estimate(self, array: Sequence[int]) -> Iterator[_domain.HeavySumEstimate]:
+        """Sketch every pair sum and yield the candidates above min_pairs."""
+        sketch = CountMinSketch(self._width, self._depth)
+        heavy = MisraGries(self._capacity)
+        _metrics.timed_call(
+            self._metrics, "sketch", self._sketch_pairs, (array, sketch, heavy)
+        )
+        _metrics.count(self._metrics, "pairs_generated", sketch.total)
+        _metrics.gauge(self._metrics, "sketch_error_bound", sketch.error_bound)
+        _metrics.gauge(self._metrics, "heavy_hitter_error_bound", heavy.error_bound)
+
+        for sum_value in sorted(heavy.counters):
+            if sum_value < 0:
+                continue
+            lower = heavy.counters[sum_value]
+            estimate = sketch.estimate(sum_value)
+            upper = min(estimate, lower + heavy.error_bound)
+            if upper >= self._min_pairs:
+                yield _domain.HeavySumEstimate(sum_value, estimate, lower, upper)
+
+    def _sketch_pairs(
+        self, arguments: tuple[Sequence[int], CountMinSketch, MisraGries]
+    ) -> None:
+        """Feed every pair sum to both summaries."""
+        array, sketch, heavy = arguments
+        size = len(array)
+        total = size * (size - 1) // 2
+        done = 0
+        for i in range(size):
+            left = array[i]
+            for j in range(i + 1, size):
+                pair_sum = left + array[j]
+                sketch.add(pair_sum)
+                heavy.add(pair_sum)
+            done += size - 1 - i
+            _metrics.progress(self._metrics, done, total)
+
+    def _verify(
+        self, arguments: tuple[Sequence[int], set[int]]
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
+        """Collect the exact pairs of the candidate sums and keep the heavy ones."""
+        array, candidates = arguments
+        table: dict[int, list[tuple[int, int]]] = {
+            pair_sum: [] for pair_sum in candidates
+        }
+        size = len(array)
+        total = size * (size - 1) // 2
+        done = 0
+        for i in range(size):
+            left = array[i]
+            for j in range(i + 1, size):
+                if (index_pairs := table.get(left + array[j])) is not None:
+                    index_pairs.append((i, j))
+            done += size - 1 - i
+            _metrics.progress(self._metrics, done, total)
+
+        groups: list[_domain.SumGroup] = []
+        for pair_sum in sorted(table):
+            if len(table[pair_sum]) < self._min_pairs:
+                continue
+            match _strategies.create_sum_group(array, pair_sum, table[pair_sum]):
+                case _domain.SumGroup() as sum_group:
+                    groups.append(sum_group)
+                case _result.Error():
+                    continue
+        _metrics.count(self._metrics, "groups_emitted", len(groups))
+        return tuple(groups)
@@ -2,18 +2,42 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import heapq
+import math
+import time
+from array import array as typed_array
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from contextlib import nullcontext
+from functools import partial
 from itertools import combinations, groupby
-from operator import attrgetter
+from operator import add, attrgetter
+from typing import TYPE_CHECKING, Literal
 
+from email_task.core.types import MetricsSink
+from email_task.features.find_pairs import planner as _planner
+from email_task.shared import concurrency as _concurrency
 from email_task.shared import domain as _domain
+from email_task.shared import errors as _errors
+from email_task.shared import memory as _memory
+from email_task.shared import metrics as _metrics
 from email_task.shared import result as _result
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 
 class IndexBasedStrategy:
     """Version 2: Index-based pair finding strategy following SOLID principles."""
 
-    def collect_sum_pairs(self, array: Sequence[int]) -> _result.Result[Sequence[_domain.SumGroup]]:
+    def __init__(self, metrics: MetricsSink | None = None) -> None:
+        """Initialize with an optional metrics sink for stage timings."""
+        self._metrics = metrics
+
+    def collect_sum_pairs(
+        self, array: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
         """Find all pairs with the same sum using index-based approach.
 
         Args:
@@ -23,24 +47,46 @@ class IndexBasedStrategy:
             Result containing Sequence of SumGroups or validation/processing error.
         """
         return _result.bind(
-            self._generate_all_pairs(array),
-            lambda pairs: _result.bind(self._group_by_sum(pairs), self._filter_valid_groups),
+            _metrics.timed_call(
+                self._metrics, "generate_pairs", self._generate_all_pairs, array
+            ),
+            lambda pairs: _result.bind(
+                _metrics.timed_call(
+                    self._metrics, "group_by_sum", self._group_by_sum, pairs
+                ),
+                partial(
+                    _metrics.timed_call,
+                    self._metrics,
+                    "filter_valid_groups",
+                    self._filter_valid_groups,
+                ),
+            ),
         )
 
-    def _generate_all_pairs(self, array: Sequence[int]) -> _result.Result[Sequence[_domain.Pair]]:
+    def _generate_all_pairs(
+        self, array: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.Pair]]:
         """Generate all possible pairs from array indices.
 
         Single Responsibility: Only pair generation logic.
         """
         pairs: list[_domain.Pair] = []
+        size = len(array)
+        total = size * (size - 1) // 2
+        done = 0
 
-        for (i, val1), (j, val2) in combinations(enumerate(array), 2):
-            match _domain.PairFactory.create(val1, val2, i, j):
-                case _domain.Pair() as pair:
-                    pairs.append(pair)
-                case error:
-                    return error
+        for i in range(size):
+            left = array[i]
+            for j in range(i + 1, size):
+                match _domain.PairFactory.create(left, array[j], i, j):
+                    case _domain.Pair() as pair:
+                        pairs.append(pair)
+                    case error:
+                        return error
+            done += size - 1 - i
+            _metrics.progress(self._metrics, done, total)
 
+        _metrics.count(self._metrics, "pairs_generated", len(pairs))
         return tuple(pairs)
 
     def _group_by_sum(
@@ -50,7 +96,9 @@ class IndexBasedStrategy:
 
         grouped = groupby(sorted(pairs, key=attrgetter("sum")), key=attrgetter("sum"))
 
-        return {sum_val: tuple(pair_group) for sum_val, pair_group in grouped}
+        groups = {sum_val: tuple(pair_group) for sum_val, pair_group in grouped}
+        _metrics.count(self._metrics, "distinct_sums", len(groups))
+        return groups
 
     def _filter_valid_groups(
         self, grouped_pairs: dict[int, Sequence[_domain.Pair]]
@@ -69,4 +117,1386 @@ class IndexBasedStrategy:
                     continue
 
         sorted_groups = sorted(valid_groups, key=lambda group: group.sum_value)
+        _metrics.count(self._metrics, "groups_emitted", len(sorted_groups))
         return tuple(sorted_groups)
+
+
+class HashGroupingStrategy:
+    """Hash-based strategy grouping compact index pairs by sum in one pass.
+
+    Pairs are kept as ``(i, j)`` tuples in a sum-keyed dict and only turned
+    into Pair objects for sums that end up with at least two pairs, so no
+    per-pair domain objects are created and no pair-level sort is needed.
+    """
+
+    def __init__(self, metrics: MetricsSink | None = None) -> None:
+        """Initialize with an optional metrics sink for stage timings."""
+        self._metrics = metrics
+
+    def collect_sum_pairs(
+        self, array: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
+        """Find all pairs with the same sum using a sum-keyed hash table.
+
+        Args:
+            array: Sequence of integers to find pairs in.
+
+        Returns:
+            Result containing Sequence of SumGroups or validation/processing error.
+        """
+        table = _metrics.timed_call(
+            self._metrics, "group_by_sum", self._group_index_pairs, array
+        )
+        return _metrics.timed_call(
+            self._metrics,
+            "filter_valid_groups",
+            partial(_create_sum_groups, array, self._metrics),
+            ((sum_value, table[sum_value]) for sum_value in sorted(table)),
+        )
+
+    def _group_index_pairs(
+        self, array: Sequence[int]
+    ) -> dict[int, list[tuple[int, int]]]:
+        """Map every pair sum to its index pairs in (i, j) order."""
+        table: dict[int, list[tuple[int, int]]] = {}
+        size = len(array)
+        total = size * (size - 1) // 2
+        done = 0
+        for i in range(size):
+            left = array[i]
+            for j in range(i + 1, size):
+                table.setdefault(left + array[j], []).append((i, j))
+            done += size - 1 - i
+            _metrics.progress(self._metrics, done, total)
+
+        _metrics.count(self._metrics, "pairs_generated", total)
+        _metrics.count(self._metrics, "distinct_sums", len(table))
+        return table
+
+
+class DenseBucketStrategy:
+    """Counting-sort strategy for inputs with a narrow value range.
+
+    Every pair sum lies in [2*min, 2*max], so index pairs are appended to a
+    preallocated flat list of buckets addressed by ``sum - 2*min``. Walking the
+    buckets yields groups already in sum order: there is no hashing and no sort,
+    neither of the pairs nor of the resulting groups. Ranges wider than
+    planner.DENSE_MAX_BUCKETS fall back to hash grouping instead of allocating.
+    """
+
+    def __init__(self, metrics: MetricsSink | None = None) -> None:
+        """Initialize with an optional metrics sink for stage timings."""
+        self._metrics = metrics
+
+    def collect_sum_pairs(
+        self, array: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
+        """Find all pairs with the same sum using sum-indexed buckets.
+
+        Args:
+            array: Sequence of integers to find pairs in.
+
+        Returns:
+            Result containing Sequence of SumGroups or validation/processing error.
+        """
+        if len(array) < 2:
+            return ()
+        if 2 * (max(array) - min(array)) + 1 > _planner.DENSE_MAX_BUCKETS:
+            _metrics.count(self._metrics, "dense_fallbacks")
+            return HashGroupingStrategy(self._metrics).collect_sum_pairs(array)
+        buckets = _metrics.timed_call(
+            self._metrics, "group_by_sum", self._fill_buckets, array
+        )
+        return _metrics.timed_call(
+            self._metrics,
+            "filter_valid_groups",
+            partial(_create_sum_groups, array, self._metrics),
+            self._iter_buckets(2 * min(array), buckets),
+        )
+
+    def _fill_buckets(self, array: Sequence[int]) -> list[list[tuple[int, int]] | None]:
+        """Append every index pair to the bucket of its sum offset."""
+        offset = 2 * min(array)
+        buckets: list[list[tuple[int, int]] | None] = [None] * (
+            2 * max(array) - offset + 1
+        )
+        size = len(array)
+        total = size * (size - 1) // 2
+        done = 0
+        for i in range(size):
+            base = array[i] - offset
+            for j in range(i + 1, size):
+                position = base + array[j]
+                bucket = buckets[position]
+                if bucket is None:
+                    buckets[position] = [(i, j)]
+                else:
+                    bucket.append((i, j))
+            done += size - 1 - i
+            _metrics.progress(self._metrics, done, total)
+
+        _metrics.count(self._metrics, "pairs_generated", total)
+        _metrics.count(
+            self._metrics,
+            "distinct_sums",
+            sum(bucket is not None for bucket in buckets),
+        )
+        return buckets
+
+    @staticmethod
+    def _iter_buckets(
+        offset: int, buckets: list[list[tuple[int, int]] | None]
+    ) -> Iterator[tuple[int, list[tuple[int, int]]]]:
+        """Yield occupied buckets with their sum value, in ascending sum order."""
+        for position, bucket in enumerate(buckets):
+            if bucket is not None:
+                yield offset + position, bucket
+
+
+class BoundedMemoryStrategy:
+    """Count-first strategy keeping peak memory within a byte budget.
+
+    The budget is split by memory.BoundedLayout. Sums are partitioned into P
+    classes ``sum % P``, P sized from the distinct-sum bound so one class fits
+    the count table, and one counting pass per class keeps the sums with at
+    least two pairs as packed int64 candidates. The candidates are merged in
+    sum order and cut into windows whose groups fit the window share; each
+    window costs one more pass over all index pairs. Groups are yielded in sum
+    order as their window completes. Progress is reported per row and starts
+    over with every pass.
+    """
+
+    def __init__(
+        self, metrics: MetricsSink | None = None, memory_budget: int | None = None
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            metrics: Optional metrics sink for stage timings and counters.
+            memory_budget: Peak bytes for tables and groups, None for unbounded.
+        """
+        self._metrics = metrics
+        self._memory_budget = memory_budget
+
+    def collect_sum_pairs(
+        self, array: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
+        """Find all pairs with the same sum within the memory budget.
+
+        Collecting into a tuple keeps every group in memory; use
+        iter_sum_groups with a streaming writer to stay within the budget.
+
+        Args:
+            array: Sequence of integers to find pairs in.
+
+        Returns:
+            Result containing Sequence of SumGroups or a resource error.
+        """
+        return _result.map(self.iter_sum_groups(array), tuple)
+
+    def iter_sum_groups(
+        self, array: Sequence[int]
+    ) -> _result.Result[Iterator[_domain.SumGroup]]:
+        """Find pairs with the same sum, yielding groups window by window.
+
+        All counting passes run before this returns, so a budget that cannot
+        hold the candidate sums or the largest group fails before any group is
+        materialized.
+
+        Args:
+            array: Sequence of integers to find pairs in.
+
+        Returns:
+            Result containing an iterator of SumGroups ordered by sum value, or
+            a memory budget error.
+        """
+        if len(array) < 2:
+            return iter(())
+        size = len(array)
+        _metrics.count(self._metrics, "pairs_generated", size * (size - 1) // 2)
+        return _result.map(
+            _metrics.timed_call(
+                self._metrics, "count_by_sum", self._count_candidates, array
+            ),
+            partial(self._iter_windows, array),
+        )
+
+    def _count_candidates(
+        self, array: Sequence[int]
+    ) -> _result.Result[list[tuple[typed_array[int], typed_array[int]]]]:
+        """Count pairs per sum class by class, keeping sums with two or more.
+
+        Returns:
+            Per class, the candidate sums in ascending order and their counts.
+        """
+        size = len(array)
+        distinct_sums = min(size * (size - 1) // 2, 2 * (max(array) - min(array)) + 1)
+        match self._memory_budget:
+            case None:
+                layout = None
+                partitions = 1
+            case budget:
+                layout = _memory.BoundedLayout.for_budget(budget)
+                if layout.table_entries < 1 or not layout.fits_group(2):
+                    return (
+                        _errors.ApplicationErrorFactory.memory_budget_exceeded_error()
+                    )
+                partitions = layout.partitions(distinct_sums)
+        _metrics.gauge(self._metrics, "sum_partitions", partitions)
+
+        classes: list[tuple[typed_array[int], typed_array[int]]] = []
+        kept = 0
+        for residue in range(partitions):
+            counts = self._count_class(array, partitions, residue)
+            if layout is not None and len(counts) > layout.table_entries:
+                return _errors.ApplicationErrorFactory.memory_budget_exceeded_error()
+            sums = typed_array(
+                "q", sorted(pair_sum for pair_sum, n in counts.items() if n >= 2)
+            )
+            kept += len(sums)
+            if layout is not None and (
+                kept > layout.candidates
+                or not all(layout.fits_group(counts[pair_sum]) for pair_sum in sums)
+            ):
+                return _errors.ApplicationErrorFactory.memory_budget_exceeded_error()
+            classes.append((sums, typed_array("q", map(counts.__getitem__, sums))))
+            _metrics.count(self._metrics, "distinct_sums", len(counts))
+            _metrics.count(self._metrics, "pair_passes")
+        return classes
+
+    def _count_class(
+        self, array: Sequence[int], partitions: int, residue: int
+    ) -> dict[int, int]:
+        """Count the pairs of every non-negative sum congruent to residue."""
+        counts: dict[int, int] = {}
+        size = len(array)
+        total = size * (size - 1) // 2
+        done = 0
+        for i in range(size):
+            left = array[i]
+            for j in range(i + 1, size):
+                pair_sum = left + array[j]
+                if pair_sum >= 0 and pair_sum % partitions == residue:
+                    counts[pair_sum] = counts.get(pair_sum, 0) + 1
+            done += size - 1 - i
+            _metrics.progress(self._metrics, done, total)
+        return counts
+
+    def _iter_windows(
+        self,
+        array: Sequence[int],
+        classes: list[tuple[typed_array[int], typed_array[int]]],
+    ) -> Iterator[_domain.SumGroup]:
+        """Merge the candidates in sum order and materialize them window by window."""
+        window_bytes = (
+            None
+            if self._memory_budget is None
+            else _memory.BoundedLayout.for_budget(self._memory_budget).window_bytes
+        )
+        window: dict[int, list[tuple[int, int]]] = {}
+        used = 0
+        emitted = 0
+        for pair_sum, pair_count in heapq.merge(
+            *(zip(sums, counts, strict=True) for sums, counts in classes)
+        ):
+            needed = _memory.SUM_ENTRY_BYTES + pair_count * _memory.GROUPED_PAIR_BYTES
+            if window and window_bytes is not None and used + needed > window_bytes:
+                emitted += yield from self._materialize(array, window)
+                window, used = {}, 0
+            window[pair_sum] = []
+            used += needed
+        if window:
+            emitted += yield from self._materialize(array, window)
+        _metrics.count(self._metrics, "groups_emitted", emitted)
+
+    def _materialize(
+        self, array: Sequence[int], window: dict[int, list[tuple[int, int]]]
+    ) -> Generator[_domain.SumGroup, None, int]:
+        """Fill one window with a pass over all pairs and yield its groups.
+
+        Returns:
+            Number of groups yielded.
+        """
+        low, high = min(window), max(window)
+        size = len(array)
+        total = size * (size - 1) // 2
+        done = 0
+        for i in range(size):
+            left = array[i]
+            for j in range(i + 1, size):
+                pair_sum = left + array[j]
+                if low <= pair_sum <= high and pair_sum in window:
+                    window[pair_sum].append((i, j))
+            done += size - 1 - i
+            _metrics.progress(self._metrics, done, total)
+        _metrics.count(self._metrics, "pair_passes")
+
+        emitted = 0
+        for pair_sum in sorted(window):
+            match create_sum_group(array, pair_sum, window.pop(pair_sum)):
+                case _domain.SumGroup() as sum_group:
+                    emitted += 1
+                    yield sum_group
+                case _result.Error():
+                    continue
+        return emitted
+
+
+type _SumShards = list[dict[int, list[tuple[int, int]]]]
+"""Index pairs of one row partition, split into sum-keyed shards by sum modulo."""
+
+PARTITIONS_PER_WORKER = 4
+"""Row partitions per worker, so uneven progress still keeps workers busy."""
+
+type ExecutorKind = Literal["auto", "threads", "processes", "serial"]
+
+
+class DeadlineBoundedStrategy:
+    """Anytime hash grouping that stops cooperatively at a deadline.
+
+    The clock is read once per outer index, so the check costs one call per
+    row of n - i pairs. When time runs out after row k, every remaining pair
+    has both elements in ``array[k + 1:]``; its sum lies between the two
+    smallest and the two largest of those values. Groups outside that range
+    can gain no more pairs and are returned as complete inside a
+    DeadlineExceededError, together with k.
+    """
+
+    def __init__(
+        self,
+        deadline: float,
+        metrics: MetricsSink | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            deadline: Seconds allowed per collect_sum_pairs call.
+            metrics: Optional metrics sink for stage timings and counters.
+            clock: Monotonic clock in seconds, replaceable for testing.
+        """
+        self._deadline = deadline
+        self._metrics = metrics
+        self._clock = clock
+
+    def collect_sum_pairs(
+        self, array: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
+        """Find all pairs with the same sum, or the complete groups by the deadline.
+
+        Args:
+            array: Sequence of integers to find pairs in.
+
+        Returns:
+            Result containing every SumGroup ordered by sum value, or a
+            DeadlineExceededError holding the complete groups and the last
+            outer index processed.
+        """
+        table, last_index = _metrics.timed_call(
+            self._metrics, "group_by_sum", self._group_until_deadline, array
+        )
+        if last_index >= len(array) - 2:
+            return _metrics.timed_call(
+                self._metrics,
+                "filter_valid_groups",
+                partial(_create_sum_groups, array, self._metrics),
+                ((sum_value, table[sum_value]) for sum_value in sorted(table)),
+            )
+
+        _metrics.gauge(self._metrics, "deadline_last_index", last_index)
+        low, high = _remaining_sum_range(array[last_index + 1 :])
+        groups = _metrics.timed_call(
+            self._metrics,
+            "filter_valid_groups",
+            partial(_create_sum_groups, array, self._metrics),
+            (
+                (sum_value, table[sum_value])
+                for sum_value in sorted(table)
+                if not low <= sum_value <= high
+            ),
+        )
+        return _result.bind(
+            groups,
+            lambda complete: _errors.ApplicationErrorFactory.deadline_exceeded_error(
+                complete, last_index
+            ),
+        )
+
+    def _group_until_deadline(
+        self, array: Sequence[int]
+    ) -> tuple[dict[int, list[tuple[int, int]]], int]:
+        """Group index pairs by sum row by row until the deadline passes."""
+        stop_at = self._clock() + self._deadline
+        table: dict[int, list[tuple[int, int]]] = {}
+        size = len(array)
+        total = size * (size - 1) // 2
+        done = 0
+        last_index = -1
+        for i in range(size - 1):
+            if self._clock() >= stop_at:
+                break
+            left = array[i]
+            for j in range(i + 1, size):
+                table.setdefault(left + array[j], []).append((i, j))
+            last_index = i
+            done += size - 1 - i
+            _metrics.progress(self._metrics, done, total)
+
+        _metrics.count(self._metrics, "pairs_generated", done)
+        _metrics.count(self._metrics, "distinct_sums", len(table))
+        return table, last_index
+
+
+class TopSumsStrategy:
+    """The k sums shared by the most pairs, without keeping every group.
+
+    A counting pass stores one integer per distinct sum instead of every index
+    pair. heapq.nlargest then picks the k largest counts among valid sums,
+    and a second pass materializes pairs only for those sums. Groups are
+    ordered by pair count, largest first, with ties broken by smaller sum.
+    """
+
+    def __init__(self, k: int, metrics: MetricsSink | None = None) -> None:
+        """Initialize the strategy.
+
+        Args:
+            k: Number of groups to return at most.
+            metrics: Optional metrics sink for stage timings and counters.
+        """
+        self._k = k
+        self._metrics = metrics
+
+    def collect_sum_pairs(
+        self, array: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
+        """Find the k most populous equal-sum groups.
+
+        Args:
+            array: Sequence of integers to find pairs in.
+
+        Returns:
+            Result containing up to k SumGroups ordered by descending size.
+        """
+        counts = _metrics.timed_call(
+            self._metrics, "count_by_sum", self._count_pairs, array
+        )
+        top_sums = _metrics.timed_call(
+            self._metrics, "select_top", self._select_top, counts
+        )
+        table = _metrics.timed_call(
+            self._metrics, "group_by_sum", partial(self._collect_pairs, array), top_sums
+        )
+        return _metrics.timed_call(
+            self._metrics,
+            "filter_valid_groups",
+            partial(_create_sum_groups, array, self._metrics),
+            table.items(),
+        )
+
+    def _count_pairs(self, array: Sequence[int]) -> Counter[int]:
+        """Count the pairs of every sum, one row of pairs at a time."""
+        counts: Counter[int] = Counter()
+        size = len(array)
+        total = size * (size - 1) // 2
+        done = 0
+        for i in range(size - 1):
+            counts.update(map(partial(add, array[i]), array[i + 1 :]))
+            done += size - 1 - i
+            _metrics.progress(self._metrics, done, total)
+        _metrics.count(self._metrics, "pairs_generated", done)
+        _metrics.count(self._metrics, "distinct_sums", len(counts))
+        return counts
+
+    def _select_top(self, counts: Counter[int]) -> list[int]:
+        """Return the k valid sums with the most pairs, in output order."""
+        ranked = heapq.nlargest(
+            self._k,
+            (
+                (count, -sum_value)
+                for sum_value, count in counts.items()
+                if sum_value >= 0 and count >= 2
+            ),
+        )
+        return [-negated_sum for _, negated_sum in ranked]
+
+    def _collect_pairs(
+        self, array: Sequence[int], top_sums: list[int]
+    ) -> dict[int, list[tuple[int, int]]]:
+        """Collect index pairs for the selected sums only, keeping their order."""
+        table: dict[int, list[tuple[int, int]]] = {
+            sum_value: [] for sum_value in top_sums
+        }
+        if not table:
+            return table
+        size = len(array)
+        for i in range(size - 1):
+            left = array[i]
+            for j in range(i + 1, size):
+                if (index_pairs := table.get(left + array[j])) is not None:
+                    index_pairs.append((i, j))
+        return table
+
+
+class ParallelHashStrategy:
+    """Hash grouping with the pair enumeration partitioned across workers.
+
+    Rows ``i`` are split into contiguous partitions of equal pair counts. Each
+    task builds its own sum maps, sharded by ``sum % workers``, so no map is
+    ever shared or locked. Shard ``k`` of every partition is then merged, in
+    partition order, by one task that also builds that shard's SumGroups, and
+    the per-shard results are finally merged by sum. Each phase only reads data
+    completed by the previous one.
+
+    Threads share the input array without copying but only run in parallel
+    when the GIL is disabled, so ``"auto"`` uses threads on free-threaded
+    builds and runs the same partitions serially otherwise. ``"processes"``
+    instead gives each task one sum shard: it enumerates only the pairs whose
+    sum falls in that shard and returns just the grouped ones, so no pair is
+    shipped between processes more than once.
+    """
+
+    def __init__(
+        self,
+        metrics: MetricsSink | None = None,
+        workers: int | None = None,
+        executor: ExecutorKind = "auto",
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            metrics: Optional metrics sink for stage timings and counters.
+            workers: Number of worker threads or processes, defaults to the
+                usable CPUs.
+            executor: "threads", "processes", "serial", or "auto" to use
+                threads only when the GIL is disabled.
+        """
+        self._metrics = metrics
+        self._workers = workers or _concurrency.usable_cpus()
+        self._executor = executor
+
+    def collect_sum_pairs(
+        self, array: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
+        """Find all pairs with the same sum using partitioned hash grouping.
+
+        Args:
+            array: Sequence of integers to find pairs in.
+
+        Returns:
+            Result containing Sequence of SumGroups, or a worker error if a
+            worker process died.
+        """
+        executor_kind = self._resolve_executor(array)
+        workers = 1 if executor_kind == "serial" else self._workers
+        _metrics.gauge(self._metrics, "parallel_workers", workers)
+        match executor_kind:
+            case "processes":
+                from concurrent.futures.process import BrokenProcessPool
+
+                shard_groups = _result.as_result(
+                    lambda: self._run_in_processes(array, workers),
+                    _errors.ApplicationErrorFactory.worker_failed_error(),
+                    BrokenProcessPool,
+                )
+            case _:
+                partitions = _partition_rows(
+                    len(array), workers * PARTITIONS_PER_WORKER
+                )
+                shard_groups = self._run_in_memory(
+                    executor_kind, array, workers, partitions
+                )
+        return _result.map(shard_groups, partial(self._merge_by_sum, len(array)))
+
+    def _resolve_executor(self, array: Sequence[int]) -> ExecutorKind:
+        """Resolve "auto", and use serial runs where processes cannot share array.
+
+        "auto" means threads without a GIL and serial execution with one.
+        """
+        match self._executor:
+            case "auto" if _concurrency.gil_enabled() or self._workers == 1:
+                return "serial"
+            case "auto":
+                return "threads"
+            case "processes" if len(array) < 2 or not _fits_int64(array):
+                return "serial"
+            case kind:
+                return kind
+
+    def _run_in_memory(
+        self,
+        executor_kind: ExecutorKind,
+        array: Sequence[int],
+        workers: int,
+        partitions: Sequence[range],
+    ) -> list[list[_domain.SumGroup]]:
+        """Run both phases on threads sharing array, or serially."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with (
+            ThreadPoolExecutor(max_workers=workers)
+            if executor_kind == "threads"
+            else nullcontext()
+        ) as executor:
+            map_tasks = map if executor is None else executor.map
+            partition_shards = _metrics.timed_call(
+                self._metrics,
+                "group_by_sum",
+                lambda rows: self._collect_partitions(
+                    len(array),
+                    rows,
+                    map_tasks(partial(_enumerate_rows, array, workers), rows),
+                ),
+                partitions,
+            )
+            return _metrics.timed_call(
+                self._metrics,
+                "filter_valid_groups",
+                lambda shards: list(
+                    map_tasks(partial(_merge_shard, array, partition_shards), shards)
+                ),
+                range(workers),
+            )
+
+    def _run_in_processes(
+        self, array: Sequence[int], workers: int
+    ) -> list[list[_domain.SumGroup]]:
+        """Run one sum shard per task in workers attached to a shared int64 block.
+
+        The array is copied once into shared memory instead of being pickled
+        per worker. Each task owns the sums congruent to its shard modulo the
+        shard count and returns only their groups as packed records, so pairs
+        whose sum is unique never leave the worker; Pair objects are only
+        created here, for the groups that are reported.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        from email_task.shared import shared_array as _shared_array
+
+        shard_count = workers * PARTITIONS_PER_WORKER
+        with (
+            _shared_array.SharedInt64Array(array) as shared,
+            ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_attach_worker_array,
+                initargs=(shared.name, len(shared)),
+            ) as executor,
+        ):
+            _metrics.gauge(
+                self._metrics,
+                "shared_memory_bytes",
+                len(shared) * _shared_array.INT64_BYTES,
+            )
+            packed_groups = _metrics.timed_call(
+                self._metrics,
+                "group_by_sum",
+                partial(self._collect_shards, executor, array),
+                shard_count,
+            )
+
+        _metrics.count(
+            self._metrics, "packed_result_bytes", sum(map(len, packed_groups))
+        )
+        return _metrics.timed_call(
+            self._metrics,
+            "filter_valid_groups",
+            lambda buffers: [
+                list(unpack_sum_groups(array, typed_array("q", packed)))
+                for packed in buffers
+            ],
+            packed_groups,
+        )
+
+    def _collect_partitions(
+        self, size: int, partitions: Sequence[range], results: Iterable[_SumShards]
+    ) -> list[_SumShards]:
+        """Gather partition results in order, reporting progress after each."""
+        total = size * (size - 1) // 2
+        done = 0
+        collected: list[_SumShards] = []
+        for rows, shards in zip(partitions, results, strict=True):
+            collected.append(shards)
+            done += sum(size - 1 - i for i in rows)
+            _metrics.progress(self._metrics, done, total)
+        return collected
+
+    def _collect_shards(
+        self, executor: Executor, array: Sequence[int], shard_count: int
+    ) -> list[bytes]:
+        """Run every sum shard, reporting progress as each future completes.
+
+        Returns:
+            Packed records per shard, in shard order.
+        """
+        from concurrent.futures import as_completed
+
+        futures = {
+            executor.submit(_pack_worker_shard, shard_count, shard): shard
+            for shard in range(shard_count)
+        }
+        shard_pairs = _residue_shard_pairs(array, shard_count)
+        total = sum(shard_pairs)
+        done = 0
+        packed = [b""] * shard_count
+        for future in as_completed(futures):
+            shard = futures[future]
+            packed[shard] = future.result()
+            done += shard_pairs[shard]
+            _metrics.progress(self._metrics, done, total)
+        return packed
+
+    def _merge_by_sum(
+        self, size: int, shard_groups: list[list[_domain.SumGroup]]
+    ) -> Sequence[_domain.SumGroup]:
+        """Merge the per-shard group lists, each sorted by sum, into one."""
+        _metrics.count(self._metrics, "pairs_generated", size * (size - 1) // 2)
+        _metrics.count(self._metrics, "groups_emitted", sum(map(len, shard_groups)))
+        return tuple(heapq.merge(*shard_groups, key=attrgetter("sum_value")))
+
+
+def create_process_pool_strategy(
+    metrics: MetricsSink | None = None, workers: int | None = None
+) -> ParallelHashStrategy:
+    """Create a ParallelHashStrategy that always runs in worker processes.
+
+    Registry factory for the "processes" engine, which parallelizes on regular
+    GIL builds at the cost of process start-up and packed result transfer.
+
+    Args:
+        metrics: Optional metrics sink for stage timings and counters.
+        workers: Number of worker processes, defaults to the usable CPUs.
+    """
+    return ParallelHashStrategy(metrics, workers, executor="processes")
+
+
+def _remaining_sum_range(suffix: Sequence[int]) -> tuple[int, int]:
+    """Return the smallest and largest sum of two elements of suffix."""
+    if len(suffix) < 2:
+        return 1, 0
+    smallest = heapq.nsmallest(2, suffix)
+    largest = heapq.nlargest(2, suffix)
+    return sum(smallest), sum(largest)
+
+
+def _fits_int64(array: Sequence[int]) -> bool:
+    """Return whether array and its pairwise sums fit the shared int64 block."""
+    from email_task.shared import shared_array as _shared_array
+
+    return _shared_array.SharedInt64Array.fits(array)
+
+
+def _partition_rows(size: int, parts: int) -> list[range]:
+    """Split rows 0..size-2 into at most parts ranges of about equal pair counts."""
+    total = size * (size - 1) // 2
+    partitions: list[range] = []
+    start = covered = 0
+    for i in range(size - 1):
+        covered += size - 1 - i
+        if covered * parts >= total * (len(partitions) + 1):
+            partitions.append(range(start, i + 1))
+            start = i + 1
+    return partitions
+
+
+def _enumerate_rows(array: Sequence[int], shard_count: int, rows: range) -> _SumShards:
+    """Map the sums of pairs (i, j), i in rows, to index pairs in (i, j) order."""
+    shards: _SumShards = [{} for _ in range(shard_count)]
+    size = len(array)
+    for i in rows:
+        left = array[i]
+        for j in range(i + 1, size):
+            pair_sum = left + array[j]
+            shards[pair_sum % shard_count].setdefault(pair_sum, []).append((i, j))
+    return shards
+
+
+_worker_memory: object = None
+"""Shared block attached by a process-pool worker, kept alive for its view."""
+
+_worker_array: Sequence[int] = ()
+"""Zero-copy int64 view of the input in a process-pool worker."""
+
+
+def _attach_worker_array(name: str, length: int) -> None:
+    """Process-pool initializer attaching the worker to the shared input."""
+    from email_task.shared import shared_array as _shared_array
+
+    global _worker_memory, _worker_array
+    _worker_memory, _worker_array = _shared_array.attach(name, length)
+
+
+def _residue_shard_pairs(array: Sequence[int], shard_count: int) -> list[int]:
+    """Return how many pairs have a sum in each residue class of shard_count."""
+    sizes = [0] * shard_count
+    for value in array:
+        sizes[value % shard_count] += 1
+    shard_pairs = [0] * shard_count
+    for residue in range(shard_count):
+        shard_pairs[2 * residue % shard_count] += (
+            sizes[residue] * (sizes[residue] - 1) // 2
+        )
+        for other in range(residue + 1, shard_count):
+            shard_pairs[(residue + other) % shard_count] += (
+                sizes[residue] * sizes[other]
+            )
+    return shard_pairs
+
+
+def _pack_worker_shard(shard_count: int, shard: int) -> bytes:
+    """Collect one sum shard of the shared input as packed records."""
+    return collect_residue_shard(_worker_array, shard, shard_count).tobytes()
+
+
+def collect_residue_shard(
+    values: Sequence[int], shard: int, shard_count: int
+) -> typed_array[int]:
+    """Collect the pairs whose sum is congruent to shard modulo shard_count.
+
+    Indices are bucketed by value residue first, so each row only visits the
+    partners that can complete the residue; one shard costs O(n) plus roughly
+    1/shard_count of the full pair scan.
+
+    Args:
+        values: The whole input array.
+        shard: Residue of the sums to keep.
+        shard_count: Number of residue classes the sums are split into.
+
+    Returns:
+        Records packed by pack_sum_groups, in sum order.
+    """
+    buckets: list[list[int]] = [[] for _ in range(shard_count)]
+    for index, value in enumerate(values):
+        buckets[value % shard_count].append(index)
+
+    table: dict[int, list[int]] = {}
+    for i, left in enumerate(values):
+        partners = buckets[(shard - left) % shard_count]
+        add_row_pairs(table, values, i, partners[bisect_right(partners, i) :])
+    return pack_sum_groups(table)
+
+
+def add_row_pairs(
+    table: dict[int, list[int]], array: Sequence[int], i: int, partners: Iterable[int]
+) -> None:
+    """Add the pairs of one row to a sum -> flat index pairs table.
+
+    Negative sums are skipped since pack_sum_groups would drop them anyway.
+
+    Args:
+        table: Table extended in place, as consumed by pack_sum_groups.
+        array: Array both indices refer to.
+        i: Left index of every pair in the row.
+        partners: Right indices, each greater than i.
+    """
+    left = array[i]
+    for j in partners:
+        if (pair_sum := left + array[j]) < 0:
+            continue
+        if (flat_pairs := table.get(pair_sum)) is None:
+            table[pair_sum] = [i, j]
+        else:
+            flat_pairs.extend((i, j))
+
+
+def pack_all_sum_groups(array: Sequence[int]) -> typed_array[int]:
+    """Group every pair of array by sum and pack the groups.
+
+    Args:
+        array: Integers whose pairs are grouped.
+
+    Returns:
+        Records packed by pack_sum_groups, in sum order.
+    """
+    table: dict[int, list[int]] = {}
+    size = len(array)
+    for i in range(size - 1):
+        add_row_pairs(table, array, i, range(i + 1, size))
+    return pack_sum_groups(table)
+
+
+def pack_sum_groups(table: dict[int, list[int]]) -> typed_array[int]:
+    """Pack a sum -> flat ``[i0, j0, i1, j1, ...]`` table into int64 records.
+
+    Sums with fewer than two pairs, or below zero, which the SumGroup factory
+    would reject anyway, are dropped so they are never transferred.
+
+    Args:
+        table: Index pairs per sum, flattened, each in (i, j) order.
+
+    Returns:
+        ``sum, count, i0, j0, i1, j1, ...`` records in sum order.
+    """
+    packed = typed_array("q")
+    for pair_sum in sorted(table):
+        flat_pairs = table[pair_sum]
+        if pair_sum < 0 or len(flat_pairs) < 4:
+            continue
+        packed.extend((pair_sum, len(flat_pairs) // 2))
+        packed.extend(flat_pairs)
+    return packed
+
+
+def unpack_sum_groups(
+    array: Sequence[int], records: Sequence[int]
+) -> Iterator[_domain.SumGroup]:
+    """Lazily create SumGroups from records packed by pack_sum_groups.
+
+    Args:
+        array: Input array the record indices refer to.
+        records: Packed int64 records.
+
+    Returns:
+        Iterator of validated SumGroups in sum order.
+    """
+    offset = 0
+    while offset < len(records):
+        pair_sum, pair_count = records[offset], records[offset + 1]
+        flat_pairs = records[offset + 2 : offset + 2 + 2 * pair_count]
+        offset += 2 + 2 * pair_count
+        index_pairs = list(zip(flat_pairs[::2], flat_pairs[1::2], strict=True))
+        match create_sum_group(array, pair_sum, index_pairs):
+            case _domain.SumGroup() as sum_group:
+                yield sum_group
+            case _result.Error():
+                continue
+
+
+def _merge_shard(
+    array: Sequence[int], partition_shards: list[_SumShards], shard: int
+) -> list[_domain.SumGroup]:
+    """Concatenate one shard's pairs across partitions and build its groups.
+
+    Partitions cover increasing rows, so concatenating in partition order keeps
+    each sum's pairs in (i, j) order.
+    """
+    merged: dict[int, list[tuple[int, int]]] = {}
+    for shards in partition_shards:
+        for pair_sum, index_pairs in shards[shard].items():
+            if (existing := merged.get(pair_sum)) is None:
+                merged[pair_sum] = index_pairs
+            else:
+                existing.extend(index_pairs)
+
+    sum_groups: list[_domain.SumGroup] = []
+    for pair_sum in sorted(merged):
+        index_pairs = merged[pair_sum]
+        if len(index_pairs) < 2:
+            continue
+        match create_sum_group(array, pair_sum, index_pairs):
+            case _domain.SumGroup() as sum_group:
+                sum_groups.append(sum_group)
+            case _result.Error():
+                continue
+    return sum_groups
+
+
+class TupleFindingStrategy:
+    """Equal-sum groups of k-tuples by meet-in-the-middle sorted enumeration.
+
+    Every tuple ``i1 < ... < ik`` is split into its first ``k // 2`` indices and
+    the rest. Both halves are enumerated once and sorted by sum, and a heap
+    holding one cursor per left half merges them into whole tuples in
+    increasing sum order, skipping combinations whose halves interleave.
+    Halves that can never be completed are not generated. Only the halves and
+    the current group are held in memory, O(n^ceil(k/2)), and groups stream
+    out in sum order as soon as their sum is passed.
+    """
+
+    def __init__(self, size: int = 2, metrics: MetricsSink | None = None) -> None:
+        """Initialize the strategy.
+
+        Args:
+            size: Number of elements per tuple, k; 2 finds the usual pairs.
+            metrics: Optional metrics sink counting tuples and groups.
+        """
+        self._size = size
+        self._metrics = metrics
+
+    def collect_sum_tuples(
+        self, array: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.TupleGroup]]:
+        """Find all groups of k-tuples with the same sum.
+
+        Args:
+            array: Sequence of integers to find tuples in.
+
+        Returns:
+            Result containing TupleGroups ordered by sum value or an error.
+        """
+        return _result.map(self.iter_sum_tuples(array), tuple)
+
+    def iter_sum_tuples(
+        self, array: Sequence[int]
+    ) -> _result.Result[Iterator[_domain.TupleGroup]]:
+        """Find groups of k-tuples with the same sum, yielding them in sum order.
+
+        Tuples within a group are in index order, so for k = 2 the groups
+        list the same pairs in the same order as IndexBasedStrategy.
+
+        Args:
+            array: Sequence of integers to find tuples in.
+
+        Returns:
+            Result containing an iterator of TupleGroups or a validation error.
+        """
+        if self._size < 2:
+            return _errors.ApplicationErrorFactory.invalid_tuple_size_error()
+        if len(array) < self._size:
+            return iter(())
+        return self._iter_groups(array)
+
+    def _iter_groups(self, array: Sequence[int]) -> Iterator[_domain.TupleGroup]:
+        """Merge the sorted halves and cut the tuple stream at sum changes."""
+        left_size = self._size // 2
+        right_size = self._size - left_size
+        lefts = _sorted_halves(array, left_size, range(len(array) - right_size))
+        rights = _sorted_halves(array, right_size, range(left_size, len(array)))
+        cursors = [(lefts[x][0] + rights[0][0], x, 0) for x in range(len(lefts))]
+        heapq.heapify(cursors)
+
+        group_sum: int | None = None
+        members: list[tuple[int, ...]] = []
+        generated = emitted = 0
+        while cursors:
+            total, x, y = cursors[0]
+            if y + 1 < len(rights):
+                heapq.heapreplace(cursors, (lefts[x][0] + rights[y + 1][0], x, y + 1))
+            else:
+                heapq.heappop(cursors)
+            left_indices, right_indices = lefts[x][1], rights[y][1]
+            if left_indices[-1] >= right_indices[0]:
+                continue
+            generated += 1
+            if total != group_sum:
+                if (
+                    tuple_group := _create_tuple_group(array, group_sum, members)
+                ) is not None:
+                    emitted += 1
+                    yield tuple_group
+                group_sum, members = total, []
+            members.append(left_indices + right_indices)
+        if (tuple_group := _create_tuple_group(array, group_sum, members)) is not None:
+            emitted += 1
+            yield tuple_group
+
+        _metrics.count(self._metrics, "tuples_generated", generated)
+        _metrics.count(self._metrics, "groups_emitted", emitted)
+
+
+def _sorted_halves(
+    array: Sequence[int], size: int, positions: range
+) -> list[tuple[int, tuple[int, ...]]]:
+    """Return every size-subset of positions as (sum, indices), sorted by sum."""
+    return sorted(
+        (sum(array[index] for index in indices), indices)
+        for indices in combinations(positions, size)
+    )
+
+
+def _create_tuple_group(
+    array: Sequence[int], sum_value: int | None, members: list[tuple[int, ...]]
+) -> _domain.TupleGroup | None:
+    """Create the validated group of members, or None if it is rejected."""
+    if sum_value is None or sum_value < 0 or len(members) < 2:
+        return None
+    tuples: list[_domain.IndexedTuple] = []
+    for indices in sorted(members):
+        match _domain.IndexedTupleFactory.create(
+            [array[index] for index in indices], indices
+        ):
+            case _domain.IndexedTuple() as item:
+                tuples.append(item)
+            case _result.Error():
+                return None
+    match _domain.TupleGroupFactory.create(sum_value, tuple(tuples)):
+        case _domain.TupleGroup() as tuple_group:
+            return tuple_group
+        case _result.Error():
+            return None
+
+
+class PigeonholeExistenceCheck:
+    """Answer whether any sum has two pairs, with one witness, without grouping.
+
+    With non-negative values every pair sum lies in [2*min, 2*max], so once a
+    prefix of the array has more pairs than possible sums, two of its pairs
+    must collide. The scan is then limited to that prefix, bounding the work by
+    the value range instead of n². Otherwise pairs are hashed until the first
+    collision. Negative sums are skipped, as in the full listing.
+    """
+
+    def __init__(self, metrics: MetricsSink | None = None) -> None:
+        """Initialize with an optional metrics sink for counters."""
+        self._metrics = metrics
+
+    def find_witness(
+        self, array: Sequence[int]
+    ) -> _result.Result[_domain.SumWitness | None]:
+        """Find the first two pairs sharing a non-negative sum.
+
+        Args:
+            array: Sequence of integers to search.
+
+        Returns:
+            Result containing a SumWitness, None if every sum is unique, or a
+            validation error.
+        """
+        if len(array) < 2:
+            return None
+        scan_size = len(array)
+        if min(array) >= 0:
+            prefix = pigeonhole_prefix(2 * (max(array) - min(array)) + 1)
+            if prefix <= scan_size:
+                scan_size = prefix
+                _metrics.gauge(self._metrics, "pigeonhole_prefix", prefix)
+
+        seen: dict[int, tuple[int, int]] = {}
+        scanned = 0
+        for j in range(scan_size):
+            right = array[j]
+            for i in range(j):
+                pair_sum = array[i] + right
+                if pair_sum < 0:
+                    continue
+                scanned += 1
+                if (first := seen.get(pair_sum)) is None:
+                    seen[pair_sum] = (i, j)
+                    continue
+                _metrics.count(self._metrics, "pairs_generated", scanned)
+                return _create_witness(array, pair_sum, first, (i, j))
+
+        _metrics.count(self._metrics, "pairs_generated", scanned)
+        return None
+
+
+def pigeonhole_prefix(sum_count: int) -> int:
+    """Return the smallest m whose m(m-1)/2 pairs exceed sum_count possible sums.
+
+    Args:
+        sum_count: Number of distinct sums the pairs can take.
+
+    Returns:
+        Length of an array prefix guaranteed to contain two equal-sum pairs.
+    """
+    prefix = (1 + math.isqrt(8 * sum_count + 1)) // 2
+    while prefix * (prefix - 1) // 2 <= sum_count:
+        prefix += 1
+    return prefix
+
+
+def _create_witness(
+    array: Sequence[int],
+    sum_value: int,
+    first: tuple[int, int],
+    second: tuple[int, int],
+) -> _result.Result[_domain.SumWitness]:
+    """Create a validated SumWitness with its pairs in (i, j) order."""
+    (i, j), (k, m) = sorted((first, second))
+    return _result.bind(
+        _domain.PairFactory.create(array[i], array[j], i, j),
+        lambda left: _result.map(
+            _domain.PairFactory.create(array[k], array[m], k, m),
+            lambda right: _domain.SumWitness(sum_value, left, right),
+        ),
+    )
+
+
+class IncrementalSumIndex:
+    """Sum-keyed index of ``(i, j)`` pairs that grows as elements arrive.
+
+    Each appended element is paired with every earlier one, so chunks can be
+    indexed while later chunks are still being read. Groups are only final once
+    the whole input has been added.
+    """
+
+    def __init__(self, metrics: MetricsSink | None = None) -> None:
+        """Initialize an empty index with an optional metrics sink."""
+        self._metrics = metrics
+        self._values: list[int] = []
+        self._table: dict[int, list[tuple[int, int]]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of elements added so far."""
+        return len(self._values)
+
+    def extend(self, chunk: Iterable[int]) -> None:
+        """Append chunk to the array and index its pairs with all earlier elements.
+
+        Args:
+            chunk: Next consecutive elements of the array.
+        """
+        values = self._values
+        table = self._table
+        start = len(values)
+        for j, right in enumerate(chunk, start):
+            for i in range(j):
+                table.setdefault(values[i] + right, []).append((i, j))
+            values.append(right)
+
+        added = len(values) - start
+        _metrics.count(
+            self._metrics, "pairs_generated", added * (start + len(values) - 1) // 2
+        )
+
+    def iter_sum_groups(self) -> Iterator[_domain.SumGroup]:
+        """Yield the groups of the complete array in sum order, emptying the index.
+
+        Returns:
+            Iterator of SumGroups with pairs in (i, j) order, like
+            IndexBasedStrategy.
+        """
+        table = self._table
+        _metrics.count(self._metrics, "distinct_sums", len(table))
+        emitted = 0
+        for sum_value in sorted(table):
+            index_pairs = table.pop(sum_value)
+            if len(index_pairs) < 2:
+                continue
+            # Pairs were appended by right index; restore (i, j) order.
+            index_pairs.sort()
+            match create_sum_group(self._values, sum_value, index_pairs):
+                case _domain.SumGroup() as sum_group:
+                    emitted += 1
+                    yield sum_group
+                case _result.Error():
+                    continue
+
+        _metrics.count(self._metrics, "groups_emitted", emitted)
+
+
+class SlidingWindowIndex:
+    """Sum index over the pairs of an unbounded stream at most window apart.
+
+    Only pairs whose elements are both among the last ``window + 1`` are kept.
+    Each arriving element adds its pairs with the previous window elements and
+    evicts the pairs of the element leaving the window, so memory stays within
+    O(window^2) pairs and work within O(window) per element, plus the size of
+    any group reported. Live elements sit in a ring of ``window + 1`` slots,
+    element k at slot ``k % (window + 1)``, so each lookup is O(1).
+    """
+
+    def __init__(self, window: int, metrics: MetricsSink | None = None) -> None:
+        """Initialize an empty index.
+
+        Args:
+            window: Largest index distance |i - j| of a pair; at least 1.
+            metrics: Optional metrics sink counting pairs and events.
+        """
+        self._window = window
+        self._metrics = metrics
+        self._ring = [0] * (window + 1)
+        self._count = 0
+        self._table: dict[int, dict[tuple[int, int], None]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of elements seen so far."""
+        return self._count
+
+    def push(self, value: int) -> list[_domain.SumGroupEvent]:
+        """Add the next element and report the groups its pairs join.
+
+        Args:
+            value: Next element of the stream.
+
+        Returns:
+            One event per sum, in sum order, that now has two or more in-window
+            pairs thanks to this element, each carrying every live pair of it.
+        """
+        ring, table, slots = self._ring, self._table, self._window + 1
+        j = self._count
+        if j > self._window:
+            self._evict(j - slots)
+
+        joined: set[int] = set()
+        start = max(0, j - self._window)
+        for i in range(start, j):
+            pair_sum = ring[i % slots] + value
+            bucket = table.setdefault(pair_sum, {})
+            bucket[(i, j)] = None
+            if len(bucket) >= 2:
+                joined.add(pair_sum)
+        ring[j % slots] = value
+        self._count = j + 1
+        _metrics.count(self._metrics, "pairs_generated", j - start)
+
+        events = [
+            _domain.SumGroupEvent(j, sum_group)
+            for pair_sum in sorted(joined)
+            if isinstance(sum_group := self._live_group(pair_sum), _domain.SumGroup)
+        ]
+        _metrics.count(self._metrics, "groups_emitted", len(events))
+        return events
+
+    def _evict(self, i: int) -> None:
+        """Drop every pair of element i, the oldest live one."""
+        ring, slots = self._ring, self._window + 1
+        left = ring[i % slots]
+        for k in range(i + 1, self._count):
+            pair_sum = left + ring[k % slots]
+            bucket = self._table[pair_sum]
+            del bucket[(i, k)]
+            if not bucket:
+                del self._table[pair_sum]
+
+    def _live_group(self, pair_sum: int) -> _result.Result[_domain.SumGroup]:
+        """Build the group of the live pairs of pair_sum in (i, j) order."""
+        ring, slots = self._ring, self._window + 1
+        pairs: list[_domain.Pair] = []
+        for i, j in sorted(self._table[pair_sum]):
+            match _domain.PairFactory.create(ring[i % slots], ring[j % slots], i, j):
+                case _domain.Pair() as pair:
+                    pairs.append(pair)
+                case error:
+                    return error
+        return _domain.SumGroupFactory.create(pair_sum, tuple(pairs))
+
+
+def _create_sum_groups(
+    array: Sequence[int],
+    metrics: MetricsSink | None,
+    candidates: Iterable[tuple[int, Sequence[tuple[int, int]]]],
+) -> _result.Result[Sequence[_domain.SumGroup]]:
+    """Create SumGroups from (sum, index pairs) candidates given in sum order.
+
+    Sums with fewer than two pairs are skipped before any Pair is built; the
+    remaining candidates are validated by the domain factories like
+    IndexBasedStrategy does, dropping groups the factories reject.
+    """
+    valid_groups: list[_domain.SumGroup] = []
+
+    for sum_value, index_pairs in candidates:
+        if len(index_pairs) < 2:
+            continue
+        match create_sum_group(array, sum_value, index_pairs):
+            case _domain.SumGroup() as sum_group:
+                valid_groups.append(sum_group)
+            case _result.Error():
+                continue
+
+    _metrics.count(metrics, "groups_emitted", len(valid_groups))
+    return tuple(valid_groups)
+
+
+def create_sum_group(
+    array: Sequence[int], sum_value: int, index_pairs: Sequence[tuple[int, int]]
+) -> _result.Result[_domain.SumGroup]:
+    """Create one validated SumGroup from index pairs sharing sum_value.
+
+    Args:
+        array: Array the indices refer to.
+        sum_value: Sum shared by every pair.
+        index_pairs: (i, j) index pairs, each with i < j.
+
+    Returns:
+        Result containing the SumGroup, or the first error of the domain
+        factories.
+    """
+    pairs: list[_domain.Pair] = []
+
+    for i, j in index_pairs:
+        match _domain.PairFactory.create(array[i], array[j], i, j):
+            case _domain.Pair() as pair:
+                pairs.append(pair)
+            case error:
+                return error
+
+    return _domain.SumGroupFactory.create(sum_value, tuple(pairs))
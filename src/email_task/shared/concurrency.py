@@ -0,0 +1,44 @@
+"""Runtime probes for choosing between threads, processes and serial execution."""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+
+def gil_enabled() -> bool:
+    """Return whether the GIL is active in this interpreter.
+
+    Free-threaded builds (e.g. 3.13t) can run with the GIL disabled, in which
+    case pure-Python threads execute in parallel.
+
+    Returns:
+        False only on a free-threaded build running without the GIL.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def usable_cpus() -> int:
+    """Return the number of CPUs this process may run on, at least 1."""
+    return os.process_cpu_count() or 1
+
+
+def process_context() -> BaseContext:
+    """Return a process start method that is safe from a multi-threaded parent.
+
+    fork copies the parent while other threads may hold locks, so forkserver
+    is used where the platform offers it and spawn elsewhere.
+
+    Returns:
+        Multiprocessing context for ProcessPoolExecutor's mp_context.
+    """
+    import multiprocessing
+
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from dataclasses import dataclass
+from itertools import pairwise
 
 from email_task.shared import errors as _errors
 from email_task.shared import result as _result
@@ -117,3 +118,116 @@ class SumGroupFactory:
                 return _errors.ApplicationErrorFactory.invalid_sum_group_error()
             case (value, pairs_seq):
                 return SumGroup(sum_value=value, pairs=pairs_seq)
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedTuple:
+    """Represents k array values taken at strictly increasing indices."""
+
+    values: tuple[int, ...]
+    indices: tuple[int, ...]
+
+    @property
+    def sum(self) -> int:
+        """Calculate the sum of the tuple values."""
+        return sum(self.values)
+
+
+class IndexedTupleFactory:
+    """Factory for creating indexed tuples."""
+
+    @staticmethod
+    def create(
+        values: Sequence[int], indices: Sequence[int]
+    ) -> _result.Result[IndexedTuple]:
+        """Create an indexed tuple with validation.
+
+        Args:
+            values: Values of the elements, in index order.
+            indices: Indices of the elements in the array.
+
+        Returns:
+            Result containing IndexedTuple or validation error.
+        """
+        match (tuple(values), tuple(indices)):
+            case (vals, _) if None in vals:
+                return _errors.ApplicationErrorFactory.null_value_error()
+            case (vals, idx) if len(vals) != len(idx):
+                return _errors.ApplicationErrorFactory.invalid_indices_error()
+            case (_, idx) if any(index < 0 for index in idx):
+                return _errors.ApplicationErrorFactory.negative_index_error()
+            case (_, idx) if any(a >= b for a, b in pairwise(idx)):
+                return _errors.ApplicationErrorFactory.invalid_indices_error()
+            case (vals, idx):
+                return IndexedTuple(values=vals, indices=idx)
+
+
+@dataclass(frozen=True, slots=True)
+class TupleGroup:
+    """Represents a group of equally sized tuples that have the same sum."""
+
+    sum_value: int
+    tuples: Sequence[IndexedTuple]
+
+
+class TupleGroupFactory:
+    """Factory for creating tuple groups."""
+
+    @staticmethod
+    def create(
+        sum_value: int, tuples: Sequence[IndexedTuple]
+    ) -> _result.Result[TupleGroup]:
+        """Create a tuple group with the same rules as SumGroupFactory.
+
+        Args:
+            sum_value: The sum value that all tuples must have.
+            tuples: Sequence of tuples with the same sum and size.
+
+        Returns:
+            Result containing TupleGroup or validation error.
+        """
+        match (sum_value, tuples):
+            case (None, _):
+                return _errors.ApplicationErrorFactory.null_value_error()
+            case (value, _) if value < 0:
+                return _errors.ApplicationErrorFactory.negative_value_error()
+            case (_, tuples_seq) if len(tuples_seq) < 2:
+                return _errors.ApplicationErrorFactory.min_sum_group_error()
+            case (value, tuples_seq) if any(
+                item.sum != value or len(item.values) != len(tuples_seq[0].values)
+                for item in tuples_seq
+            ):
+                return _errors.ApplicationErrorFactory.invalid_sum_group_error()
+            case (value, tuples_seq):
+                return TupleGroup(sum_value=value, tuples=tuples_seq)
+
+
+@dataclass(frozen=True, slots=True)
+class SumWitness:
+    """Two distinct pairs proving that some sum is shared, in (i, j) order."""
+
+    sum_value: int
+    first: Pair
+    second: Pair
+
+
+@dataclass(frozen=True, slots=True)
+class SumGroupEvent:
+    """A group of in-window pairs that formed or grew when an element arrived."""
+
+    position: int
+    """Index of the element whose arrival completed the new pair."""
+    group: SumGroup
+
+
+@dataclass(frozen=True, slots=True)
+class HeavySumEstimate:
+    """A sum likely shared by many pairs, with bounds on its true pair count."""
+
+    sum_value: int
+    estimate: int
+    """Count-min sketch estimate; never below the true count."""
+    lower_bound: int
+    """Heavy-hitter table count; never above the true count."""
+    upper_bound: int
+    """Tightest upper bound both summaries allow."""
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import StrEnum
+from typing import TYPE_CHECKING
 
 from email_task.shared import result as _result
 
+if TYPE_CHECKING:
+    from email_task.shared import domain as _domain
+
 
 class ErrorMessages(StrEnum):
     """Error message constants."""
@@ -26,6 +31,27 @@ class ErrorMessages(StrEnum):
     NO_ARGUMENTS_ERROR = "No array elements provided. Usage: uv run email-task 6 4 12 10 22 54 32 42 21 11"
     MIN_ARGUMENTS_ERROR = "At least two array elements are required to form pairs."
     INVALID_ARGUMENT_ERROR = "Invalid integer received."
+    INVALID_INPUT_ERROR = "Input must be a sequence or buffer of integers."
+    INVALID_LIMIT_ERROR = "Limit must be a non-negative integer."
+    INVALID_TUPLE_SIZE_ERROR = "Tuple size must be at least 2."
+    INVALID_CURSOR_ERROR = "Pagination cursor is malformed."
+    CONFLICTING_OPTIONS_ERROR = (
+        "Use only one of strategy, max_memory and deadline per pair finder."
+    )
+    VALUE_RANGE_ERROR = "Values must fit in a signed 64-bit integer."
+    # Input/Output Errors
+    INPUT_FILE_ERROR = "Input file could not be read."
+    CHECKPOINT_ERROR = "Checkpoint file is unreadable or was written for other input."
+    CHECKPOINT_WRITE_ERROR = "Checkpoint file could not be written."
+    INDEX_FILE_ERROR = "Index file is unreadable or not a sum index."
+    INDEX_WRITE_ERROR = "Index file could not be written."
+    # Processing Errors
+    WORKER_FAILED_ERROR = "Worker process terminated unexpectedly."
+    RECORD_FAILED_ERROR = "Record could not be processed."
+    CLUSTER_WORKER_ERROR = "Cluster worker was unreachable or failed its shard."
+    DEADLINE_EXCEEDED_ERROR = "Deadline reached before every pair was enumerated."
+    # Resource Errors
+    MEMORY_BUDGET_EXCEEDED_ERROR = "Estimated memory use exceeds the memory budget."
 
 
 class ErrorCodes(StrEnum):
@@ -35,6 +61,9 @@ class ErrorCodes(StrEnum):
     PARSE_ERROR = "ParseError"
     VALIDATION_ERROR = "ValidationError"
     PROCESSING_ERROR = "ProcessingError"
+    IO_ERROR = "IOError"
+    RESOURCE_ERROR = "ResourceError"
+    TIMEOUT_ERROR = "TimeoutError"
 
 
 @dataclass(frozen=True, slots=True)
@@ -47,6 +76,16 @@ class ApplicationError:
     code: ErrorCodes
 
 
+@dataclass(frozen=True, slots=True)
+class DeadlineExceededError(ApplicationError):
+    """Partial result of a run that stopped at its deadline."""
+
+    groups: Sequence[_domain.SumGroup]
+    """Groups no unvisited pair can join, in sum order."""
+    last_index: int
+    """Last outer index whose pairs were all enumerated; -1 if none."""
+
+
 class ApplicationErrorFactory:
     """Factory for creating application errors."""
 
@@ -128,3 +167,135 @@ class ApplicationErrorFactory:
             message=ErrorMessages.INVALID_ARGUMENT_ERROR,
             code=ErrorCodes.PARSE_ERROR,
         )
+
+    @staticmethod
+    def invalid_input_error() -> _result.Error:
+        """Create an error for input that is not an integer sequence or buffer."""
+        return ApplicationError(
+            message=ErrorMessages.INVALID_INPUT_ERROR,
+            code=ErrorCodes.VALIDATION_ERROR,
+        )
+
+    @staticmethod
+    def invalid_limit_error() -> _result.Error:
+        """Create an error for a negative result limit."""
+        return ApplicationError(
+            message=ErrorMessages.INVALID_LIMIT_ERROR,
+            code=ErrorCodes.VALIDATION_ERROR,
+        )
+
+    @staticmethod
+    def invalid_tuple_size_error() -> _result.Error:
+        """Create an error for a tuple size below two."""
+        return ApplicationError(
+            message=ErrorMessages.INVALID_TUPLE_SIZE_ERROR,
+            code=ErrorCodes.VALIDATION_ERROR,
+        )
+
+    @staticmethod
+    def invalid_cursor_error() -> _result.Error:
+        """Create an error for a pagination cursor that cannot be decoded."""
+        return ApplicationError(
+            message=ErrorMessages.INVALID_CURSOR_ERROR,
+            code=ErrorCodes.VALIDATION_ERROR,
+        )
+
+    @staticmethod
+    def conflicting_options_error() -> _result.Error:
+        """Create an error for options that configure the strategy twice."""
+        return ApplicationError(
+            message=ErrorMessages.CONFLICTING_OPTIONS_ERROR,
+            code=ErrorCodes.VALIDATION_ERROR,
+        )
+
+    @staticmethod
+    def value_range_error() -> _result.Error:
+        """Create an error for values outside the int64 wire format."""
+        return ApplicationError(
+            message=ErrorMessages.VALUE_RANGE_ERROR,
+            code=ErrorCodes.VALIDATION_ERROR,
+        )
+
+    @staticmethod
+    def input_file_error() -> _result.Error:
+        """Create an error for an unreadable input file."""
+        return ApplicationError(
+            message=ErrorMessages.INPUT_FILE_ERROR,
+            code=ErrorCodes.IO_ERROR,
+        )
+
+    @staticmethod
+    def checkpoint_error() -> _result.Error:
+        """Create an error for a checkpoint that cannot be resumed from."""
+        return ApplicationError(
+            message=ErrorMessages.CHECKPOINT_ERROR,
+            code=ErrorCodes.IO_ERROR,
+        )
+
+    @staticmethod
+    def checkpoint_write_error() -> _result.Error:
+        """Create an error for a checkpoint that could not be saved."""
+        return ApplicationError(
+            message=ErrorMessages.CHECKPOINT_WRITE_ERROR,
+            code=ErrorCodes.IO_ERROR,
+        )
+
+    @staticmethod
+    def index_file_error() -> _result.Error:
+        """Create an error for a sum index file that cannot be opened."""
+        return ApplicationError(
+            message=ErrorMessages.INDEX_FILE_ERROR,
+            code=ErrorCodes.IO_ERROR,
+        )
+
+    @staticmethod
+    def index_write_error() -> _result.Error:
+        """Create an error for a sum index file that could not be saved."""
+        return ApplicationError(
+            message=ErrorMessages.INDEX_WRITE_ERROR,
+            code=ErrorCodes.IO_ERROR,
+        )
+
+    @staticmethod
+    def worker_failed_error() -> _result.Error:
+        """Create an error for a worker process that died mid-task."""
+        return ApplicationError(
+            message=ErrorMessages.WORKER_FAILED_ERROR,
+            code=ErrorCodes.PROCESSING_ERROR,
+        )
+
+    @staticmethod
+    def record_failed_error() -> _result.Error:
+        """Create an error for a batch record whose processing raised."""
+        return ApplicationError(
+            message=ErrorMessages.RECORD_FAILED_ERROR,
+            code=ErrorCodes.PROCESSING_ERROR,
+        )
+
+    @staticmethod
+    def cluster_worker_error() -> _result.Error:
+        """Create an error for a remote worker that failed to return its shard."""
+        return ApplicationError(
+            message=ErrorMessages.CLUSTER_WORKER_ERROR,
+            code=ErrorCodes.IO_ERROR,
+        )
+
+    @staticmethod
+    def memory_budget_exceeded_error() -> _result.Error:
+        """Create an error for work that cannot run within the memory budget."""
+        return ApplicationError(
+            message=ErrorMessages.MEMORY_BUDGET_EXCEEDED_ERROR,
+            code=ErrorCodes.RESOURCE_ERROR,
+        )
+
+    @staticmethod
+    def deadline_exceeded_error(
+        groups: Sequence[_domain.SumGroup], last_index: int
+    ) -> _result.Error:
+        """Create a partial result for enumeration cut short by a deadline."""
+        return DeadlineExceededError(
+            message=ErrorMessages.DEADLINE_EXCEEDED_ERROR,
+            code=ErrorCodes.TIMEOUT_ERROR,
+            groups=groups,
+            last_index=last_index,
+        )
@@ -0,0 +1,159 @@
+"""Memory sizing constants, size parsing and resident set size probes."""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+import sys
+from dataclasses import dataclass
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+PAIR_OBJECT_BYTES = 232
+"""Approximate size of a Pair with its Indices plus one list/tuple slot."""
+
+INDEX_PAIR_BYTES = 72
+"""Approximate size of an ``(i, j)`` tuple plus one list slot."""
+
+SUM_ENTRY_BYTES = 120
+"""Approximate size of one sum-keyed table entry with its bucket list."""
+
+SUM_COUNT_BYTES = 100
+"""Approximate size of one sum-to-count dict entry."""
+
+GROUPED_PAIR_BYTES = INDEX_PAIR_BYTES + PAIR_OBJECT_BYTES
+"""Bytes held per pair of a group materialized from index tuples."""
+
+BUCKET_SLOT_BYTES = 8
+"""Size of one preallocated bucket slot in the dense bucket array."""
+
+CANDIDATE_BYTES = 16
+"""Size of one packed ``(sum, count)`` int64 candidate of the bounded engine."""
+
+
+@dataclass(frozen=True, slots=True)
+class BoundedLayout:
+    """Split of a memory budget between the phases of the bounded engine.
+
+    A quarter holds the sum-to-count table of one counting pass, a quarter the
+    packed candidate sums kept across passes, and half the groups one window
+    pass materializes.
+    """
+
+    table_entries: int
+    """Sum counts one counting pass may hold."""
+    candidates: int
+    """Sums with at least two pairs that may be kept across passes."""
+    window_bytes: int
+    """Bytes for the sum entries and pairs of one window."""
+
+    @staticmethod
+    def for_budget(memory_budget: int) -> BoundedLayout:
+        """Split memory_budget bytes between the phases.
+
+        Args:
+            memory_budget: Peak bytes for tables, candidates and groups.
+
+        Returns:
+            Capacities of each phase.
+        """
+        quarter = memory_budget // 4
+        return BoundedLayout(
+            table_entries=quarter // SUM_COUNT_BYTES,
+            candidates=quarter // CANDIDATE_BYTES,
+            window_bytes=memory_budget // 2,
+        )
+
+    def partitions(self, distinct_sums: int) -> int:
+        """Return how many ``sum % P`` classes keep one class within the table.
+
+        P is the smallest prime giving each class at most table_entries of the
+        distinct sums on average; a prime keeps common strides such as even or
+        multiple-of-ten sums spread over every class.
+
+        Args:
+            distinct_sums: Upper bound on the distinct pair sums.
+
+        Returns:
+            1 when the whole table fits, otherwise a prime P.
+        """
+        needed = math.ceil(distinct_sums / max(1, self.table_entries))
+        if needed <= 1:
+            return 1
+        candidate = max(needed, 2)
+        while any(candidate % d == 0 for d in range(2, math.isqrt(candidate) + 1)):
+            candidate += 1
+        return candidate
+
+    def fits_group(self, pair_count: int) -> bool:
+        """Return whether one group of pair_count pairs fits a window.
+
+        Args:
+            pair_count: Pairs in the group.
+        """
+        return SUM_ENTRY_BYTES + pair_count * GROUPED_PAIR_BYTES <= self.window_bytes
+
+
+_SIZE_PATTERN = re.compile(r"^\s*(\d+)\s*([kmgt]?)i?b?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30, "t": 1 << 40}
+
+
+def parse_size(text: str) -> int | None:
+    """Parse a byte size such as ``"1048576"``, ``"512M"`` or ``"2GiB"``.
+
+    Units are binary multiples (K = 1024 bytes).
+
+    Args:
+        text: Size with an optional K, M, G or T suffix.
+
+    Returns:
+        Number of bytes, or None if text is not a valid size.
+    """
+    match _SIZE_PATTERN.match(text):
+        case None:
+            return None
+        case match:
+            return int(match.group(1)) * _SIZE_UNITS[match.group(2).lower()]
+
+
+def peak_rss_bytes() -> int | None:
+    """Return the peak resident set size of this process in bytes.
+
+    Returns:
+        Peak RSS, or None where the ``resource`` module is unavailable.
+    """
+    if resource is None:
+        return None
+    return maxrss_bytes(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def maxrss_bytes(maxrss: int) -> int:
+    """Convert an rusage ``ru_maxrss`` value to bytes.
+
+    Args:
+        maxrss: Peak RSS as reported by getrusage or os.wait4.
+
+    Returns:
+        Peak RSS in bytes; Linux reports kilobytes, macOS reports bytes.
+    """
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def current_rss_bytes() -> int | None:
+    """Return the current resident set size of this process in bytes.
+
+    Reads ``/proc/self/statm`` and falls back to the peak where it is missing.
+
+    Returns:
+        Current RSS, or None if it cannot be determined.
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except OSError:
+        return peak_rss_bytes()
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
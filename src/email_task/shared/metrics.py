@@ -0,0 +1,167 @@
+"""Stage timing helpers and metrics sinks.
+
+Every helper accepts ``None`` as the sink and then reduces to a plain call, so
+uninstrumented runs pay one ``is None`` check per stage or counter update.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TextIO
+
+from email_task.core.types import ProgressSink
+
+if TYPE_CHECKING:
+    from email_task.core.types import MetricsSink
+
+
+def timed_call[T, U](
+    sink: MetricsSink | None, stage: str, operation: Callable[[T], U], argument: T
+) -> U:
+    """Call operation(argument) and report its wall and CPU time to sink.
+
+    Args:
+        sink: Metrics sink, or None to call without timing.
+        stage: Stage name recorded with the timing.
+        operation: Single-argument callable to run.
+        argument: Argument passed to operation.
+
+    Returns:
+        The value returned by operation.
+    """
+    if sink is None:
+        return operation(argument)
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        return operation(argument)
+    finally:
+        sink.record_stage(
+            stage,
+            time.perf_counter() - wall_start,
+            time.process_time() - cpu_start,
+        )
+
+
+async def timed_async_call[T, U](
+    sink: MetricsSink | None,
+    stage: str,
+    operation: Callable[[T], Awaitable[U]],
+    argument: T,
+) -> U:
+    """Await operation(argument) and report its wall and CPU time to sink.
+
+    Time spent by other tasks while operation is suspended is included.
+
+    Args:
+        sink: Metrics sink, or None to await without timing.
+        stage: Stage name recorded with the timing.
+        operation: Single-argument coroutine function to await.
+        argument: Argument passed to operation.
+
+    Returns:
+        The value returned by operation.
+    """
+    if sink is None:
+        return await operation(argument)
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        return await operation(argument)
+    finally:
+        sink.record_stage(
+            stage,
+            time.perf_counter() - wall_start,
+            time.process_time() - cpu_start,
+        )
+
+
+def count(sink: MetricsSink | None, counter: str, value: int = 1) -> None:
+    """Increment counter on sink when one is attached.
+
+    Args:
+        sink: Metrics sink, or None to do nothing.
+        counter: Counter name.
+        value: Amount to add.
+    """
+    if sink is not None:
+        sink.increment(counter, value)
+
+
+def gauge(sink: MetricsSink | None, name: str, value: int | None) -> None:
+    """Record a gauge value on sink when one is attached and value is known.
+
+    Args:
+        sink: Metrics sink, or None to do nothing.
+        name: Gauge name.
+        value: Latest value, or None when it could not be measured.
+    """
+    if sink is not None and value is not None:
+        sink.record_value(name, value)
+
+
+def progress(sink: MetricsSink | None, pairs_done: int, pairs_total: int) -> None:
+    """Report enumeration progress when sink follows progress.
+
+    Args:
+        sink: Metrics sink, or None to do nothing.
+        pairs_done: Pairs enumerated so far.
+        pairs_total: All pairs of the input.
+    """
+    if sink is not None and isinstance(sink, ProgressSink):
+        sink.record_progress(pairs_done, pairs_total)
+
+
+@dataclass(slots=True)
+class StageTiming:
+    """Accumulated timing of one stage."""
+
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    calls: int = 0
+
+
+class RecordingMetricsSink:
+    """Metrics sink keeping stage timings, counters and gauges in memory."""
+
+    def __init__(self) -> None:
+        """Initialize with no recorded stages or counters."""
+        self.stages: dict[str, StageTiming] = {}
+        self.counters: dict[str, int] = {}
+        self.gauges: dict[str, int] = {}
+
+    def record_stage(self, stage: str, wall_seconds: float, cpu_seconds: float) -> None:
+        """Accumulate the timing of one stage run."""
+        timing = self.stages.setdefault(stage, StageTiming())
+        timing.wall_seconds += wall_seconds
+        timing.cpu_seconds += cpu_seconds
+        timing.calls += 1
+
+    def increment(self, counter: str, value: int = 1) -> None:
+        """Add value to a named counter."""
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def record_value(self, name: str, value: int) -> None:
+        """Replace the value of a named gauge."""
+        self.gauges[name] = value
+
+    def as_dict(self) -> dict[str, object]:
+        """Return stages, counters and gauges as a JSON-serializable mapping."""
+        return {
+            "stages": {
+                stage: {
+                    "wall_seconds": timing.wall_seconds,
+                    "cpu_seconds": timing.cpu_seconds,
+                    "calls": timing.calls,
+                }
+                for stage, timing in self.stages.items()
+            },
+            "counters": dict(self.counters),
+            "gauges": dict(self.gauges),
+        }
+
+    def dump_json(self, stream: TextIO) -> None:
+        """Write the recorded metrics to stream as one JSON document."""
+        json.dump(self.as_dict(), stream)
+        stream.write("\n")
@@ -0,0 +1,190 @@
+"""CPU and allocation profiling around a run, with flamegraph-ready output.
+
+``Profiler`` wraps any block of work, typically ``FindPairsHandler.execute``.
+On exit it writes files next to a chosen prefix:
+
+* ``cprofile``: ``PREFIX.pstats`` for ``pstats``/snakeviz, ``PREFIX.collapsed``
+  with one ``frame;frame;frame microseconds`` line per call path, and
+  ``PREFIX.txt`` with the tags and the top functions by cumulative time.
+* ``tracemalloc``: ``PREFIX.collapsed`` weighted by live bytes per allocation
+  traceback, and ``PREFIX.txt`` with the tags and the top allocation sites.
+
+Collapsed files are the input format of flamegraph.pl, speedscope and inferno.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import tracemalloc
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Literal, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+type ProfileKind = Literal["cprofile", "tracemalloc"]
+"""Profiler selected with ``--profile``."""
+
+PROFILE_KINDS: tuple[ProfileKind, ...] = ("cprofile", "tracemalloc")
+"""Accepted ProfileKind values, in ``--help`` order."""
+
+TRACEBACK_FRAMES = 32
+"""Frames kept per tracemalloc allocation traceback."""
+
+type _FunctionKey = tuple[str, int, str]
+
+_MIN_PATH_SECONDS = 1e-6
+"""Call paths below this cumulative time are not expanded further."""
+
+
+class Profiler:
+    """Context manager profiling the enclosed block and writing tagged reports."""
+
+    def __init__(self, kind: ProfileKind, prefix: str | Path, top: int = 20) -> None:
+        """Initialize the profiler.
+
+        Args:
+            kind: "cprofile" for CPU time per call path, "tracemalloc" for live
+                allocations per traceback.
+            prefix: Output path without extension; parent directories must exist.
+            top: Number of functions or allocation sites in the text summary.
+        """
+        self._kind = kind
+        self._prefix = Path(prefix)
+        self._top = top
+        self._tags: dict[str, object] = {}
+        self._profile = cProfile.Profile()
+        self.written: list[Path] = []
+        """Report files written on exit."""
+
+    def tag(self, **tags: object) -> None:
+        """Attach key=value tags, e.g. strategy and input size, to the reports.
+
+        Tags may be added until the context exits.
+        """
+        self._tags.update(tags)
+
+    def __enter__(self) -> Self:
+        """Start collecting."""
+        match self._kind:
+            case "cprofile":
+                self._profile.enable()
+            case "tracemalloc":
+                tracemalloc.start(TRACEBACK_FRAMES)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop collecting and write the reports."""
+        match self._kind:
+            case "cprofile":
+                self._profile.disable()
+                self._write_cprofile(self._profile)
+            case "tracemalloc":
+                snapshot = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+                self._write_tracemalloc(_own_allocations(snapshot))
+
+    def _write_cprofile(self, profile: cProfile.Profile) -> None:
+        """Write the pstats dump, collapsed call paths and top functions."""
+        summary = io.StringIO()
+        stats = pstats.Stats(profile, stream=summary)
+        stats.dump_stats(self._output(".pstats"))
+        self._write_text(".collapsed", "".join(_collapse_call_graph(stats)))
+
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self._top)
+        self._write_text(".txt", self._header() + summary.getvalue())
+
+    def _write_tracemalloc(self, snapshot: tracemalloc.Snapshot) -> None:
+        """Write collapsed allocation tracebacks and the top allocation sites."""
+        collapsed = (
+            f"{';'.join(_frame_name(frame) for frame in stat.traceback)} {stat.size}\n"
+            for stat in snapshot.statistics("traceback")
+        )
+        self._write_text(".collapsed", "".join(collapsed))
+
+        sites = snapshot.statistics("lineno")[: self._top]
+        lines = [
+            f"{stat.size:>12} B {stat.count:>9} blocks  {stat.traceback[0]}"
+            for stat in sites
+        ]
+        self._write_text(".txt", self._header() + "\n".join(lines) + "\n")
+
+    def _header(self) -> str:
+        """Return the tag line opening each text report."""
+        tags = " ".join(f"{key}={value}" for key, value in self._tags.items())
+        return f"# profile={self._kind} {tags}".rstrip() + "\n"
+
+    def _write_text(self, suffix: str, text: str) -> None:
+        """Write one text report."""
+        self._output(suffix).write_text(text, encoding="utf-8")
+
+    def _output(self, suffix: str) -> Path:
+        """Return the path of one report and remember it."""
+        path = self._prefix.with_name(self._prefix.name + suffix)
+        self.written.append(path)
+        return path
+
+
+def _own_allocations(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+    """Drop allocations made by tracemalloc itself."""
+    return snapshot.filter_traces(
+        [tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)]
+    )
+
+
+def _collapse_call_graph(stats: pstats.Stats) -> Iterator[str]:
+    """Expand the caller/callee graph into weighted call paths.
+
+    cProfile keeps per-edge totals rather than full stacks, so a function
+    reached along several paths has its time split between them in proportion
+    to the cumulative time each incoming edge accounts for. Recursive edges are
+    cut where they would repeat a function already on the path.
+    """
+    entries = stats.stats
+    callees: dict[_FunctionKey, list[tuple[_FunctionKey, float]]] = {}
+    roots: list[_FunctionKey] = []
+    for function, (_, _, _, cumulative, callers) in entries.items():
+        if not callers:
+            roots.append(function)
+        for caller, (_, _, _, edge_cumulative) in callers.items():
+            if cumulative > 0:
+                callees.setdefault(caller, []).append(
+                    (function, edge_cumulative / cumulative)
+                )
+
+    def walk(
+        function: _FunctionKey, share: float, path: tuple[str, ...]
+    ) -> Iterator[str]:
+        if entries[function][3] * share < _MIN_PATH_SECONDS:
+            return
+        own_time = entries[function][2] * share
+        path = (*path, _function_name(function))
+        if (micros := round(own_time * 1_000_000)) > 0:
+            yield f"{';'.join(path)} {micros}\n"
+        for callee, fraction in callees.get(function, ()):
+            if _function_name(callee) not in path:
+                yield from walk(callee, share * fraction, path)
+
+    for root in roots:
+        yield from walk(root, 1.0, ())
+
+
+def _function_name(function: _FunctionKey) -> str:
+    """Return a frame label like ``strategies.py:59(_generate_all_pairs)``."""
+    filename, line, name = function
+    if filename == "~":
+        return name
+    return f"{Path(filename).name}:{line}({name})"
+
+
+def _frame_name(frame: tracemalloc.Frame) -> str:
+    """Return a frame label like ``domain.py:88``."""
+    return f"{Path(frame.filename).name}:{frame.lineno}"
@@ -0,0 +1,124 @@
+"""Throttled progress reports for long pair enumerations.
+
+``ProgressReporter`` is a metrics sink: strategies already receive one, so no
+extra plumbing is needed, and runs without a sink keep paying only their
+``is None`` checks. Reports always go to stderr by default, never to the
+stdout stream the console formatter writes groups to.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Literal, TextIO
+
+from email_task.shared import memory as _memory
+
+if TYPE_CHECKING:
+    from email_task.core.types import MetricsSink
+
+type ProgressStyle = Literal["line", "json"]
+"""Report format selected with ``--progress``."""
+
+PROGRESS_STYLES: tuple[ProgressStyle, ...] = ("line", "json")
+"""Accepted ProgressStyle values, in ``--help`` order."""
+
+_MEBIBYTE = 1024 * 1024
+
+
+class ProgressReporter:
+    """Metrics sink reporting pairs done, throughput, RSS and ETA periodically.
+
+    Stage timings, counters and gauges are forwarded to an optional inner sink.
+    """
+
+    def __init__(
+        self,
+        style: ProgressStyle = "line",
+        inner: MetricsSink | None = None,
+        stream: TextIO | None = None,
+        interval: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the reporter.
+
+        Args:
+            style: "line" rewrites one stderr line in place, "json" writes one
+                JSON object per report.
+            inner: Sink receiving everything but progress, e.g. for --stats.
+            stream: Output stream, defaults to sys.stderr at report time.
+            interval: Minimum seconds between reports; the final report of a
+                run is always written.
+            clock: Monotonic clock in seconds, replaceable for testing.
+        """
+        self._style = style
+        self._inner = inner
+        self._stream = stream
+        self._interval = interval
+        self._clock = clock
+        self._started: float | None = None
+        self._next_report = 0.0
+        self._line_width = 0
+        self._last_done = -1
+
+    def record_stage(self, stage: str, wall_seconds: float, cpu_seconds: float) -> None:
+        """Forward a stage timing to the inner sink."""
+        if self._inner is not None:
+            self._inner.record_stage(stage, wall_seconds, cpu_seconds)
+
+    def increment(self, counter: str, value: int = 1) -> None:
+        """Forward a counter update to the inner sink."""
+        if self._inner is not None:
+            self._inner.increment(counter, value)
+
+    def record_value(self, name: str, value: int) -> None:
+        """Forward a gauge value to the inner sink."""
+        if self._inner is not None:
+            self._inner.record_value(name, value)
+
+    def record_progress(self, pairs_done: int, pairs_total: int) -> None:
+        """Write a report unless one was written less than interval ago."""
+        if pairs_done == self._last_done:
+            return
+        now = self._clock()
+        if self._started is None or pairs_done < self._last_done:
+            self._started = now
+            self._next_report = 0.0
+        self._last_done = pairs_done
+        finished = pairs_done >= pairs_total
+        if now < self._next_report and not finished:
+            return
+        self._next_report = now + self._interval
+
+        elapsed = now - self._started
+        rate = pairs_done / elapsed if elapsed > 0 else 0.0
+        eta = (pairs_total - pairs_done) / rate if rate > 0 else None
+        rss = _memory.current_rss_bytes()
+        stream = self._stream or sys.stderr
+        match self._style:
+            case "json":
+                event = {
+                    "event": "progress",
+                    "pairs_done": pairs_done,
+                    "pairs_total": pairs_total,
+                    "pairs_per_second": round(rate),
+                    "rss_bytes": rss,
+                    "eta_seconds": None if eta is None else round(eta, 3),
+                }
+                stream.write(json.dumps(event) + "\n")
+            case "line":
+                percent = 100 * pairs_done / pairs_total if pairs_total else 100.0
+                memory = "?" if rss is None else f"{rss / _MEBIBYTE:.0f} MiB"
+                remaining = "?" if eta is None else f"{eta:.1f}s"
+                line = (
+                    f"{pairs_done}/{pairs_total} pairs ({percent:.1f}%) "
+                    f"{rate:,.0f} pairs/s  RSS {memory}  ETA {remaining}"
+                )
+                # Pad over the tail of a longer previous line.
+                stream.write("\r" + line.ljust(self._line_width))
+                self._line_width = 0 if finished else len(line)
+                if finished:
+                    stream.write("\n")
+        stream.flush()
@@ -0,0 +1,90 @@
+"""Int64 arrays in shared memory for zero-copy hand-off to worker processes."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from multiprocessing import shared_memory
+from types import TracebackType
+from typing import Self
+
+INT64_BYTES = 8
+"""Size of one element in the shared block."""
+
+SAFE_VALUE_BOUND = 1 << 62
+"""Values in [-bound, bound) have pairwise sums that also fit in an int64."""
+
+
+class SharedInt64Array:
+    """Owner of a shared-memory int64 copy of an array.
+
+    The creating process owns the segment and unlinks it when the context
+    exits, whether the work succeeded, raised or lost a worker process.
+    Workers attach with ``attach`` and never unlink. If the owner itself dies,
+    the multiprocessing resource tracker removes the segment.
+    """
+
+    def __init__(self, values: Sequence[int]) -> None:
+        """Copy values into a new shared-memory block.
+
+        Args:
+            values: Integers within the int64 range.
+
+        Raises:
+            OverflowError: If a value does not fit in an int64.
+        """
+        packed = array("q", values)
+        self._length = len(packed)
+        self._memory = shared_memory.SharedMemory(
+            create=True, size=max(1, self._length * INT64_BYTES)
+        )
+        self._memory.buf[: self._length * INT64_BYTES] = packed.tobytes()
+
+    @property
+    def name(self) -> str:
+        """Name under which workers attach to the block."""
+        return self._memory.name
+
+    def __len__(self) -> int:
+        """Return the number of elements."""
+        return self._length
+
+    def __enter__(self) -> Self:
+        """Return self; the block is unlinked when the context exits."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release and unlink the block."""
+        self._memory.close()
+        self._memory.unlink()
+
+    @staticmethod
+    def fits(values: Sequence[int]) -> bool:
+        """Return whether values and all their pairwise sums fit in an int64.
+
+        Args:
+            values: Non-empty integer sequence to check.
+        """
+        return -SAFE_VALUE_BOUND <= min(values) and max(values) < SAFE_VALUE_BOUND
+
+
+def attach(name: str, length: int) -> tuple[shared_memory.SharedMemory, memoryview]:
+    """Attach to a block created by SharedInt64Array without taking ownership.
+
+    The segment is not registered with this process's resource tracker, so a
+    worker exiting, or crashing, never unlinks it under the owner.
+
+    Args:
+        name: Name of the shared block.
+        length: Number of int64 elements in the block.
+
+    Returns:
+        The attached SharedMemory, to keep alive, and an int64 view of it.
+    """
+    memory = shared_memory.SharedMemory(name=name, track=False)
+    return memory, memory.buf[: length * INT64_BYTES].cast("q")
@@ -0,0 +1,104 @@
+"""Tests for the library-level find pairs API."""
+
+from __future__ import annotations
+
+from array import array
+
+import email_task
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import errors as _errors
+from email_task.shared import result as _result
+
+
+def test_find_pairs_when_list_should_match_strategy_output() -> None:
+    """Test find_pairs returns the same SumGroups as the strategy."""
+    # Arrange
+    numbers = [6, 4, 12, 10, 22, 54, 32, 42, 21, 11]
+    expected = _strategies.IndexBasedStrategy().collect_sum_pairs(numbers)
+
+    # Act
+    result = email_task.find_pairs(numbers)
+
+    # Assert
+    assert not isinstance(result, _result.Error)
+    assert result == expected
+
+
+def test_find_pairs_when_buffer_should_read_without_tuple_copy() -> None:
+    """Test find_pairs accepts buffer-protocol objects such as array.array."""
+    # Arrange
+    numbers = array("q", [1, 3, 2, 4])
+
+    # Act
+    result = email_task.find_pairs(memoryview(numbers).cast("B").cast("q", (2, 2)))
+
+    # Assert
+    assert not isinstance(result, _result.Error)
+    assert [group.sum_value for group in result] == [5]
+
+
+def test_find_pairs_when_float_buffer_should_return_validation_error() -> None:
+    """Test find_pairs rejects buffers of non-integer formats."""
+    # Act
+    result = email_task.find_pairs(memoryview(array("d", [1.0, 2.0])))
+
+    # Assert
+    assert isinstance(result, _result.Error)
+    assert result.message == _errors.ErrorMessages.INVALID_INPUT_ERROR
+
+
+def test_iter_find_pairs_when_limit_should_yield_lowest_sums_first() -> None:
+    """Test iter_find_pairs honours the limit with a reused strategy."""
+    # Arrange
+    finder = email_task.PairFinder(_strategies.IndexBasedStrategy())
+    numbers = [1, 5, 2, 4, 3, 3]
+
+    # Act
+    first = finder.iter_find_pairs(numbers, limit=2)
+    second = finder.find_pairs(numbers, limit=0)
+
+    # Assert
+    assert not isinstance(first, _result.Error)
+    assert [group.sum_value for group in first] == [4, 5]
+    assert second == ()
+
+
+def test_find_pairs_when_negative_limit_should_return_validation_error() -> None:
+    """Test find_pairs rejects negative limits."""
+    # Act
+    result = email_task.find_pairs([1, 2, 3], limit=-1)
+
+    # Assert
+    assert isinstance(result, _result.Error)
+    assert result.message == _errors.ErrorMessages.INVALID_LIMIT_ERROR
+
+
+def test_find_pairs_when_options_conflict_should_return_validation_error() -> None:
+    """Test a strategy, budget or deadline given together is rejected, not dropped."""
+    # Arrange
+    numbers = [1, 5, 2, 4, 3, 3]
+    strategy = _strategies.IndexBasedStrategy()
+
+    # Act
+    results = [
+        email_task.find_pairs(numbers, strategy=strategy, max_memory=1 << 20),
+        email_task.find_pairs(numbers, strategy=strategy, deadline=60),
+        email_task.iter_find_pairs(numbers, max_memory=1 << 20, deadline=60),
+        email_task.PairFinder(strategy, deadline=60).find_pairs(numbers),
+    ]
+
+    # Assert
+    assert all(isinstance(result, _result.Error) for result in results)
+    assert {result.message for result in results} == {
+        _errors.ErrorMessages.CONFLICTING_OPTIONS_ERROR
+    }
+
+
+def test_iter_find_pairs_when_deadline_given_should_stream_complete_groups() -> None:
+    """Test iter_find_pairs accepts a deadline like find_pairs."""
+    # Act
+    result = email_task.iter_find_pairs([1, 5, 2, 4, 3, 3], deadline=60)
+
+    # Assert
+    assert not isinstance(result, _result.Error)
+    assert [group.sum_value for group in result] == [4, 5, 6, 7, 8]
@@ -0,0 +1,130 @@
+"""Tests for the asyncio reader, writer and overlapped handler."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import random
+import sys
+from array import array
+
+import pytest
+
+from email_task.features.find_pairs import async_handler as _async_handler
+from email_task.features.find_pairs import async_io as _async_io
+from email_task.features.find_pairs import formatter as _formatter
+from email_task.features.find_pairs import strategies as _strategies
+
+
+def _run_pipeline(data: bytes, reader_type: type, chunk_bytes: int) -> str:
+    """Feed data through an asyncio stream and return the written text."""
+
+    async def pipeline() -> str:
+        stream = asyncio.StreamReader()
+        stream.feed_data(data)
+        stream.feed_eof()
+        output = io.StringIO()
+        await _async_handler.AsyncFindPairsHandler(
+            reader=reader_type(stream, chunk_bytes=chunk_bytes),
+            writer=_async_io.AsyncConsoleWriter(output, batch_lines=2),
+            queue_size=1,
+        ).execute()
+        return output.getvalue()
+
+    return asyncio.run(pipeline())
+
+
+def _expected_output(numbers: list[int], capsys: pytest.CaptureFixture[str]) -> str:
+    """Return what the synchronous console path prints for numbers."""
+    groups = _strategies.IndexBasedStrategy().collect_sum_pairs(numbers)
+    _formatter.ConsoleFormatter().write_pairs_result(groups)
+    return capsys.readouterr().out
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 7, 1 << 16])
+def test_execute_when_text_split_across_reads_should_match_sync_output(
+    chunk_bytes: int, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test numbers cut by read boundaries are reassembled before indexing."""
+    # Arrange
+    rng = random.Random(chunk_bytes)
+    numbers = [rng.randrange(-50, 200) for _ in range(60)]
+    data = ", ".join(map(str, numbers)).encode()
+    expected = _expected_output(numbers, capsys)
+
+    # Act
+    output = _run_pipeline(data, _async_io.AsyncTextReader, chunk_bytes)
+
+    # Assert
+    assert output == expected
+
+
+def test_execute_when_int64_input_should_match_sync_output(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test raw int64 input, including values split across reads."""
+    # Arrange
+    numbers = [6, 4, 12, 10, 22, 54, 32, 42, 21, 11, -(2**40)]
+    data = array("q", numbers).tobytes()
+    expected = _expected_output(numbers, capsys)
+
+    # Act
+    output = _run_pipeline(data, _async_io.AsyncInt64Reader, 12)
+
+    # Assert
+    assert output == expected
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        (b"1 2 x 4", "Error: Invalid integer received.\n"),
+        (b"7", "Error: At least two array elements are required to form pairs.\n"),
+        (b"1 2 3", "No pairs with the same sum found.\n"),
+    ],
+)
+def test_execute_when_input_has_no_groups_should_write_single_line(
+    data: bytes, message: str
+) -> None:
+    """Test parse errors, short input and empty results end the stream cleanly."""
+    # Act
+    output = _run_pipeline(data, _async_io.AsyncTextReader, 2)
+
+    # Assert
+    assert output == message
+
+
+def test_execute_when_input_file_missing_should_write_io_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test an unreadable path reports the input file error."""
+    # Arrange
+    output = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", output)
+    handler = _async_handler.AsyncFindPairsHandler(
+        reader=_async_io.AsyncTextReader("/nonexistent/input.txt"),
+        writer=_async_io.AsyncConsoleWriter(),
+    )
+
+    # Act
+    asyncio.run(handler.execute())
+
+    # Assert
+    assert output.getvalue() == "Error: Input file could not be read.\n"
+
+
+def test_iter_sum_groups_when_built_incrementally_should_match_index_strategy() -> None:
+    """Test indexing chunk by chunk yields the index-based groups exactly."""
+    # Arrange
+    rng = random.Random(7)
+    numbers = [rng.randrange(-20, 40) for _ in range(45)]
+    index = _strategies.IncrementalSumIndex()
+
+    # Act
+    for start in range(0, len(numbers), 8):
+        index.extend(numbers[start : start + 8])
+
+    # Assert
+    assert tuple(index.iter_sum_groups()) == (
+        _strategies.IndexBasedStrategy().collect_sum_pairs(numbers)
+    )
@@ -0,0 +1,154 @@
+"""Tests for batch processing of many arrays per invocation."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+from email_task.features.batch import handler as _handler
+from email_task.features.batch import reader as _reader
+from email_task.features.find_pairs import formatter as _formatter
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import domain as _domain
+from email_task.shared import errors as _errors
+from email_task.shared import result as _result
+
+
+class RecordingWriter:
+    """Output writer collecting every result it receives."""
+
+    def __init__(self) -> None:
+        self.results: list[_result.Result[Sequence[_domain.SumGroup]]] = []
+
+    def write_pairs_result(
+        self, result: _result.Result[Sequence[_domain.SumGroup]]
+    ) -> None:
+        self.results.append(result)
+
+
+class FaultyStrategy:
+    """Strategy that crashes its worker on 13 and raises on 7; picklable."""
+
+    def collect_sum_pairs(
+        self, array: Sequence[int]
+    ) -> _result.Result[Sequence[_domain.SumGroup]]:
+        if 13 in array:
+            os._exit(1)
+        if 7 in array:
+            raise MemoryError
+        return _strategies.HashGroupingStrategy().collect_sum_pairs(array)
+
+
+def test_read_records_when_mixed_separators_should_parse_each_line(
+    tmp_path: Path,
+) -> None:
+    """Test BatchFileReader accepts whitespace and comma separated records."""
+    # Arrange
+    path = tmp_path / "input.txt"
+    path.write_text("# header\n1 2 3\n\n4,5, 6\n")
+
+    # Act
+    records = _reader.BatchFileReader(str(path)).read_records()
+
+    # Assert
+    assert not isinstance(records, _result.Error)
+    assert list(records) == [(1, 2, 3), (4, 5, 6)]
+
+
+def test_read_records_when_file_missing_should_return_io_error(
+    tmp_path: Path,
+) -> None:
+    """Test BatchFileReader reports unreadable input through the Result channel."""
+    # Act
+    result = _reader.BatchFileReader(str(tmp_path / "missing.txt")).read_records()
+
+    # Assert
+    assert isinstance(result, _result.Error)
+    assert result.code == _errors.ErrorCodes.IO_ERROR
+
+
+def test_execute_when_bad_record_should_keep_order_and_continue(
+    tmp_path: Path,
+) -> None:
+    """Test BatchHandler writes per-record results in input order."""
+    # Arrange
+    path = tmp_path / "input.txt"
+    path.write_text("1 3 2 4\n5 abc\n1 2 4 8\n2 2 2\n")
+    writer = RecordingWriter()
+    handler = _handler.BatchHandler(
+        reader=_reader.BatchFileReader(str(path)),
+        writer=writer,
+        workers=2,
+        max_in_flight=1,
+    )
+
+    # Act
+    handler.execute()
+
+    # Assert
+    first, second, third, fourth = writer.results
+    assert not isinstance(first, _result.Error)
+    assert [group.sum_value for group in first] == [5]
+    assert isinstance(second, _result.Error)
+    assert second.message == _errors.ErrorMessages.INVALID_ARGUMENT_ERROR
+    assert third == ()
+    assert not isinstance(fourth, _result.Error)
+    assert [len(group.pairs) for group in fourth] == [3]
+
+
+def test_execute_when_worker_crashes_or_raises_should_fail_only_that_record(
+    tmp_path: Path,
+) -> None:
+    """Test a crash or exception never spills onto the records around it."""
+    # Arrange
+    path = tmp_path / "input.txt"
+    path.write_text("1 3 2 4\n13 1 2\n1 2 3 4\n7 1 2\n2 2 2\n")
+    writer = RecordingWriter()
+    handler = _handler.BatchHandler(
+        reader=_reader.BatchFileReader(str(path)),
+        strategy=FaultyStrategy(),
+        writer=writer,
+        workers=2,
+        max_in_flight=4,
+    )
+
+    # Act
+    handler.execute()
+
+    # Assert
+    first, crashed, third, raised, fifth = writer.results
+    assert [group.sum_value for group in first] == [5]
+    assert isinstance(crashed, _result.Error)
+    assert crashed.message == _errors.ErrorMessages.WORKER_FAILED_ERROR
+    assert [group.sum_value for group in third] == [5]
+    assert isinstance(raised, _result.Error)
+    assert raised.message == _errors.ErrorMessages.RECORD_FAILED_ERROR
+    assert [len(group.pairs) for group in fifth] == [3]
+
+
+def test_execute_when_console_writer_should_prefix_record_numbers(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test each console result starts with its record number."""
+    # Arrange
+    path = tmp_path / "input.txt"
+    path.write_text("# arrays\n1 3 2 4\n\n5 abc\n")
+    handler = _handler.BatchHandler(
+        reader=_reader.BatchFileReader(str(path)),
+        writer=_formatter.ConsoleFormatter(),
+        workers=1,
+    )
+
+    # Act
+    handler.execute()
+
+    # Assert
+    assert capsys.readouterr().out.splitlines() == [
+        "Record 1:",
+        "Pairs : (1, 4) (3, 2) have sum : 5",
+        "Record 2:",
+        f"Error: {_errors.ErrorMessages.INVALID_ARGUMENT_ERROR}",
+    ]
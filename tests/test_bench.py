@@ -0,0 +1,92 @@
+"""Tests for the synthetic workload generator and the end-to-end load runner."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from email_task.features.bench import load as _load
+from email_task.features.bench import workload as _workload
+
+
+def test_generate_workload_when_same_spec_should_return_same_array() -> None:
+    """Test a seed reproduces its array and another seed does not."""
+    # Arrange
+    spec = _workload.WorkloadSpec(size=200, max_value=50, seed=7)
+
+    # Act
+    first = _workload.generate_workload(spec)
+    second = _workload.generate_workload(spec)
+    other = _workload.generate_workload(_workload.WorkloadSpec(200, 50, seed=8))
+
+    # Assert
+    assert first == second
+    assert first != other
+    assert all(0 <= value <= 50 for value in first)
+
+
+def test_generate_workload_when_ratios_given_should_mix_duplicates_and_signs() -> None:
+    """Test the duplicate and negative ratios shape the generated values."""
+    # Arrange
+    spec = _workload.WorkloadSpec(
+        size=2000, max_value=10**12, duplicate_ratio=0.5, negative_ratio=1.0
+    )
+
+    # Act
+    values = _workload.generate_workload(spec)
+
+    # Assert
+    assert all(value <= 0 for value in values)
+    assert 0.4 < 1 - len(set(values)) / len(values) < 0.6
+
+
+@pytest.mark.parametrize(
+    ("fraction", "expected"), [(0.0, 1.0), (0.5, 5.0), (0.9, 9.0), (0.99, 10.0)]
+)
+def test_percentile_when_samples_sorted_should_use_nearest_rank(
+    fraction: float, expected: float
+) -> None:
+    """Test the percentile picks the smallest sample covering the fraction."""
+    # Act
+    result = _load.percentile([float(value) for value in range(1, 11)], fraction)
+
+    # Assert
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("mode", "input_format"),
+    [("argv", "text"), ("stdin", "int64"), ("file", "text")],
+)
+def test_run_load_when_command_succeeds_should_report_every_request(
+    mode: _load.InputMode, input_format: _workload.InputFormat
+) -> None:
+    """Test each input path runs the real entry point and its output is counted."""
+    # Arrange
+    values = _workload.generate_workload(_workload.WorkloadSpec(size=30, max_value=9))
+
+    # Act
+    report = _load.run_load(
+        values, mode=mode, input_format=input_format, concurrency=2, requests=3
+    )
+
+    # Assert
+    assert report.requests == 3
+    assert report.failures == 0
+    assert report.output_bytes_per_second > 0
+    assert report.latency_p50_seconds <= report.latency_max_seconds
+
+
+def test_run_once_when_output_reports_error_should_mark_run_failed() -> None:
+    """Test an "Error:" reply counts as a failure even though the exit code is 0."""
+    # Arrange
+    command = [sys.executable, "-c", "print('Error: Invalid integer received.')"]
+
+    # Act
+    sample = _load.run_once(command)
+
+    # Assert
+    assert sample.exit_code == 0
+    assert sample.reported_error
+    assert sample.failed
@@ -0,0 +1,106 @@
+"""Tests for the benchmark suite workloads and regression checks."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from benchmarks import __main__ as _runner
+from benchmarks import suite as _suite
+from benchmarks import workloads as _workloads
+
+
+def _measurement(ops_per_sec: float, peak: int) -> _suite.Measurement:
+    return _suite.Measurement("strategy:index", "uniform", 100, ops_per_sec, peak)
+
+
+def test_generate_when_same_seed_should_be_reproducible() -> None:
+    """Test workloads are deterministic per seed, distribution and size."""
+    # Act
+    first = _workloads.generate("negative", 50, seed=7)
+    second = _workloads.generate("negative", 50, seed=7)
+
+    # Assert
+    assert first == second
+    assert len(first) == 50
+    assert min(first) < 0
+
+
+def test_find_regressions_when_within_tolerance_should_return_nothing() -> None:
+    """Test small deviations inside the tolerance are accepted."""
+    # Arrange
+    baseline = {_measurement(100.0, 1000).key: _measurement(100.0, 1000)}
+
+    # Act
+    regressions = _suite.find_regressions(
+        [_measurement(90.0, 1100)], baseline, tolerance=0.15
+    )
+
+    # Assert
+    assert regressions == []
+
+
+def test_find_regressions_when_slower_and_larger_should_report_both() -> None:
+    """Test throughput drops and memory growth beyond tolerance are reported."""
+    # Arrange
+    baseline = {_measurement(100.0, 1000).key: _measurement(100.0, 1000)}
+
+    # Act
+    regressions = _suite.find_regressions(
+        [_measurement(50.0, 2000)], baseline, tolerance=0.15
+    )
+
+    # Assert
+    assert [regression.metric for regression in regressions] == [
+        "ops_per_sec",
+        "peak_memory_bytes",
+    ]
+
+
+def test_run_suite_when_size_exceeds_pair_cap_should_skip_quadratic_targets() -> None:
+    """Test quadratic targets are skipped above the pair-count cap."""
+    # Act
+    measurements = list(
+        _suite.run_suite(
+            sizes=(10, 100),
+            distributions=("narrow-range",),
+            targets=("parser", "strategy:index", "formatter"),
+            max_pairs=100,
+            min_time=0,
+        )
+    )
+
+    # Assert
+    assert {(m.target, m.size) for m in measurements} == {
+        ("parser", 10),
+        ("strategy:index", 10),
+        ("formatter", 10),
+        ("parser", 100),
+    }
+
+
+def test_main_when_baseline_missing_should_fail_only_in_ci_mode(tmp_path: Path) -> None:
+    """Test a missing baseline skips the comparison locally but fails a CI run."""
+    # Arrange
+    arguments = [
+        "--sizes",
+        "10",
+        "--distributions",
+        "uniform",
+        "--targets",
+        "parser",
+        "--min-time",
+        "0",
+        "--baseline",
+        str(tmp_path / "baseline.json"),
+    ]
+
+    # Act
+    local = _runner.main(arguments)
+    ci = _runner.main([*arguments, "--ci"])
+    _runner.main([*arguments, "--update-baseline"])
+    compared = _runner.main([*arguments, "--ci", "--tolerance", "100"])
+
+    # Assert
+    assert local == 0
+    assert ci == _runner.NO_BASELINE_EXIT
+    assert compared == 0
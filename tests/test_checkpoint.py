@@ -0,0 +1,100 @@
+"""Tests for checkpointed pair enumeration and resuming after preemption."""
+
+from __future__ import annotations
+
+import itertools
+import random
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from email_task.features.find_pairs import checkpoint as _checkpoint
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import errors as _errors
+from email_task.shared import metrics as _metrics
+from email_task.shared import result as _result
+
+
+class _PreemptedError(Exception):
+    """Raised by the test clock to stop a run mid-enumeration."""
+
+
+def _preempting_clock(readings: int) -> Callable[[], float]:
+    """Return a clock that advances one second per reading and then fails."""
+    ticks = itertools.count()
+
+    def clock() -> float:
+        tick = next(ticks)
+        if tick == readings:
+            raise _PreemptedError
+        return float(tick)
+
+    return clock
+
+
+@pytest.mark.parametrize("readings", [2, 7, 20])
+def test_collect_sum_pairs_when_resumed_after_preemption_should_match_full_run(
+    readings: int, tmp_path: Path
+) -> None:
+    """Test a preempted run resumed from its checkpoint equals an uninterrupted one."""
+    # Arrange
+    rng = random.Random(readings)
+    array = [rng.randrange(-20, 60) for _ in range(30)]
+    path = tmp_path / "run.ckpt"
+    interrupted = _checkpoint.CheckpointingStrategy(
+        path, interval=1, clock=_preempting_clock(readings)
+    )
+    with pytest.raises(_PreemptedError):
+        interrupted.collect_sum_pairs(array)
+    sink = _metrics.RecordingMetricsSink()
+
+    # Act
+    groups = _checkpoint.CheckpointingStrategy(
+        path, resume=True, metrics=sink
+    ).collect_sum_pairs(array)
+
+    # Assert
+    assert groups == _strategies.HashGroupingStrategy().collect_sum_pairs(array)
+    assert sink.gauges["resumed_at_index"] > 0
+    assert not path.exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_collect_sum_pairs_when_checkpoint_from_other_input_should_return_error(
+    tmp_path: Path,
+) -> None:
+    """Test a checkpoint is never applied to an array it was not written for."""
+    # Arrange
+    path = tmp_path / "run.ckpt"
+    _checkpoint.write_checkpoint(
+        path,
+        _checkpoint.fingerprint([1, 2, 3, 4]),
+        4,
+        _checkpoint.Checkpoint(2, {3: [0, 1], 4: [0, 2], 5: [0, 3, 1, 2]}),
+    )
+
+    # Act
+    result = _checkpoint.CheckpointingStrategy(path, resume=True).collect_sum_pairs(
+        [1, 2, 3, 5]
+    )
+
+    # Assert
+    assert isinstance(result, _result.Error)
+    assert result.message == _errors.ErrorMessages.CHECKPOINT_ERROR
+
+
+def test_read_checkpoint_when_written_should_round_trip_state(tmp_path: Path) -> None:
+    """Test the binary table reads back exactly, including singleton sums."""
+    # Arrange
+    path = tmp_path / "run.ckpt"
+    digest = _checkpoint.fingerprint([1, 2, 3, 4])
+    saved = _checkpoint.Checkpoint(2, {3: [0, 1], 4: [0, 2], 5: [0, 3, 1, 2]})
+    _checkpoint.write_checkpoint(path, digest, 4, saved)
+
+    # Act
+    loaded = _checkpoint.read_checkpoint(path, digest, 4)
+
+    # Assert
+    assert loaded == saved
+    assert [entry.name for entry in tmp_path.iterdir()] == ["run.ckpt"]
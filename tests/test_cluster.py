@@ -0,0 +1,188 @@
+"""Tests for the TCP coordinator and its sum-residue workers."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import random
+import socket
+import subprocess
+import sys
+from collections.abc import Iterator
+
+import pytest
+
+from email_task.features.cluster import coordinator as _coordinator
+from email_task.features.cluster import protocol as _protocol
+from email_task.features.find_pairs import async_io as _async_io
+from email_task.features.find_pairs import formatter as _formatter
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import metrics as _metrics
+
+
+@pytest.fixture(scope="module")
+def workers() -> Iterator[list[_coordinator.WorkerAddress]]:
+    """Start three worker processes on localhost and yield their addresses."""
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-m", "email_task", "worker", "--port", "0"],
+            stdout=subprocess.PIPE,
+            text=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        for _ in range(3)
+    ]
+    try:
+        addresses = []
+        for process in processes:
+            assert process.stdout is not None
+            host, _, port = process.stdout.readline().split()[-1].rpartition(":")
+            addresses.append((host, int(port)))
+        yield addresses
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+
+
+def _coordinate(
+    numbers: list[int],
+    addresses: list[_coordinator.WorkerAddress],
+    metrics: _metrics.RecordingMetricsSink | None = None,
+) -> str:
+    """Run the coordinator over numbers and return the written text."""
+    output = io.StringIO()
+    coordinator = _coordinator.ClusterCoordinator(
+        reader=_async_io.AsyncTokenReader([str(number) for number in numbers]),
+        writer=_async_io.AsyncConsoleWriter(output, batch_lines=2),
+        workers=addresses,
+        metrics=metrics,
+        timeout=30,
+    )
+    asyncio.run(coordinator.execute())
+    return output.getvalue()
+
+
+def _free_port() -> int:
+    """Return a localhost port with nothing listening on it."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_execute_when_sharded_across_workers_should_match_sync_output(
+    seed: int,
+    workers: list[_coordinator.WorkerAddress],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test merging three residue shards reproduces the single-process output."""
+    # Arrange
+    rng = random.Random(seed)
+    numbers = [rng.randrange(-30, 60) for _ in range(70)]
+    groups = _strategies.IndexBasedStrategy().collect_sum_pairs(numbers)
+    _formatter.ConsoleFormatter().write_pairs_result(groups)
+    expected = capsys.readouterr().out
+    sink = _metrics.RecordingMetricsSink()
+
+    # Act
+    output = _coordinate(numbers, workers, sink)
+
+    # Assert
+    assert output == expected
+    assert sink.gauges["cluster_workers"] == 3
+    assert sink.counters["shard_result_bytes"] > 0
+
+
+def test_execute_when_worker_unreachable_should_write_error(
+    workers: list[_coordinator.WorkerAddress],
+) -> None:
+    """Test a dead worker fails the whole run instead of dropping its shard."""
+    # Arrange
+    addresses = [*workers[:2], ("127.0.0.1", _free_port())]
+
+    # Act
+    output = _coordinate([6, 4, 12, 10], addresses)
+
+    # Assert
+    assert output == "Error: Cluster worker was unreachable or failed its shard.\n"
+
+
+def test_execute_when_value_exceeds_int64_should_write_error(
+    workers: list[_coordinator.WorkerAddress],
+) -> None:
+    """Test values outside the int64 wire format are rejected before sending."""
+    # Act
+    output = _coordinate([2**63, 1, 2], workers)
+
+    # Assert
+    assert output == "Error: Values must fit in a signed 64-bit integer.\n"
+
+
+@pytest.mark.parametrize("shard_count", [1, 2, 5])
+def test_collect_residue_shard_when_all_shards_joined_should_cover_every_group(
+    shard_count: int,
+) -> None:
+    """Test the residue shards partition the groups of the full listing."""
+    # Arrange
+    rng = random.Random(shard_count)
+    numbers = [rng.randrange(-20, 40) for _ in range(40)]
+    expected = _strategies.IndexBasedStrategy().collect_sum_pairs(numbers)
+
+    # Act
+    shards = [
+        list(
+            _strategies.unpack_sum_groups(
+                numbers, _strategies.collect_residue_shard(numbers, shard, shard_count)
+            )
+        )
+        for shard in range(shard_count)
+    ]
+
+    # Assert
+    assert isinstance(expected, tuple)
+    joined = sorted(
+        (group for shard in shards for group in shard),
+        key=lambda group: group.sum_value,
+    )
+    assert tuple(joined) == expected
+
+
+def test_worker_when_request_announces_too_many_values_should_reject_before_payload(
+    workers: list[_coordinator.WorkerAddress],
+) -> None:
+    """Test an oversized header gets an error reply without sending any payload."""
+
+    # Arrange
+    async def round_trip() -> tuple[int, bytes]:
+        reader, writer = await asyncio.open_connection(*workers[0])
+        try:
+            writer.write(_protocol.REQUEST_HEADER.pack(_protocol.MAGIC, 0, 1, 1 << 60))
+            await writer.drain()
+            return await _protocol.read_response(reader)
+        finally:
+            writer.close()
+
+    # Act
+    status, reply = asyncio.run(asyncio.wait_for(round_trip(), 10))
+
+    # Assert
+    assert status == _protocol.STATUS_ERROR
+    assert reply == b"malformed or oversized request"
+
+
+def test_read_response_when_length_exceeds_limit_should_not_read_payload() -> None:
+    """Test the coordinator refuses an oversized response from its header alone."""
+
+    # Arrange
+    async def read() -> tuple[int, bytes]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(_protocol.RESPONSE_HEADER.pack(_protocol.STATUS_OK, 1 << 40))
+        return await _protocol.read_response(reader, max_bytes=1024)
+
+    # Act
+    status, _ = asyncio.run(asyncio.wait_for(read(), 10))
+
+    # Assert
+    assert status == _protocol.STATUS_ERROR
@@ -0,0 +1,74 @@
+"""Tests for cross-array pair grouping."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+import email_task
+from email_task.features.find_pairs import handler as _handler
+from email_task.features.find_pairs import parser as _parser
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import result as _result
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_find_cross_pairs_when_random_arrays_should_match_filtered_concatenation(
+    seed: int,
+) -> None:
+    """Test the join equals the concatenation workaround minus same-array pairs."""
+    # Arrange
+    rng = random.Random(seed)
+    left = [rng.randrange(-10, 20) for _ in range(rng.randrange(1, 15))]
+    right = [rng.randrange(-10, 20) for _ in range(rng.randrange(1, 15))]
+    concatenated = _strategies.IndexBasedStrategy().collect_sum_pairs(left + right)
+    assert not isinstance(concatenated, _result.Error)
+    expected = {}
+    for group in concatenated:
+        cross = [
+            pair
+            for pair in group.pairs
+            if pair.indices.left_index < len(left) <= pair.indices.right_index
+        ]
+        if len(cross) >= 2:
+            expected[group.sum_value] = cross
+
+    # Act
+    groups = email_task.find_cross_pairs(left, right)
+    counts = email_task.count_cross_pairs(left, right)
+
+    # Assert
+    assert not isinstance(groups, _result.Error)
+    assert {group.sum_value: list(group.pairs) for group in groups} == expected
+    assert [group.sum_value for group in groups] == sorted(expected)
+    assert counts == {pair_sum: len(pairs) for pair_sum, pairs in expected.items()}
+
+
+def test_execute_when_cross_files_given_should_print_groups_and_counts(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test both arrays are read from files and each mode prints its lines."""
+    # Arrange
+    (tmp_path / "a.txt").write_text("1 2 3\n")
+    (tmp_path / "b.txt").write_text("10, 11\n")
+
+    def handler(count_only: bool) -> _handler.CrossPairsHandler:
+        return _handler.CrossPairsHandler(
+            left_parser=_parser.TextFileParser(str(tmp_path / "a.txt"), minimum=1),
+            right_parser=_parser.TextFileParser(str(tmp_path / "b.txt"), minimum=1),
+            count_only=count_only,
+        )
+
+    # Act
+    handler(count_only=False).execute()
+    handler(count_only=True).execute()
+
+    # Assert
+    assert capsys.readouterr().out == (
+        "Pairs : (1, 11) (2, 10) have sum : 12\n"
+        "Pairs : (2, 11) (3, 10) have sum : 13\n"
+        "Count : 2 pairs have sum : 12\n"
+        "Count : 2 pairs have sum : 13\n"
+    )
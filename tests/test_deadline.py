@@ -0,0 +1,80 @@
+"""Tests for deadline-bounded anytime pair finding."""
+
+from __future__ import annotations
+
+import itertools
+import random
+from collections.abc import Callable
+
+import pytest
+
+import email_task
+from email_task.features.find_pairs import formatter as _formatter
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import errors as _errors
+
+
+def _ticking_clock() -> Callable[[], float]:
+    """Return a clock advancing one second per reading."""
+    ticks = itertools.count()
+    return lambda: float(next(ticks))
+
+
+@pytest.mark.parametrize("rows", range(1, 12))
+def test_collect_sum_pairs_when_deadline_hit_should_return_only_complete_groups(
+    rows: int,
+) -> None:
+    """Test partial groups equal the full groups no unvisited pair can join."""
+    # Arrange
+    rng = random.Random(rows)
+    array = [rng.randrange(0, 30) for _ in range(14)]
+    full = _strategies.IndexBasedStrategy().collect_sum_pairs(array)
+    assert isinstance(full, tuple)
+    strategy = _strategies.DeadlineBoundedStrategy(rows + 0.5, clock=_ticking_clock())
+
+    # Act
+    result = strategy.collect_sum_pairs(array)
+
+    # Assert
+    assert isinstance(result, _errors.DeadlineExceededError)
+    assert result.code == _errors.ErrorCodes.TIMEOUT_ERROR
+    assert result.last_index == rows - 1
+    remaining = {
+        array[i] + array[j]
+        for i in range(rows, len(array))
+        for j in range(i + 1, len(array))
+    }
+    assert set(result.groups) <= set(full)
+    assert all(group.sum_value not in remaining for group in result.groups)
+
+
+def test_find_pairs_when_deadline_not_reached_should_return_every_group() -> None:
+    """Test a generous deadline gives the same result as an unbounded run."""
+    # Arrange
+    array = [6, 4, 12, 10, 22, 54, 32, 42, 21, 11]
+
+    # Act
+    result = email_task.find_pairs(array, deadline=60)
+
+    # Assert
+    assert result == email_task.find_pairs(array)
+
+
+def test_write_pairs_result_when_deadline_exceeded_should_write_groups_then_error(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test partial output lists complete groups before the stopping point."""
+    # Arrange
+    array = [6, 4, 12, 10, 22, 54, 32, 42, 21, 11]
+    strategy = _strategies.DeadlineBoundedStrategy(7.5, clock=_ticking_clock())
+
+    # Act
+    _formatter.ConsoleFormatter().write_pairs_result(strategy.collect_sum_pairs(array))
+
+    # Assert
+    assert capsys.readouterr().out == (
+        "Pairs : (6, 10) (4, 12) have sum : 16\n"
+        "Pairs : (10, 54) (22, 42) have sum : 64\n"
+        "Error: Deadline reached before every pair was enumerated. "
+        "Last index processed: 6.\n"
+    )
@@ -0,0 +1,71 @@
+"""Tests for the pigeonhole existence check and its compact writer."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import email_task
+from email_task.features.find_pairs import formatter as _formatter
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import domain as _domain
+from email_task.shared import metrics as _metrics
+from email_task.shared import result as _result
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_find_witness_when_random_input_should_agree_with_full_listing(
+    seed: int,
+) -> None:
+    """Test a witness exists exactly when the listing is non-empty, and is in it."""
+    # Arrange
+    rng = random.Random(seed)
+    low = rng.choice([-40, 0])
+    array = [rng.randrange(low, 40) for _ in range(rng.randrange(2, 12))]
+    groups = _strategies.IndexBasedStrategy().collect_sum_pairs(array)
+
+    # Act
+    witness = email_task.find_sum_witness(array)
+
+    # Assert
+    assert not isinstance(groups, _result.Error)
+    if not groups:
+        assert witness is None
+        return
+    assert isinstance(witness, _domain.SumWitness)
+    group_pairs = {group.sum_value: group.pairs for group in groups}
+    assert witness.first in group_pairs[witness.sum_value]
+    assert witness.second in group_pairs[witness.sum_value]
+    assert witness.first.indices.left_index <= witness.second.indices.left_index
+
+
+def test_find_witness_when_range_is_narrow_should_scan_only_pigeonhole_prefix() -> None:
+    """Test non-negative inputs stop within the prefix forced to collide."""
+    # Arrange
+    sink = _metrics.RecordingMetricsSink()
+    array = [value * value % 17 for value in range(10_000)]
+
+    # Act
+    witness = _strategies.PigeonholeExistenceCheck(sink).find_witness(array)
+
+    # Assert
+    prefix = _strategies.pigeonhole_prefix(2 * 16 + 1)
+    assert isinstance(witness, _domain.SumWitness)
+    assert sink.gauges["pigeonhole_prefix"] == prefix
+    assert sink.counters["pairs_generated"] <= prefix * (prefix - 1) // 2
+
+
+def test_write_witness_result_should_print_one_line(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test the compact writer's yes and no answers."""
+    # Arrange
+    formatter = _formatter.CompactWitnessFormatter()
+
+    # Act
+    formatter.write_witness_result(email_task.find_sum_witness([6, 4, 12, 10]))
+    formatter.write_witness_result(None)
+
+    # Assert
+    assert capsys.readouterr().out == "Yes : (6, 10) (4, 12) have sum : 16\nNo\n"
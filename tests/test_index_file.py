@@ -0,0 +1,95 @@
+"""Tests for persisted, memory-mapped sum index files."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+import email_task
+from email_task.features.find_pairs import index_file as _index_file
+from email_task.features.find_pairs import pagination as _pagination
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import errors as _errors
+from email_task.shared import result as _result
+
+
+@pytest.fixture
+def array() -> list[int]:
+    """Return an array with many shared sums, including negative ones."""
+    rng = random.Random(49)
+    return [rng.randrange(-20, 60) for _ in range(40)]
+
+
+def test_open_sum_index_file_when_built_should_answer_lookups_and_ranges(
+    array: list[int], tmp_path: Path
+) -> None:
+    """Test every lookup and range read from the file matches a fresh run."""
+    # Arrange
+    path = tmp_path / "array.idx"
+    expected = _strategies.HashGroupingStrategy().collect_sum_pairs(array)
+    header = email_task.build_sum_index_file(array, path)
+
+    # Act
+    index = email_task.open_sum_index_file(path)
+
+    # Assert
+    assert isinstance(index, _index_file.SumIndexFile)
+    with index:
+        assert header == index.header
+        assert tuple(index.iter_sum_groups_after(None)) == expected
+        assert [index.lookup(group.sum_value) for group in expected] == list(expected)
+        assert index.lookup(-1) is None
+        assert index.lookup(10**6) is None
+        assert tuple(index.iter_range(10, 30)) == tuple(
+            group for group in expected if 10 <= group.sum_value <= 30
+        )
+        assert tuple(index.iter_range(30, 10)) == ()
+    assert [entry.name for entry in tmp_path.iterdir()] == ["array.idx"]
+
+
+def test_find_pairs_page_when_source_is_index_file_should_match_in_memory_index(
+    array: list[int], tmp_path: Path
+) -> None:
+    """Test an index file pages exactly like the in-memory sum index."""
+    # Arrange
+    path = tmp_path / "array.idx"
+    email_task.build_sum_index_file(array, path)
+    in_memory = _pagination.SumGroupIndex(array)
+    cursor = _pagination.encode_cursor(25)
+
+    # Act
+    index = email_task.open_sum_index_file(path)
+    assert isinstance(index, _index_file.SumIndexFile)
+    with index:
+        page = email_task.find_pairs_page(index, limit=3, cursor=cursor)
+
+    # Assert
+    assert page == _pagination.paginate(in_memory, 3, cursor)
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: data[:-1],
+        lambda data: b"NOTANIDX" + data[8:],
+        lambda data: data[:10],
+    ],
+)
+def test_open_sum_index_file_when_file_corrupt_should_return_error(
+    corrupt: Callable[[bytes], bytes], tmp_path: Path
+) -> None:
+    """Test truncated or foreign files are rejected before any lookup."""
+    # Arrange
+    path = tmp_path / "array.idx"
+    _index_file.write_sum_index(path, [6, 4, 12, 10, 22, 54, 32, 42, 21, 11])
+    path.write_bytes(corrupt(path.read_bytes()))
+
+    # Act
+    result = email_task.open_sum_index_file(path)
+
+    # Assert
+    assert isinstance(result, _result.Error)
+    assert result.message == _errors.ErrorMessages.INDEX_FILE_ERROR
@@ -0,0 +1,130 @@
+"""Tests for memory budgets and the bounded-memory engine."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import email_task
+from email_task.features.find_pairs import formatter as _formatter
+from email_task.features.find_pairs import planner as _planner
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import errors as _errors
+from email_task.shared import memory as _memory
+from email_task.shared import metrics as _metrics
+from email_task.shared import result as _result
+
+
+@pytest.mark.parametrize("memory_budget", [30_000, 60_000, 1 << 20])
+def test_collect_sum_pairs_when_budget_forces_windows_should_match_index_strategy(
+    memory_budget: int,
+) -> None:
+    """Test sliced counting and windowed grouping reproduce the index output."""
+    # Arrange
+    rng = random.Random(memory_budget)
+    array = [rng.randrange(-300, 600) for _ in range(40)]
+    expected = _strategies.IndexBasedStrategy().collect_sum_pairs(array)
+
+    # Act
+    result = _strategies.BoundedMemoryStrategy(
+        memory_budget=memory_budget
+    ).collect_sum_pairs(array)
+
+    # Assert
+    assert result == expected
+
+
+def test_collect_sum_pairs_when_partitioned_should_count_each_pair_once() -> None:
+    """Test residue-class passes are counted as passes, not as new pairs."""
+    # Arrange
+    rng = random.Random(33)
+    array = [rng.randrange(0, 10**6) for _ in range(60)]
+    sink = _metrics.RecordingMetricsSink()
+
+    # Act
+    result = _strategies.BoundedMemoryStrategy(
+        sink, memory_budget=200_000
+    ).collect_sum_pairs(array)
+
+    # Assert
+    assert result == _strategies.IndexBasedStrategy().collect_sum_pairs(array)
+    assert sink.gauges["sum_partitions"] > 1
+    assert sink.counters["pairs_generated"] == 60 * 59 // 2
+    assert sink.counters["pair_passes"] > sink.gauges["sum_partitions"]
+
+
+def test_plan_when_candidates_cannot_fit_should_reject_before_any_work() -> None:
+    """Test the planner refuses a budget the bounded engine would run out of."""
+    # Arrange
+    rng = random.Random(600)
+    array = [rng.randrange(0, 10**9) for _ in range(600)]
+    sink = _metrics.RecordingMetricsSink()
+
+    # Act
+    result = _planner.StrategyPlanner(sink, memory_budget=64 << 10).collect_sum_pairs(
+        array
+    )
+
+    # Assert
+    assert isinstance(result, _result.Error)
+    assert result.code == _errors.ErrorCodes.RESOURCE_ERROR
+    assert "pairs_generated" not in sink.counters
+
+
+def test_find_pairs_when_budget_too_small_should_return_resource_error() -> None:
+    """Test an impossible budget fails fast instead of running out of memory."""
+    # Act
+    result = email_task.find_pairs(list(range(50)), max_memory=256)
+
+    # Assert
+    assert isinstance(result, _result.Error)
+    assert result.code == _errors.ErrorCodes.RESOURCE_ERROR
+
+
+def test_iter_find_pairs_when_budget_set_should_stream_from_bounded_engine() -> None:
+    """Test over-budget inputs still produce every group through the API."""
+    # Arrange
+    array = list(range(40))
+    expected = _strategies.IndexBasedStrategy().collect_sum_pairs(array)
+
+    # Act
+    result = email_task.iter_find_pairs(array, max_memory=64_000)
+
+    # Assert
+    assert not isinstance(result, _result.Error)
+    assert tuple(result) == expected
+
+
+def test_write_sum_groups_when_streamed_should_match_collected_output(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test the streaming writer prints exactly what the collecting one does."""
+    # Arrange
+    console = _formatter.ConsoleFormatter()
+    groups = _strategies.IndexBasedStrategy().collect_sum_pairs([1, 5, 2, 4, 3])
+    console.write_pairs_result(groups)
+    collected = capsys.readouterr().out
+
+    # Act
+    console.write_sum_groups(iter(groups))
+    console.write_sum_groups(iter(()))
+
+    # Assert
+    assert capsys.readouterr().out == collected + "No pairs with the same sum found.\n"
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [("1024", 1024), ("64K", 64 << 10), ("512m", 512 << 20), ("2GiB", 2 << 30)],
+)
+def test_parse_size_when_valid_should_return_bytes(text: str, expected: int) -> None:
+    """Test sizes with binary unit suffixes convert to bytes."""
+    # Act & Assert
+    assert _memory.parse_size(text) == expected
+
+
+def test_parse_size_when_invalid_should_return_none() -> None:
+    """Test malformed sizes are rejected."""
+    # Act & Assert
+    assert _memory.parse_size("12X") is None
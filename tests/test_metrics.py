@@ -0,0 +1,80 @@
+"""Tests for stage timing and counter instrumentation."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from email_task.features.find_pairs import handler as _handler
+from email_task.features.find_pairs import parser as _parser
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import domain as _domain
+from email_task.shared import metrics as _metrics
+from email_task.shared import result as _result
+
+
+class DiscardingWriter:
+    """Output writer ignoring every result."""
+
+    def write_pairs_result(
+        self, result: _result.Result[Sequence[_domain.SumGroup]]
+    ) -> None:
+        pass
+
+
+def test_execute_when_sink_attached_should_record_stages_and_counters() -> None:
+    """Test FindPairsHandler and strategy report every stage and counter."""
+    # Arrange
+    sink = _metrics.RecordingMetricsSink()
+    handler = _handler.FindPairsHandler(
+        parser=_parser.CommandLineParser(["prog", "1", "3", "2", "4"]),
+        strategy=_strategies.IndexBasedStrategy(metrics=sink),
+        writer=DiscardingWriter(),
+        metrics=sink,
+    )
+
+    # Act
+    handler.execute()
+
+    # Assert
+    assert set(sink.stages) == {
+        "parse",
+        "generate_pairs",
+        "group_by_sum",
+        "filter_valid_groups",
+        "find_pairs",
+        "write",
+    }
+    assert sink.counters == {
+        "input_size": 4,
+        "pairs_generated": 6,
+        "distinct_sums": 5,
+        "groups_emitted": 1,
+    }
+
+
+def test_execute_when_parse_fails_should_skip_strategy_stages() -> None:
+    """Test failed parsing records parse and write but no strategy stages."""
+    # Arrange
+    sink = _metrics.RecordingMetricsSink()
+    handler = _handler.FindPairsHandler(
+        parser=_parser.CommandLineParser(["prog", "x"]),
+        strategy=_strategies.IndexBasedStrategy(metrics=sink),
+        writer=DiscardingWriter(),
+        metrics=sink,
+    )
+
+    # Act
+    handler.execute()
+
+    # Assert
+    assert set(sink.stages) == {"parse", "write"}
+    assert sink.counters == {}
+
+
+def test_timed_call_when_no_sink_should_return_operation_result() -> None:
+    """Test timed_call degrades to a plain call without a sink."""
+    # Act
+    result = _metrics.timed_call(None, "stage", len, (1, 2, 3))
+
+    # Assert
+    assert result == 3
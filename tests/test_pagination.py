@@ -0,0 +1,70 @@
+"""Tests for cursor-based pages over a precomputed sum index."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import email_task
+from email_task.features.find_pairs import pagination as _pagination
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import errors as _errors
+from email_task.shared import result as _result
+
+
+@pytest.mark.parametrize("limit", [1, 3, 1000])
+def test_find_pairs_page_when_following_cursors_should_cover_every_group_once(
+    limit: int,
+) -> None:
+    """Test concatenated pages equal the full listing, in order."""
+    # Arrange
+    rng = random.Random(limit)
+    array = [rng.randrange(-20, 40) for _ in range(40)]
+    expected = _strategies.IndexBasedStrategy().collect_sum_pairs(array)
+    index = email_task.build_sum_index(array)
+    assert isinstance(index, _pagination.SumGroupIndex)
+
+    # Act
+    groups: list[object] = []
+    cursor = None
+    while True:
+        page = email_task.find_pairs_page(index, limit=limit, cursor=cursor)
+        assert isinstance(page, _pagination.SumGroupPage)
+        assert len(page.groups) <= limit
+        groups.extend(page.groups)
+        if (cursor := page.next_cursor) is None:
+            break
+
+    # Assert
+    assert tuple(groups) == expected
+
+
+def test_find_pairs_page_when_cursor_encodes_sum_should_start_after_it() -> None:
+    """Test a cursor for a sum resumes at the first larger sum."""
+    # Arrange
+    index = _pagination.SumGroupIndex([6, 4, 12, 10, 22, 54, 32, 42, 21, 11])
+
+    # Act
+    page = _pagination.paginate(index, 2, _pagination.encode_cursor(33))
+
+    # Assert
+    assert isinstance(page, _pagination.SumGroupPage)
+    assert [group.sum_value for group in page.groups] == [43, 53]
+    assert page.next_cursor is not None
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "c3VtOng=", "b3RoZXI6MQ=="])
+def test_find_pairs_page_when_cursor_malformed_should_return_error(
+    cursor: str,
+) -> None:
+    """Test cursors that are not base64, not numeric or not ours are rejected."""
+    # Arrange
+    index = _pagination.SumGroupIndex([1, 2, 3, 4])
+
+    # Act
+    page = email_task.find_pairs_page(index, limit=5, cursor=cursor)
+
+    # Assert
+    assert isinstance(page, _result.Error)
+    assert page.message == _errors.ErrorMessages.INVALID_CURSOR_ERROR
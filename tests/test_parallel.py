@@ -0,0 +1,123 @@
+"""Tests for the partitioned parallel hash strategy."""
+
+from __future__ import annotations
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import pytest
+
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import concurrency as _concurrency
+from email_task.shared import metrics as _metrics
+from email_task.shared import shared_array as _shared_array
+
+
+@pytest.mark.parametrize("executor", ["threads", "processes", "serial"])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_collect_sum_pairs_when_partitioned_should_match_index_strategy(
+    executor: _strategies.ExecutorKind, workers: int
+) -> None:
+    """Test every executor and shard count reproduces the index output exactly."""
+    # Arrange
+    rng = random.Random(workers)
+    array = [rng.randrange(-15, 25) for _ in range(50)]
+    expected = _strategies.IndexBasedStrategy().collect_sum_pairs(array)
+    strategy = _strategies.ParallelHashStrategy(workers=workers, executor=executor)
+
+    # Act
+    result = strategy.collect_sum_pairs(array)
+
+    # Assert
+    assert result == expected
+
+
+@pytest.mark.parametrize("array", [[], [4], [1, 2, 3]])
+def test_collect_sum_pairs_when_too_few_pairs_should_return_empty(
+    array: list[int],
+) -> None:
+    """Test inputs without partitions or repeated sums yield no groups."""
+    # Act
+    result = _strategies.ParallelHashStrategy(
+        workers=2, executor="threads"
+    ).collect_sum_pairs(array)
+
+    # Assert
+    assert result == ()
+
+
+def test_collect_sum_pairs_when_auto_should_use_threads_only_without_gil() -> None:
+    """Test auto mode only spreads work across threads on free-threaded builds."""
+    # Arrange
+    sink = _metrics.RecordingMetricsSink()
+    strategy = _strategies.ParallelHashStrategy(sink, workers=4)
+
+    # Act
+    strategy.collect_sum_pairs([1, 2, 3, 4])
+
+    # Assert
+    expected_workers = 1 if _concurrency.gil_enabled() else 4
+    assert sink.gauges["parallel_workers"] == expected_workers
+
+
+def _crash_after_attach(name: str, length: int) -> None:
+    """Attach to the shared block like a worker, then die without cleanup."""
+    _shared_array.attach(name, length)
+    os._exit(1)
+
+
+def test_shared_int64_array_when_worker_crashes_should_still_unlink_block() -> None:
+    """Test the owner removes the segment even if an attached worker dies."""
+    # Arrange
+    with _shared_array.SharedInt64Array([5, -7, 2**40]) as shared:
+        name = shared.name
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            crashed = executor.submit(_crash_after_attach, name, len(shared))
+
+            # Act
+            with pytest.raises(BrokenProcessPool):
+                crashed.result()
+
+        _, view = _shared_array.attach(name, len(shared))
+        attached = view.tolist()
+        view.release()
+
+    # Assert
+    assert attached == [5, -7, 2**40]
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name, track=False)
+
+
+def test_collect_sum_pairs_when_values_exceed_int64_should_run_serially() -> None:
+    """Test inputs the shared int64 block cannot hold fall back to one process."""
+    # Arrange
+    sink = _metrics.RecordingMetricsSink()
+    array = [2**63, 5, 5, 2**63]
+    strategy = _strategies.ParallelHashStrategy(sink, workers=2, executor="processes")
+
+    # Act
+    result = strategy.collect_sum_pairs(array)
+
+    # Assert
+    assert result == _strategies.IndexBasedStrategy().collect_sum_pairs(array)
+    assert sink.gauges["parallel_workers"] == 1
+
+
+def test_collect_sum_pairs_when_processes_should_return_only_grouped_pairs() -> None:
+    """Test workers send back packed groups, not every enumerated pair."""
+    # Arrange
+    sink = _metrics.RecordingMetricsSink()
+    array = [2**k for k in range(40)] + [3, 5, 6]
+    strategy = _strategies.ParallelHashStrategy(sink, workers=2, executor="processes")
+
+    # Act
+    result = strategy.collect_sum_pairs(array)
+
+    # Assert
+    assert result == _strategies.IndexBasedStrategy().collect_sum_pairs(array)
+    assert sink.counters["packed_result_bytes"] == 8 * sum(
+        2 + 2 * len(group.pairs) for group in result
+    )
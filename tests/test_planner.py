@@ -0,0 +1,163 @@
+"""Tests for the cost-based strategy planner and hash grouping engine."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from email_task.features.find_pairs import planner as _planner
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import errors as _errors
+from email_task.shared import metrics as _metrics
+from email_task.shared import result as _result
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_collect_sum_pairs_when_random_input_should_match_index_strategy(
+    seed: int,
+) -> None:
+    """Test planner, hash and dense engines produce the index-based output exactly."""
+    # Arrange
+    rng = random.Random(seed)
+    array = [rng.randrange(-15, 25) for _ in range(rng.randrange(0, 40))]
+    expected = _strategies.IndexBasedStrategy().collect_sum_pairs(array)
+
+    # Act
+    hashed = _strategies.HashGroupingStrategy().collect_sum_pairs(array)
+    dense = _strategies.DenseBucketStrategy().collect_sum_pairs(array)
+    planned = _planner.StrategyPlanner().collect_sum_pairs(array)
+
+    # Assert
+    assert not isinstance(expected, _result.Error)
+    assert hashed == expected
+    assert dense == expected
+    assert planned == expected
+
+
+def test_profile_input_when_mixed_values_should_report_range_and_sign() -> None:
+    """Test the O(n) profile scan."""
+    # Act
+    profile = _planner.profile_input([3, -2, 3, 7])
+
+    # Assert
+    assert profile == _planner.InputProfile(
+        size=4, distinct_count=3, min_value=-2, max_value=7, max_multiplicity=2
+    )
+    assert profile.pair_count == 6
+    assert profile.sum_range == 19
+    assert profile.has_negative
+
+
+@pytest.mark.parametrize(
+    ("max_value", "low", "high"), [(10**9, 0, 200), (1_000, 175_000, 179_700)]
+)
+def test_estimated_grouped_pairs_when_range_varies_should_track_actual_groups(
+    max_value: int, low: int, high: int
+) -> None:
+    """Test the grouped pair estimate follows the actual output and caps at pairs."""
+    # Arrange
+    rng = random.Random(3)
+    array = [rng.randrange(max_value + 1) for _ in range(600)]
+    groups = _strategies.HashGroupingStrategy().collect_sum_pairs(array)
+
+    # Act
+    profile = _planner.profile_input(array)
+
+    # Assert
+    assert not isinstance(groups, _result.Error)
+    assert low <= sum(len(group.pairs) for group in groups) <= high
+    assert low <= profile.estimated_grouped_pairs <= high
+    assert profile.estimated_grouped_pairs <= profile.pair_count
+
+
+def test_plan_when_budget_excludes_engines_should_fall_back_to_bounded() -> None:
+    """Test engines over the memory budget give way to the bounded engine."""
+    # Arrange
+    array = list(range(100))
+    candidates = _planner.StrategyPlanner().plan(array).candidates
+    smallest = min(estimate.memory_bytes for estimate in candidates)
+
+    # Act
+    fitting = _planner.StrategyPlanner(memory_budget=smallest).plan(array)
+    exceeded = _planner.StrategyPlanner(memory_budget=smallest - 1).plan(array)
+
+    # Assert
+    assert fitting.chosen.memory_bytes <= smallest
+    assert exceeded.engine == "bounded"
+    assert exceeded.chosen.options == {"memory_budget": smallest - 1}
+
+
+def test_plan_when_budget_fits_no_engine_should_return_error() -> None:
+    """Test a budget too small for any engine fails before processing."""
+    # Act
+    result = _planner.StrategyPlanner(memory_budget=64).plan(list(range(100)))
+
+    # Assert
+    assert isinstance(result, _errors.ApplicationError)
+    assert result.message == _errors.ErrorMessages.MEMORY_BUDGET_EXCEEDED_ERROR
+
+
+def test_collect_sum_pairs_when_on_plan_given_should_report_plan() -> None:
+    """Test the planner hands every plan to the explain callback."""
+    # Arrange
+    plans: list[_planner.ExecutionPlan] = []
+    planner = _planner.StrategyPlanner(on_plan=plans.append)
+
+    # Act
+    planner.collect_sum_pairs([1, 3, 2, 4])
+
+    # Assert
+    assert [plan.profile.size for plan in plans] == [4]
+    assert plans[0].describe().startswith(f"Plan : engine={plans[0].engine}")
+
+
+def test_plan_when_narrow_range_should_pick_dense_buckets() -> None:
+    """Test sensor-style inputs in a small range use the dense bucket engine."""
+    # Arrange
+    rng = random.Random(0)
+    array = [rng.randrange(0, 1001) for _ in range(500)]
+
+    # Act
+    plan = _planner.StrategyPlanner().plan(array)
+
+    # Assert
+    assert plan.engine == "dense"
+
+
+def test_plan_when_wide_range_should_not_offer_dense_buckets() -> None:
+    """Test sparse sum ranges rule out the dense bucket engine."""
+    # Act
+    plan = _planner.StrategyPlanner().plan([0, 10**9, 5, 7])
+
+    # Assert
+    assert "dense" not in {estimate.engine for estimate in plan.candidates}
+
+
+def test_collect_sum_pairs_when_dense_range_too_wide_should_fall_back_to_hash() -> None:
+    """Test an explicit dense run never allocates buckets for a huge sum range."""
+    # Arrange
+    array = [0, 10**14, 5, 10**14 - 5]
+    sink = _metrics.RecordingMetricsSink()
+
+    # Act
+    result = _strategies.DenseBucketStrategy(sink).collect_sum_pairs(array)
+
+    # Assert
+    assert result == _strategies.HashGroupingStrategy().collect_sum_pairs(array)
+    assert sink.counters["dense_fallbacks"] == 1
+
+
+def test_plan_when_engines_limited_should_only_consider_in_process_engines() -> None:
+    """Test a planner inside a worker never plans threads or nested processes."""
+    # Arrange
+    planner = _planner.StrategyPlanner(engines=_planner.IN_PROCESS_ENGINES)
+
+    # Act
+    plan = planner.plan(list(range(5000)))
+
+    # Assert
+    assert not isinstance(plan, _result.Error)
+    assert {estimate.engine for estimate in plan.candidates} <= set(
+        _planner.IN_PROCESS_ENGINES
+    )
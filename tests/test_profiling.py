@@ -0,0 +1,65 @@
+"""Tests for the profiling context manager around a handler run."""
+
+from __future__ import annotations
+
+import pstats
+from pathlib import Path
+
+import pytest
+
+import email_task
+from email_task.features.find_pairs import parser as _parser
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import profiling as _profiling
+
+
+def _profile_run(kind: _profiling.ProfileKind, prefix: Path) -> email_task.Profiler:
+    """Profile one index-strategy handler run over ten numbers."""
+    numbers = ["6", "4", "12", "10", "22", "54", "32", "42", "21", "11"]
+    handler = email_task.FindPairsHandler(
+        parser=_parser.CommandLineParser(["email-task", *numbers]),
+        strategy=_strategies.IndexBasedStrategy(),
+    )
+    with email_task.Profiler(kind, prefix) as profiler:
+        profiler.tag(strategy="index")
+        handler.execute()
+        profiler.tag(input_size=len(numbers))
+    return profiler
+
+
+def test_profiler_when_cprofile_should_write_pstats_and_collapsed_stacks(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test the CPU reports load with pstats and attribute pair generation."""
+    # Act
+    profiler = _profile_run("cprofile", tmp_path / "run")
+
+    # Assert
+    assert [path.name for path in profiler.written] == [
+        "run.pstats",
+        "run.collapsed",
+        "run.txt",
+    ]
+    loaded = pstats.Stats(str(tmp_path / "run.pstats")).get_stats_profile()
+    assert "_generate_all_pairs" in loaded.func_profiles
+    collapsed = (tmp_path / "run.collapsed").read_text().splitlines()
+    assert any("(_generate_all_pairs);" in line for line in collapsed)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed)
+    summary = (tmp_path / "run.txt").read_text()
+    assert summary.startswith("# profile=cprofile strategy=index input_size=10\n")
+    assert "Pairs :" in capsys.readouterr().out
+
+
+def test_profiler_when_tracemalloc_should_report_allocation_sites(
+    tmp_path: Path,
+) -> None:
+    """Test the allocation reports are tagged and weighted by bytes."""
+    # Act
+    _profile_run("tracemalloc", tmp_path / "run")
+
+    # Assert
+    summary = (tmp_path / "run.txt").read_text().splitlines()
+    assert summary[0] == "# profile=tracemalloc strategy=index input_size=10"
+    assert summary[1].split()[1] == "B"
+    collapsed = (tmp_path / "run.collapsed").read_text().splitlines()
+    assert any("strategies.py" in line for line in collapsed)
@@ -0,0 +1,93 @@
+"""Tests for throttled progress reports during pair enumeration."""
+
+from __future__ import annotations
+
+import io
+import itertools
+import json
+
+import pytest
+
+from email_task.core import registry as _registry
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import metrics as _metrics
+from email_task.shared import progress as _progress
+
+
+@pytest.mark.parametrize(
+    "strategy_type",
+    [_strategies.HashGroupingStrategy, _strategies.DenseBucketStrategy],
+)
+def test_record_progress_when_json_style_should_write_events_ending_at_total(
+    strategy_type: type[_strategies.HashGroupingStrategy],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test each row is reported as a JSON event and stdout stays untouched."""
+    # Arrange
+    stream = io.StringIO()
+    ticks = itertools.count()
+    reporter = _progress.ProgressReporter(
+        "json", stream=stream, interval=0, clock=lambda: float(next(ticks))
+    )
+
+    # Act
+    strategy_type(reporter).collect_sum_pairs([6, 4, 12, 10, 22])
+
+    # Assert
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [event["pairs_done"] for event in events] == [4, 7, 9, 10]
+    assert {event["pairs_total"] for event in events} == {10}
+    assert events[-1]["eta_seconds"] == 0
+    assert events[-1]["pairs_per_second"] == round(10 / 3)
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("name", _registry.STRATEGIES.names())
+def test_record_progress_when_any_engine_should_report_until_total(
+    name: str,
+) -> None:
+    """Test every selectable engine reports progress up to all of its pairs."""
+    # Arrange
+    stream = io.StringIO()
+    reporter = _progress.ProgressReporter("json", stream=stream, interval=0)
+    strategy = _registry.STRATEGIES.create(name, metrics=reporter)
+
+    # Act
+    strategy.collect_sum_pairs([6, 4, 12, 10, 22, 54, 32, 42, 21, 11])
+
+    # Assert
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert events
+    assert events[-1]["pairs_done"] == events[-1]["pairs_total"] == 45
+
+
+def test_record_progress_when_within_interval_should_only_write_final_line() -> None:
+    """Test updates inside the interval are dropped but completion is not."""
+    # Arrange
+    stream = io.StringIO()
+    reporter = _progress.ProgressReporter("line", stream=stream, clock=lambda: 5.0)
+
+    # Act
+    for pairs_done in (10, 20, 30, 40):
+        reporter.record_progress(pairs_done, 40)
+
+    # Assert
+    output = stream.getvalue()
+    assert output.count("\r") == 2
+    assert output.startswith("\r10/40 pairs (25.0%) 0 pairs/s")
+    assert "\r40/40 pairs (100.0%)" in output
+    assert output.endswith("\n")
+
+
+def test_progress_reporter_when_inner_sink_given_should_forward_metrics() -> None:
+    """Test stage timings and counters still reach the --stats sink."""
+    # Arrange
+    inner = _metrics.RecordingMetricsSink()
+    reporter = _progress.ProgressReporter("json", inner=inner, stream=io.StringIO())
+
+    # Act
+    _strategies.HashGroupingStrategy(reporter).collect_sum_pairs([1, 2, 3, 4])
+
+    # Assert
+    assert inner.counters["pairs_generated"] == 6
+    assert "group_by_sum" in inner.stages
@@ -0,0 +1,109 @@
+"""Tests for approximate heavy-sum detection."""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+
+import pytest
+
+from email_task.core import registry as _registry
+from email_task.features.find_pairs import formatter as _formatter
+from email_task.features.find_pairs import handler as _handler
+from email_task.features.find_pairs import parser as _parser
+from email_task.features.find_pairs import sketch as _sketch
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import domain as _domain
+from email_task.shared import metrics as _metrics
+
+
+def _pair_counts(array: list[int]) -> Counter[int]:
+    """Count the pairs of array per sum by brute force."""
+    return Counter(
+        array[i] + array[j] for i in range(len(array)) for j in range(i + 1, len(array))
+    )
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_collect_sum_pairs_when_min_pairs_above_error_should_match_exact_groups(
+    seed: int,
+) -> None:
+    """Test verification returns exactly the exact groups with >= K pairs."""
+    # Arrange
+    rng = random.Random(seed)
+    array = [rng.randrange(0, 10) for _ in range(60)]
+    expected = tuple(
+        group
+        for group in _strategies.IndexBasedStrategy().collect_sum_pairs(array)
+        if len(group.pairs) >= 110
+    )
+    strategy = _sketch.HeavySumStrategy(min_pairs=110, width=16, depth=3, capacity=16)
+
+    # Act
+    groups = strategy.collect_sum_pairs(array)
+
+    # Assert
+    assert expected
+    assert groups == expected
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_estimate_heavy_sums_when_sketch_small_should_bound_true_counts(
+    seed: int,
+) -> None:
+    """Test every estimate brackets the true pair count of its sum."""
+    # Arrange
+    rng = random.Random(seed)
+    array = [rng.randrange(-5, 25) for _ in range(50)]
+    counts = _pair_counts(array)
+    sink = _metrics.RecordingMetricsSink()
+    strategy = _sketch.HeavySumStrategy(
+        sink, min_pairs=20, width=8, depth=2, capacity=8
+    )
+
+    # Act
+    estimates = strategy.estimate_heavy_sums(array)
+
+    # Assert
+    assert isinstance(estimates, tuple)
+    assert estimates
+    for estimate in estimates:
+        assert isinstance(estimate, _domain.HeavySumEstimate)
+        true_count = counts[estimate.sum_value]
+        assert estimate.lower_bound <= true_count <= estimate.upper_bound
+        assert true_count <= estimate.estimate
+    assert sink.counters["pairs_generated"] == 50 * 49 // 2
+
+
+def test_execute_when_estimating_should_write_bounds_per_sum(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test the estimate handler prints one bounded line per heavy sum."""
+    # Arrange
+    handler = _handler.HeavySumEstimateHandler(
+        parser=_parser.CommandLineParser(["email-task", "1", "2", "3", "4", "5"]),
+        writer=_formatter.ConsoleFormatter(),
+    )
+
+    # Act
+    handler.execute()
+
+    # Assert
+    assert capsys.readouterr().out == (
+        "Sum : 5 : ~2 pairs (between 2 and 2)\n"
+        "Sum : 6 : ~2 pairs (between 2 and 2)\n"
+        "Sum : 7 : ~2 pairs (between 2 and 2)\n"
+    )
+
+
+def test_registry_when_heavy_selected_should_keep_exact_output() -> None:
+    """Test the registered heavy strategy with K = 2 lists every group."""
+    # Arrange
+    array = [6, 4, 12, 10, 22, 54, 32, 42, 21, 11]
+    strategy = _registry.STRATEGIES.create("heavy", metrics=None)
+
+    # Act
+    groups = strategy.collect_sum_pairs(array)
+
+    # Assert
+    assert groups == _strategies.IndexBasedStrategy().collect_sum_pairs(array)
@@ -0,0 +1,91 @@
+"""Tests for sliding-window equal-sum detection over a stream."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import random
+from collections import defaultdict
+
+import pytest
+
+from email_task.features.find_pairs import async_handler as _async_handler
+from email_task.features.find_pairs import async_io as _async_io
+from email_task.features.find_pairs import strategies as _strategies
+
+
+def _expected_events(
+    values: list[int], window: int
+) -> list[tuple[int, int, list[tuple[int, int]]]]:
+    """Recompute each arrival's groups from scratch over the live pairs."""
+    events = []
+    for j in range(len(values)):
+        live: defaultdict[int, list[tuple[int, int]]] = defaultdict(list)
+        for b in range(max(0, j - window), j + 1):
+            for a in range(max(0, j - window), b):
+                live[values[a] + values[b]].append((a, b))
+        new_sums = sorted({values[i] + values[j] for i in range(max(0, j - window), j)})
+        events.extend(
+            (j, pair_sum, sorted(live[pair_sum]))
+            for pair_sum in new_sums
+            if pair_sum >= 0 and len(live[pair_sum]) >= 2
+        )
+    return events
+
+
+@pytest.mark.parametrize("window", [1, 2, 5, 40])
+def test_push_when_streamed_should_match_recomputed_window_groups(
+    window: int,
+) -> None:
+    """Test events equal a brute-force recomputation after every arrival."""
+    # Arrange
+    rng = random.Random(window)
+    values = [rng.randrange(-5, 15) for _ in range(60)]
+    index = _strategies.SlidingWindowIndex(window)
+
+    # Act
+    events = [event for value in values for event in index.push(value)]
+
+    # Assert
+    assert [
+        (
+            event.position,
+            event.group.sum_value,
+            [
+                (pair.indices.left_index, pair.indices.right_index)
+                for pair in event.group.pairs
+            ],
+        )
+        for event in events
+    ] == _expected_events(values, window)
+
+
+def test_execute_when_stream_still_open_should_write_events_before_eof() -> None:
+    """Test groups are reported as soon as they form, not at end of input."""
+
+    # Arrange
+    async def scenario() -> str:
+        stream = asyncio.StreamReader()
+        output = io.StringIO()
+        handler = _async_handler.AsyncSlidingWindowHandler(
+            reader=_async_io.AsyncTextReader(stream),
+            writer=_async_io.AsyncConsoleWriter(output),
+            window=3,
+        )
+        running = asyncio.create_task(handler.execute())
+
+        # Act
+        stream.feed_data(b"6 4 12 10\n")
+        for _ in range(50):
+            if output.getvalue():
+                break
+            await asyncio.sleep(0.01)
+        before_eof = output.getvalue()
+        stream.feed_eof()
+        await running
+        return before_eof
+
+    before_eof = asyncio.run(scenario())
+
+    # Assert
+    assert before_eof == "Index 3 : Pairs : (6, 10) (4, 12) have sum : 16\n"
@@ -0,0 +1,46 @@
+"""Tests guarding CLI startup cost."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+IMPORT_BUDGET_US = 50_000
+"""Cumulative import time allowed for the CLI entry modules, in microseconds."""
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Run statement under -X importtime and map module name to cumulative us."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        match line.removeprefix("import time:").split("|"):
+            case [_, cumulative, name] if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_cli_when_measured_should_stay_under_startup_budget() -> None:
+    """Test importing the package and CLI stays within the import-time budget."""
+    # Act
+    times = _import_times("import email_task.cli")
+
+    # Assert
+    assert times["email_task"] + times["email_task.cli"] < IMPORT_BUDGET_US
+
+
+def test_import_cli_when_no_command_run_should_not_load_components() -> None:
+    """Test strategies, readers, writers and pools are resolved only on use."""
+    # Act
+    times = _import_times("import email_task.cli")
+
+    # Assert
+    assert not [name for name in times if name.startswith("email_task.features")]
+    assert "concurrent.futures" not in times
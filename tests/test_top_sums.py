@@ -0,0 +1,52 @@
+"""Tests for selecting the most populous equal-sum groups."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import metrics as _metrics
+
+
+@pytest.mark.parametrize("k", [1, 5, 1000])
+def test_collect_sum_pairs_when_top_k_should_match_largest_full_groups(
+    k: int,
+) -> None:
+    """Test the k groups equal the largest groups of a full run, by size."""
+    # Arrange
+    rng = random.Random(k)
+    array = [rng.randrange(-15, 40) for _ in range(60)]
+    full = _strategies.HashGroupingStrategy().collect_sum_pairs(array)
+    assert isinstance(full, tuple)
+    expected = sorted(full, key=lambda group: (-len(group.pairs), group.sum_value))
+
+    # Act
+    groups = _strategies.TopSumsStrategy(k).collect_sum_pairs(array)
+
+    # Assert
+    assert list(groups) == expected[:k]
+
+
+def test_collect_sum_pairs_when_counts_tie_should_prefer_smaller_sum() -> None:
+    """Test equal-size groups are ranked by sum and only k are materialized."""
+    # Arrange
+    sink = _metrics.RecordingMetricsSink()
+
+    # Act
+    groups = _strategies.TopSumsStrategy(2, sink).collect_sum_pairs([1, 2, 3, 4, 5, 6])
+
+    # Assert
+    assert [group.sum_value for group in groups] == [7, 5]
+    assert sink.counters["distinct_sums"] == 9
+    assert sink.counters["groups_emitted"] == 2
+
+
+def test_collect_sum_pairs_when_no_sum_shared_should_return_no_groups() -> None:
+    """Test sums with a single pair never qualify for the top."""
+    # Act
+    groups = _strategies.TopSumsStrategy(3).collect_sum_pairs([1, 2, 4, 8])
+
+    # Assert
+    assert groups == ()
@@ -0,0 +1,97 @@
+"""Tests for equal-sum k-tuple groups."""
+
+from __future__ import annotations
+
+import random
+from collections import defaultdict
+from itertools import combinations
+
+import pytest
+
+import email_task
+from email_task.features.find_pairs import formatter as _formatter
+from email_task.features.find_pairs import strategies as _strategies
+from email_task.shared import errors as _errors
+from email_task.shared import result as _result
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_write_tuple_groups_when_size_two_should_match_pair_output(
+    seed: int, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test k = 2 prints byte-identical lines to the pair pipeline."""
+    # Arrange
+    rng = random.Random(seed)
+    array = [rng.randrange(-10, 30) for _ in range(rng.randrange(2, 30))]
+    formatter = _formatter.ConsoleFormatter()
+    formatter.write_pairs_result(
+        _strategies.IndexBasedStrategy().collect_sum_pairs(array)
+    )
+    expected = capsys.readouterr().out
+
+    # Act
+    formatter.write_tuple_groups(
+        2, _strategies.TupleFindingStrategy(2).iter_sum_tuples(array)
+    )
+
+    # Assert
+    assert capsys.readouterr().out == expected
+
+
+@pytest.mark.parametrize("size", [3, 4, 5])
+def test_find_sum_tuples_when_random_input_should_match_brute_force(
+    size: int,
+) -> None:
+    """Test the merged halves yield every tuple group, in sum and index order."""
+    # Arrange
+    rng = random.Random(size)
+    array = [rng.randrange(-8, 20) for _ in range(14)]
+    grouped: defaultdict[int, list[tuple[int, ...]]] = defaultdict(list)
+    for indices in combinations(range(len(array)), size):
+        grouped[sum(array[index] for index in indices)].append(indices)
+    expected = [
+        (pair_sum, grouped[pair_sum])
+        for pair_sum in sorted(grouped)
+        if pair_sum >= 0 and len(grouped[pair_sum]) >= 2
+    ]
+
+    # Act
+    groups = email_task.find_sum_tuples(array, size)
+
+    # Assert
+    assert not isinstance(groups, _result.Error)
+    assert [
+        (group.sum_value, [item.indices for item in group.tuples]) for group in groups
+    ] == expected
+
+
+def test_write_tuple_groups_when_triples_should_name_them(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test triples are labelled and an empty result names the tuple size."""
+    # Act
+    formatter = _formatter.ConsoleFormatter()
+    formatter.write_tuple_groups(
+        3, _strategies.TupleFindingStrategy(3).iter_sum_tuples([1, 2, 3, 4, 5])
+    )
+    formatter.write_tuple_groups(
+        4, _strategies.TupleFindingStrategy(4).iter_sum_tuples([1, 2, 4, 8])
+    )
+
+    # Assert
+    assert capsys.readouterr().out == (
+        "Triples : (1, 2, 5) (1, 3, 4) have sum : 8\n"
+        "Triples : (1, 3, 5) (2, 3, 4) have sum : 9\n"
+        "Triples : (1, 4, 5) (2, 3, 5) have sum : 10\n"
+        "No quadruples with the same sum found.\n"
+    )
+
+
+def test_find_sum_tuples_when_size_below_two_should_return_error() -> None:
+    """Test tuple sizes that cannot form groups are rejected."""
+    # Act
+    result = email_task.find_sum_tuples([1, 2, 3], 1)
+
+    # Assert
+    assert isinstance(result, _result.Error)
+    assert result.message == _errors.ErrorMessages.INVALID_TUPLE_SIZE_ERROR